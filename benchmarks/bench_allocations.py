@@ -0,0 +1,147 @@
+"""Benchmark the allocations and latency per record of the str and bytes-native record paths.
+
+The str path formats the record to a str, appends the terminator, and encodes the result.
+The bytes-native path (CachedTimeFormatter.format_bytes) encodes the fields and adds the
+header and terminator with a single bytes template. The transient allocation per record is
+the tracemalloc peak above the memory in use before the record was handled.
+"""
+# standard library
+import argparse
+import json
+import logging
+import socket
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+# first-party
+from falcon_provider_logger.formatters import FAST_FORMAT, CachedTimeFormatter, StructuredFormatter
+from falcon_provider_logger.utils import (
+    DEFAULT_FORMAT,
+    mmap_handler,
+    rotating_handler,
+    syslog_handler,
+)
+
+
+def bench_handler(handler: logging.Handler, records: int, message: str) -> dict:
+    """Return the transient bytes allocated and the usec per record for the handler.
+
+    Args:
+        handler: The logging handler.
+        records: The number of records to handle.
+        message: The record message.
+    """
+    record = logging.LogRecord(
+        'bench', logging.INFO, __file__, 10, message + ' %s', ('abc',), None, 'bench'
+    )
+    # warm up the caches (e.g., asctime and the encoded level names)
+    for _ in range(100):
+        handler.handle(record)
+
+    start = time.perf_counter()
+    for _ in range(records):
+        handler.handle(record)
+    elapsed = time.perf_counter() - start
+
+    peak_total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(min(records, 10_000)):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            handler.handle(record)
+            peak_total += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+    return {
+        'bytes_per_record': peak_total / min(records, 10_000),
+        'usec_per_record': elapsed / records * 1_000_000,
+    }
+
+
+def handler_factories(
+    log_directory: str, port: int
+) -> dict[str, Callable[[logging.Formatter], logging.Handler]]:
+    """Return the handlers to benchmark.
+
+    Args:
+        log_directory: The directory to write the log files.
+        port: The UDP port of the syslog receiver.
+    """
+    return {
+        'rotating': lambda f: rotating_handler(
+            directory=log_directory, filename='alloc.log', formatter=f, max_bytes=0
+        ),
+        'mmap': lambda f: mmap_handler(directory=log_directory, filename='alloc.mmap', formatter=f),
+        'syslog (udp)': lambda f: syslog_handler(
+            host='127.0.0.1', port=port, formatter=f, socktype='UDP'
+        ),
+    }
+
+
+def run(log_directory: str, port: int, records: int, message: str) -> list[dict]:
+    """Return the str and bytes-native path results for each handler and formatter.
+
+    Args:
+        log_directory: The directory to write the log files.
+        port: The UDP port of the syslog receiver.
+        records: The number of records per run.
+        message: The record message.
+    """
+    formatters = {
+        'default': lambda: CachedTimeFormatter(DEFAULT_FORMAT),
+        'fast': lambda: CachedTimeFormatter(FAST_FORMAT),
+        'json': StructuredFormatter,
+    }
+    results = []
+    for handler_name, factory in handler_factories(log_directory, port).items():
+        for formatter_name, formatter_factory in formatters.items():
+            for path in ['str', 'bytes']:
+                formatter = formatter_factory()
+                # the str path is used when the formatter isn't bytes-native
+                formatter.bytes_native = path == 'bytes'
+                handler = factory(formatter)
+                try:
+                    result = bench_handler(handler, records, message)
+                finally:
+                    handler.close()
+                results.append(
+                    {'handler': handler_name, 'formatter': formatter_name, 'path': path, **result}
+                )
+    return results
+
+
+def main() -> None:
+    """Run the benchmarks and print or write the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=50_000, help='records per run')
+    parser.add_argument('--message-size', type=int, default=20, help='the message length')
+    parser.add_argument('--output', help='the JSON results file')
+    args = parser.parse_args()
+
+    # a receiver that is never read, the kernel drops the datagrams when the buffer is full
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(('127.0.0.1', 0))
+    try:
+        with tempfile.TemporaryDirectory() as log_directory:
+            results = run(
+                log_directory, receiver.getsockname()[1], args.records, 'x' * args.message_size
+            )
+    finally:
+        receiver.close()
+
+    for result in results:
+        name = f'{result["handler"]} ({result["formatter"]}, {result["path"]})'
+        print(
+            f'{name:<28} {result["bytes_per_record"]:>8,.0f} bytes/record '
+            f'{result["usec_per_record"]:>8.2f} usec/record'
+        )
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark handler lock contention for the stdlib and custom handlers."""
+# standard library
+import argparse
+import json
+import logging
+import os
+import socket
+import tempfile
+from logging.handlers import RotatingFileHandler, SysLogHandler
+
+# first-party
+from benchmarks.bench_middleware import (
+    SYSLOG_UDP_PORT,
+    bench_records,
+    get_logger,
+    start_syslog_servers,
+)
+from falcon_provider_logger.utils import DEFAULT_FORMAT, rotating_handler, syslog_handler
+
+
+def handler_factories(log_directory: str) -> dict:
+    """Return the stdlib and custom handlers to benchmark.
+
+    Args:
+        log_directory: The directory to write the log files.
+    """
+
+    def stdlib_rotating() -> logging.Handler:
+        lh = RotatingFileHandler(os.path.join(log_directory, 'stdlib.log'))
+        lh.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+        return lh
+
+    def stdlib_syslog() -> logging.Handler:
+        lh = SysLogHandler(address=('localhost', SYSLOG_UDP_PORT), socktype=socket.SOCK_DGRAM)
+        lh.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+        return lh
+
+    return {
+        'stdlib rotating': stdlib_rotating,
+        'rotating': lambda: rotating_handler(
+            directory=log_directory, filename='custom.log', max_bytes=0
+        ),
+        'rotating (buffered)': lambda: rotating_handler(
+            directory=log_directory, filename='buffered.log', max_bytes=0, buffer_records=256
+        ),
+        'stdlib syslog (udp)': stdlib_syslog,
+        'syslog (udp)': lambda: syslog_handler(port=SYSLOG_UDP_PORT),
+    }
+
+
+def main() -> None:
+    """Print or write the records per second of each handler at each thread count."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=64_000, help='records per handler run')
+    parser.add_argument('--threads', default='1,8,32', help='comma separated thread counts')
+    parser.add_argument('--output', help='the JSON results file')
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as log_directory:
+        start_syslog_servers(log_directory)
+        for name, factory in handler_factories(log_directory).items():
+            for threads in [int(t) for t in args.threads.split(',')]:
+                handler = factory()
+                try:
+                    result = bench_records(
+                        get_logger(name, handler), args.records // threads, threads
+                    )
+                finally:
+                    handler.close()
+                results.append({'name': name, **result})
+                print(
+                    f'{name:<22} threads={threads:<3} '
+                    f'{result["records_per_sec"]:>12,.0f} records/sec'
+                )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
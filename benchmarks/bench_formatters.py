@@ -0,0 +1,57 @@
+"""Benchmark the default formatter against the structured formatters."""
+# standard library
+import logging
+import timeit
+
+# first-party
+from falcon_provider_logger.formatters import FAST_FORMAT, CachedTimeFormatter, StructuredFormatter
+from falcon_provider_logger.utils import DEFAULT_FORMAT
+
+
+def bench_formatter(
+    formatter: logging.Formatter, number: int = 100_000, encoded: bool = False
+) -> float:
+    """Return the number of records formatted per second.
+
+    Args:
+        formatter: The formatter to benchmark.
+        number: The number of records to format.
+        encoded: If True, the records are formatted to bytes with a terminator (the
+            bytes-native path when supported).
+
+    Returns:
+        float: The records formatted per second.
+    """
+    record = logging.LogRecord(
+        'bench', logging.INFO, __file__, 10, 'request %s completed', ('abc',), None, 'bench'
+    )
+    if not encoded:
+        func = lambda: formatter.format(record)  # noqa: E731
+    elif getattr(formatter, 'bytes_native', False):
+        func = lambda: formatter.format_bytes(record, b'', b'\n')  # noqa: E731
+    else:
+        func = lambda: (formatter.format(record) + '\n').encode('utf-8')  # noqa: E731
+    elapsed = timeit.timeit(func, number=number)
+    return number / elapsed
+
+
+def main() -> None:
+    """Print the throughput of each formatter."""
+    formatters = {
+        'default (% style)': logging.Formatter(DEFAULT_FORMAT),
+        'default (cached asctime)': CachedTimeFormatter(DEFAULT_FORMAT),
+        'fast profile': CachedTimeFormatter(FAST_FORMAT),
+        'json (auto backend)': StructuredFormatter(),
+        'json (stdlib backend)': StructuredFormatter(json_backend='stdlib'),
+        'json (no asctime)': StructuredFormatter(fields=['name', 'levelname', 'message']),
+        'logfmt': StructuredFormatter(output='logfmt'),
+    }
+    for name, formatter in formatters.items():
+        print(
+            f'{name:<26} {bench_formatter(formatter):>12,.0f} records/sec '
+            f'{bench_formatter(formatter, encoded=True):>12,.0f} encoded records/sec'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+"""Benchmark the middleware and handler hot paths.
+
+Results are printed and can be written as JSON (--output) so they can be compared over time.
+"""
+# standard library
+import argparse
+import importlib.metadata
+import json
+import logging
+import os
+import platform
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+
+# third-party
+import falcon
+from falcon import testing
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.utils import rotating_handler, syslog_handler
+from tests.Syslog.syslog_server import TestSyslogServers
+
+# the syslog server ports (different from the test suite ports)
+SYSLOG_TCP_PORT = 5151
+SYSLOG_UDP_PORT = 5150
+
+
+class BenchResource:
+    """Resource that logs one record per request."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        self.log.info('request %s', req.path)
+        resp.text = 'ok'
+
+
+class NoLogResource:
+    """Resource without logging for the baseline."""
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        resp.text = 'ok'
+
+
+def bench_records(logger: logging.Logger, records: int, threads: int | None = 1) -> dict:
+    """Return the records per second logged by the threads.
+
+    Args:
+        logger: The logger to benchmark.
+        records: The number of records logged by each thread.
+        threads: The number of threads logging concurrently.
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for i in range(records):
+            logger.info('benchmark record %s', i)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    for h in logger.handlers:
+        h.flush()
+    elapsed = time.perf_counter() - start
+    total = records * threads
+    return {
+        'threads': threads,
+        'records': total,
+        'seconds': elapsed,
+        'records_per_sec': total / elapsed,
+        'usec_per_record': elapsed / total * 1_000_000,
+    }
+
+
+def bench_requests(client: testing.TestClient, requests: int) -> float:
+    """Return the seconds for the requests using the falcon test client.
+
+    Args:
+        client: The falcon test client.
+        requests: The number of requests.
+    """
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.simulate_get('/bench')
+    return time.perf_counter() - start
+
+
+def get_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    """Return a logger that only writes to the handler.
+
+    Args:
+        name: The logger name.
+        handler: The logging handler.
+    """
+    logger = logging.getLogger(f'bench.{name}')
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger
+
+
+def handler_factories(log_directory: str) -> dict[str, Callable[[], logging.Handler]]:
+    """Return the handlers to benchmark.
+
+    Args:
+        log_directory: The directory to write the log files.
+    """
+    return {
+        'rotating': lambda: rotating_handler(
+            directory=log_directory, filename='rotating.log', max_bytes=0
+        ),
+        'rotating (rotation)': lambda: rotating_handler(
+            directory=log_directory, filename='rotation.log', max_bytes=1_048_576, backup_count=2
+        ),
+        'syslog (udp)': lambda: syslog_handler(port=SYSLOG_UDP_PORT, socktype='UDP'),
+        'syslog (udp batch)': lambda: syslog_handler(port=SYSLOG_UDP_PORT, batch=True),
+        'syslog (tcp)': lambda: syslog_handler(port=SYSLOG_TCP_PORT, socktype='TCP'),
+    }
+
+
+def package_version() -> str | None:
+    """Return the installed package version."""
+    try:
+        return importlib.metadata.version('falcon-provider-logger')
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def run_handlers(log_directory: str, records: int, threads: list[int]) -> list[dict]:
+    """Return the handler throughput results.
+
+    Args:
+        log_directory: The directory to write the log files.
+        records: The total number of records logged by the threads for each run.
+        threads: The thread counts for the contention results.
+    """
+    results = []
+    for name, factory in handler_factories(log_directory).items():
+        for count in threads:
+            handler = factory()
+            try:
+                result = bench_records(get_logger(name, handler), records // count, count)
+            finally:
+                handler.close()
+            results.append({'name': name, **result})
+    return results
+
+
+def run_middleware(log_directory: str, requests: int, rounds: int | None = 5) -> list[dict]:
+    """Return the middleware per request overhead results.
+
+    Args:
+        log_directory: The directory to write the log files.
+        requests: The number of requests per round.
+        rounds: The number of rounds (the fastest round is reported).
+    """
+    apps = {'no middleware': falcon.App()}
+    apps['no middleware'].add_route('/bench', NoLogResource())
+    handlers = {
+        'middleware (no handlers)': [],
+        'middleware (rotating)': [
+            rotating_handler(directory=log_directory, filename='middleware.log', max_bytes=0)
+        ],
+    }
+    for name, h in handlers.items():
+        apps[name] = falcon.App(middleware=[LoggerMiddleware(h, name=f'bench.{name}')])
+        apps[name].add_route('/bench', BenchResource())
+
+    # the apps are run in alternating rounds and the fastest round is reported, to reduce
+    # the effect of other load on the host
+    clients = {name: testing.TestClient(app) for name, app in apps.items()}
+    elapsed = dict.fromkeys(apps, float('inf'))
+    for _ in range(rounds):
+        for name, client in clients.items():
+            elapsed[name] = min(elapsed[name], bench_requests(client, requests))
+
+    baseline = elapsed['no middleware'] / requests * 1_000_000
+    results = []
+    for name, seconds in elapsed.items():
+        usec_per_request = seconds / requests * 1_000_000
+        results.append(
+            {
+                'name': name,
+                'requests': requests,
+                'seconds': seconds,
+                'requests_per_sec': requests / seconds,
+                'usec_per_request': usec_per_request,
+                'usec_overhead': usec_per_request - baseline,
+            }
+        )
+    return results
+
+
+def start_syslog_servers(log_directory: str) -> None:
+    """Start the TCP and UDP syslog servers used by the test suite.
+
+    Args:
+        log_directory: The directory to write the log files.
+    """
+    servers = TestSyslogServers(address='127.0.0.1', log_directory=log_directory)
+    for server in [
+        servers.start_tcp_server(port=SYSLOG_TCP_PORT),
+        servers.start_udp_server(port=SYSLOG_UDP_PORT),
+    ]:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+
+def main() -> None:
+    """Run the benchmarks and print or write the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=64_000, help='records per handler run')
+    parser.add_argument('--requests', type=int, default=2_000, help='requests per app round')
+    parser.add_argument('--threads', default='1,8,32', help='comma separated thread counts')
+    parser.add_argument('--output', help='the JSON results file')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as log_directory:
+        start_syslog_servers(log_directory)
+        results = {
+            'meta': {
+                'version': package_version(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpus': os.cpu_count(),
+                'timestamp': time.time(),
+            },
+            'handlers': run_handlers(
+                log_directory, args.records, [int(t) for t in args.threads.split(',')]
+            ),
+            'middleware': run_middleware(log_directory, args.requests),
+        }
+
+    for result in results['handlers']:
+        print(
+            f'{result["name"]:<22} threads={result["threads"]:<3} '
+            f'{result["records_per_sec"]:>12,.0f} records/sec'
+        )
+    for result in results['middleware']:
+        print(
+            f'{result["name"]:<26} {result["usec_per_request"]:>8.1f} usec/request '
+            f'(+{result["usec_overhead"]:.1f})'
+        )
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
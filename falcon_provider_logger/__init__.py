@@ -1,4 +1,5 @@
 """Falcon logger module."""
 # flake8: noqa
 # first-party
+from falcon_provider_logger.aio import async_rotating_handler, async_syslog_handler
 from falcon_provider_logger.utils import rotating_handler, syslog_handler
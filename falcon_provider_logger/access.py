@@ -0,0 +1,116 @@
+"""Falcon logger access log module."""
+# standard library
+import inspect
+import logging
+import random
+import time
+
+# third-party
+from falcon import http_status_to_code
+
+# the access log message format (method, path, status, bytes, latency)
+ACCESS_LOG_FORMAT = '%s %s %s %s %.3fms'
+
+
+def response_length(resp: object) -> int | None:
+    """Return the length of the response body without rendering it when possible.
+
+    Args:
+        resp: The Falcon response object.
+
+    Returns:
+        int | None: The body length, or None when unknown (e.g., streams).
+    """
+    length = resp.content_length
+    if length is not None:
+        return int(length)
+    text = resp.text
+    if text is not None:
+        return len(text) if text.isascii() else len(text.encode())
+    data = resp.data
+    if data is not None:
+        return len(data)
+    if resp.media is not None and not inspect.iscoroutinefunction(resp.render_body):
+        # the rendered media is cached by the (WSGI) response, so it isn't serialized twice
+        return len(resp.render_body())
+    return None
+
+
+class AccessLogger:
+    """Emit one access log record per request with the request method, path, and latency.
+
+    The per route sample rates are resolved into a dict when the access logger is created
+    so the per request work is a dict lookup, a monotonic clock read, and the log call.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        level: int | None = logging.INFO,
+        sample_rate: float | None = 1.0,
+        routes: dict[str, bool | float] | None = None,
+    ):
+        """Initialize class properties.
+
+        Args:
+            logger: The logger for the access log records.
+            level: The level of the access log records.
+            sample_rate: The fraction (0.0 - 1.0) of requests that are logged.
+            routes: A mapping of route (URI template) to a sample rate, or False to disable
+                the access log for the route.
+        """
+        self.level = level
+        self.logger = logger
+        self.sample_rate = sample_rate
+        self.routes: dict[str, float] = {
+            route: float(rate) for route, rate in (routes or {}).items()
+        }
+
+    def _sampled(self, route: str | None) -> bool:
+        """Return True if the request should be logged.
+
+        Args:
+            route: The URI template of the request route.
+        """
+        rate = self.routes.get(route, self.sample_rate)
+        if rate >= 1.0:
+            return True
+        return rate > 0.0 and random.random() < rate  # nosec
+
+    def log(self, req: object, resp: object) -> None:
+        """Emit the access log record for the request.
+
+        Args:
+            req: The Falcon request object.
+            resp: The Falcon response object.
+        """
+        start = getattr(req.context, 'access_log_start', None)
+        if (
+            start is None
+            or not self.logger.isEnabledFor(self.level)
+            or not self._sampled(req.uri_template)
+        ):
+            return
+
+        latency_ms = (time.perf_counter_ns() - start) / 1_000_000
+        status = http_status_to_code(resp.status)
+        length = response_length(resp)
+        self.logger.log(
+            self.level,
+            ACCESS_LOG_FORMAT,
+            req.method,
+            req.path,
+            status,
+            '-' if length is None else length,
+            latency_ms,
+            extra={'status': status, 'bytes': length, 'latency_ms': latency_ms},
+        )
+
+    @staticmethod
+    def start(req: object) -> None:
+        """Record the request start time.
+
+        Args:
+            req: The Falcon request object.
+        """
+        req.context.access_log_start = time.perf_counter_ns()
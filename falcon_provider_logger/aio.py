@@ -0,0 +1,409 @@
+"""Falcon logger asyncio handler module."""
+# standard library
+import abc
+import asyncio
+import collections
+import logging
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import SysLogHandler
+
+# first-party
+from falcon_provider_logger.filters import RateLimitFilter
+from falcon_provider_logger.rotating import RotatingFileHandlerCustom
+from falcon_provider_logger.syslog_handlers import TCP_FRAMING_METHODS
+from falcon_provider_logger.utils import get_formatter, get_level, rotating_handler
+
+
+class AsyncHandler(logging.Handler, abc.ABC):
+    """Base handler that writes records from a writer task on the event loop.
+
+    Records are formatted and encoded in emit() and added to a bounded buffer. A writer
+    task drains the buffer in batches, so no I/O is performed by the calling coroutine.
+    Records emitted from other threads are handed to the event loop thread-safely.
+
+    The handler must be started on the event loop before records are written, which is
+    done by the LoggerMiddleware process_startup lifespan method. Records logged before
+    the handler is started are buffered.
+    """
+
+    def __init__(self, max_buffer: int | None = 10_000):
+        """Initialize class properties.
+
+        Args:
+            max_buffer: The max number of records buffered before the oldest are dropped.
+        """
+        logging.Handler.__init__(self)
+
+        # properties
+        self.dropped = 0
+        self._closing = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._pending: collections.deque = collections.deque(maxlen=max_buffer)
+        self._task: asyncio.Task | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    def _enqueue(self, data: bytes) -> None:
+        """Add encoded data to the buffer and wake the writer task.
+
+        Args:
+            data: The encoded record.
+        """
+        if len(self._pending) == self._pending.maxlen:
+            # the oldest record is discarded by the bounded deque
+            self.dropped += 1
+        self._pending.append(data)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _writer(self) -> None:
+        """Write buffered records in batches until the handler is closed."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                batch = list(self._pending)
+                self._pending.clear()
+                try:
+                    await self.write(batch)
+                except Exception:  # pragma: no cover pylint: disable=broad-except
+                    traceback.print_exc(file=sys.stderr)
+            if self._closing:
+                return
+
+    async def aclose(self) -> None:
+        """Write any buffered records, stop the writer task, and close the transport."""
+        for f in self.filters:
+            if isinstance(f, RateLimitFilter):
+                # the summaries are written by the writer task
+                f.flush_summaries()
+        if self._task is not None:
+            self._closing = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.close_transport()
+        self.close()
+
+    async def close_transport(self) -> None:
+        """Close the underlying transport."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Encode the record and add it to the buffer.
+
+        Args:
+            record: The log record.
+        """
+        try:
+            data = self.encode(record)
+            if self._loop is None or threading.get_ident() == self._loop_thread:
+                self._enqueue(data)
+            else:
+                self._loop.call_soon_threadsafe(self._enqueue, data)
+        except Exception:
+            self.handleError(record)
+
+    @abc.abstractmethod
+    def encode(self, record: logging.LogRecord) -> bytes:
+        """Return the formatted and encoded record.
+
+        Args:
+            record: The log record.
+        """
+
+    async def open_transport(self) -> None:
+        """Open the underlying transport."""
+
+    async def start(self) -> None:
+        """Open the transport and start the writer task on the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._closing = False
+        self._wakeup = asyncio.Event()
+        await self.open_transport()
+        self._task = self._loop.create_task(self._writer())
+        if self._pending:
+            self._wakeup.set()
+
+    @abc.abstractmethod
+    async def write(self, batch: list[bytes]) -> None:
+        """Write a batch of encoded records.
+
+        Args:
+            batch: The encoded records.
+        """
+
+
+class AsyncFileHandler(AsyncHandler):
+    """Asyncio handler that writes to a rotating file handler from a thread executor."""
+
+    def __init__(self, target: RotatingFileHandlerCustom, max_buffer: int | None = 10_000):
+        """Initialize class properties.
+
+        Args:
+            target: The rotating file handler used to format and write the records.
+            max_buffer: The max number of records buffered before the oldest are dropped.
+        """
+        AsyncHandler.__init__(self, max_buffer)
+        self.target = target
+
+        # properties
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _open_target(self) -> None:
+        """Open the stream of the target handler if it is delayed (runs in the executor)."""
+        self.target.acquire()
+        try:
+            if self.target.stream is None:
+                self.target.stream = self.target._open()  # pylint: disable=protected-access
+        finally:
+            self.target.release()
+
+    def _write_batch(self, batch: list[bytes]) -> None:
+        """Write a batch of records to the target handler (runs in the executor).
+
+        Args:
+            batch: The encoded records.
+        """
+        self.target.acquire()
+        try:
+            for data in batch:
+                self.target.write_encoded(data)
+        finally:
+            self.target.release()
+        self.target.flush()
+
+    async def close_transport(self) -> None:
+        """Close the target handler and shutdown the executor."""
+        if self._executor is None:
+            # the handler was never started
+            self.target.close()
+            return
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.target.close)
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+    def encode(self, record: logging.LogRecord) -> bytes:
+        """Return the record formatted and encoded by the target handler.
+
+        Args:
+            record: The log record.
+        """
+        return self.target.encode_record(record)
+
+    async def open_transport(self) -> None:
+        """Open the log file without blocking the event loop.
+
+        Otherwise the first record encoded on the event loop would open the delayed stream.
+        The executor is created for each start, as it is shutdown when the handler is closed.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='async-rfh')
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._open_target)
+
+    async def write(self, batch: list[bytes]) -> None:
+        """Write a batch of records without blocking the event loop.
+
+        Args:
+            batch: The encoded records.
+        """
+        await asyncio.get_running_loop().run_in_executor(self._executor, self._write_batch, batch)
+
+
+class AsyncSysLogHandler(AsyncHandler):
+    """Asyncio handler that sends records to a syslog server over UDP or TCP.
+
+    UDP records are sent with a DatagramTransport. TCP records are framed, packed into a
+    single write per batch, and the connection is re-established with backoff.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        facility: str | int | None = SysLogHandler.LOG_USER,
+        socktype: str | None = 'UDP',
+        framing: str | None = 'octet-counting',
+        max_buffer: int | None = 10_000,
+        backoff_max: float | None = 30.0,
+    ):
+        """Initialize class properties.
+
+        Args:
+            address: The syslog (host, port) address.
+            facility: The syslog facility.
+            socktype: The socket type. Either TCP or UDP.
+            framing: The TCP message framing (octet-counting, non-transparent, or null).
+            max_buffer: The max number of records buffered before the oldest are dropped.
+            backoff_max: The max number of seconds between TCP reconnect attempts.
+        """
+        if socktype.upper() not in ('TCP', 'UDP'):  # pragma: no cover
+            raise RuntimeError(f'{socktype} is not a valid socktype.')
+        if framing not in TCP_FRAMING_METHODS:
+            raise RuntimeError(f'{framing} is not a valid framing method.')
+
+        AsyncHandler.__init__(self, max_buffer)
+        self.address = address
+        self.backoff_max = backoff_max
+        if isinstance(facility, str):
+            facility = SysLogHandler.facility_names[facility]
+        self.facility = facility
+        self.framing = framing
+        self.socktype = socktype.upper()
+
+        # properties
+        self._prefixes: dict[str, bytes] = {}
+        self._stream: asyncio.StreamWriter | None = None
+        self._transport: asyncio.DatagramTransport | None = None
+
+    async def _connect(self) -> bool:
+        """Connect to the syslog server over TCP, waiting for the backoff period on failure."""
+        backoff = 0.1
+        while True:
+            try:
+                _, self._stream = await asyncio.open_connection(*self.address)
+                return True
+            except OSError:
+                if self._closing:
+                    return False
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.backoff_max)
+
+    def _prefix(self, levelname: str) -> bytes:
+        """Return the cached encoded priority prefix for the level.
+
+        Args:
+            levelname: The record level name.
+        """
+        prefix = self._prefixes.get(levelname)
+        if prefix is None:
+            priority = SysLogHandler.priority_names[
+                SysLogHandler.priority_map.get(levelname, 'warning')
+            ]
+            prefix = self._prefixes[levelname] = f'<{(self.facility << 3) | priority}>'.encode()
+        return prefix
+
+    async def close_transport(self) -> None:
+        """Close the UDP transport or TCP connection."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._stream is not None:
+            self._stream.close()
+            try:
+                await self._stream.wait_closed()
+            except OSError:  # pragma: no cover
+                pass
+            self._stream = None
+
+    def encode(self, record: logging.LogRecord) -> bytes:
+        """Return the framed syslog message.
+
+        Args:
+            record: The log record.
+        """
+        payload = self._prefix(record.levelname) + self.format(record).encode()
+        if self.socktype == 'UDP':
+            return payload
+        if self.framing == 'octet-counting':
+            return b'%d %b' % (len(payload), payload)
+        if self.framing == 'non-transparent':
+            return payload + b'\n'
+        return payload + b'\0'
+
+    async def open_transport(self) -> None:
+        """Open the UDP transport (TCP connections are opened on first write)."""
+        if self.socktype == 'UDP':
+            self._transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                asyncio.DatagramProtocol, remote_addr=self.address
+            )
+
+    async def write(self, batch: list[bytes]) -> None:
+        """Send a batch of records without blocking the event loop.
+
+        Args:
+            batch: The encoded records.
+        """
+        if self.socktype == 'UDP':
+            for data in batch:
+                self._transport.sendto(data)
+            return
+
+        data = b''.join(batch)
+        while True:
+            if self._stream is None and not await self._connect():
+                return
+            try:
+                self._stream.write(data)
+                await self._stream.drain()
+                return
+            except OSError:
+                self._stream.close()
+                self._stream = None
+
+
+def async_rotating_handler(max_buffer: int | None = 10_000, **kwargs) -> AsyncFileHandler:
+    """Return a configured instance of an asyncio rotating file handler with sane defaults.
+
+    Args:
+        max_buffer: The max number of records buffered before the oldest are dropped.
+        **kwargs: Any argument supported by rotating_handler().
+
+    Returns:
+        AsyncFileHandler: An asyncio handler writing to a RotatingFileHandlerCustom.
+    """
+    target = rotating_handler(**kwargs)
+    lh = AsyncFileHandler(target, max_buffer=max_buffer)
+    lh.setLevel(target.level)
+    lh.set_name(target.name)
+    for f in list(target.filters):
+        # records are filtered by the asyncio handler (the target only writes them)
+        target.removeFilter(f)
+        if isinstance(f, RateLimitFilter):
+            f.install(lh)
+        else:  # pragma: no cover
+            lh.addFilter(f)
+    return lh
+
+
+def async_syslog_handler(
+    host: str | None = 'localhost',
+    facility: str | None = 'user',
+    formatter: logging.Formatter | str | None = None,
+    level: str | None = 'INFO',
+    name: str | None = 'sh',
+    port: int | None = 514,
+    socktype: str | None = 'UDP',
+    framing: str | None = 'octet-counting',
+    max_buffer: int | None = 10_000,
+) -> AsyncSysLogHandler:
+    """Return a configured instance of an asyncio syslog handler with sane defaults.
+
+    Args:
+        host: The syslog hostname/ip.
+        facility: The syslog facility.
+        formatter: A logging formatter, format string, or structured output (json or
+            logfmt) to format logging handler. Defaults to a sane formatter with module/lineno.
+        level: The logging level for the handler.
+        name: The handler name.
+        port: The syslog port.
+        socktype: The socket type. Either TCP or UDP.
+        framing: The TCP message framing (octet-counting, non-transparent, or null).
+        max_buffer: The max number of records buffered before the oldest are dropped.
+
+    Returns:
+        AsyncSysLogHandler: A configured instance of the AsyncSysLogHandler.
+    """
+    lh = AsyncSysLogHandler(
+        address=(host, int(port)),
+        facility=facility,
+        socktype=socktype,
+        framing=framing,
+        max_buffer=max_buffer,
+    )
+    lh.setLevel(get_level(level.upper()))
+    lh.setFormatter(get_formatter(formatter))
+    lh.set_name(name)
+
+    return lh
@@ -0,0 +1,210 @@
+"""Falcon logger declarative config module."""
+# standard library
+import inspect
+import json
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from logging.handlers import SysLogHandler
+
+# first-party
+from falcon_provider_logger.utils import (
+    get_formatter,
+    get_level,
+    mmap_handler,
+    rotating_handler,
+    syslog_handler,
+)
+
+try:
+    # standard library
+    import tomllib
+except ImportError:  # pragma: no cover
+    # tomllib was added in python 3.11
+    tomllib = None
+
+# the environment variable with the config file path or inline JSON config
+CONFIG_ENV_VAR = 'FALCON_LOGGER_CONFIG'
+
+# the handler factories by the config "type"
+HANDLER_FACTORIES: dict[str, Callable[..., logging.Handler]] = {
+    'mmap': mmap_handler,
+    'rotating': rotating_handler,
+    'syslog': syslog_handler,
+}
+
+# the handler kwargs that are validated as logging levels
+LEVEL_KWARGS = ('flush_level', 'level', 'sync_level')
+
+# the handlers shared by identical specs (handlers no longer used by any logger are rebuilt)
+_shared_handlers: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_shared_lock = threading.Lock()
+
+
+def _reinit_shared_lock() -> None:
+    """Replace the shared handlers lock in the child (it could be held by a parent thread)."""
+    global _shared_lock  # pylint: disable=global-statement
+    _shared_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reinit_shared_lock)
+
+
+class LazyHandler(logging.Handler):
+    """Handler that builds the configured handler on the first record.
+
+    No files or sockets are opened when the config is loaded, so importing an app that is
+    never used (or is only used for some routes) doesn't pay for its handlers. The level and
+    the formatter are set on this handler, so the runtime level changes and the caller
+    lookup check work before the handler is built.
+    """
+
+    def __init__(self, factory: Callable[..., logging.Handler], kwargs: dict):
+        """Initialize class properties.
+
+        Args:
+            factory: The handler factory (e.g., rotating_handler).
+            kwargs: The validated factory kwargs.
+        """
+        logging.Handler.__init__(self, get_level(kwargs.get('level', 'INFO')))
+        self.factory = factory
+        self.kwargs = kwargs
+        self.formatter = get_formatter(kwargs.get('formatter'))
+        if kwargs.get('name'):
+            self.set_name(kwargs['name'])
+
+        # properties
+        self.handler: logging.Handler | None = None
+
+    def _build(self) -> logging.Handler:
+        """Return the configured handler, building it on first use."""
+        self.acquire()
+        try:
+            if self.handler is None:
+                handler = self.factory(**dict(self.kwargs, formatter=self.formatter))
+                # the level is checked by this handler, so it can be changed at runtime
+                handler.setLevel(logging.NOTSET)
+                self.handler = handler
+            return self.handler
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Close the configured handler if it was built."""
+        if self.handler is not None:
+            self.handler.close()
+        logging.Handler.close(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit the record to the configured handler.
+
+        Args:
+            record: The log record.
+        """
+        (self.handler or self._build()).emit(record)
+
+    def flush(self) -> None:
+        """Flush the configured handler if it was built."""
+        if self.handler is not None:
+            self.handler.flush()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Pass the record to the configured handler, building it on the first record.
+
+        Args:
+            record: The log record.
+        """
+        if not self.filter(record):
+            return False
+        return (self.handler or self._build()).handle(record)
+
+
+def _validate_handler_spec(spec: dict) -> tuple[Callable[..., logging.Handler], dict]:
+    """Return the handler factory and kwargs after validating the spec.
+
+    Args:
+        spec: The handler spec (e.g., ``{"type": "rotating", "filename": "server.log"}``).
+
+    Raises:
+        RuntimeError: Invalid handler type, argument, level, or facility.
+    """
+    if not isinstance(spec, dict):
+        raise RuntimeError('A handler spec must be a dict.')
+    kwargs = dict(spec)
+    factory = HANDLER_FACTORIES.get(kwargs.pop('type', 'rotating'))
+    if factory is None:
+        raise RuntimeError(f'{spec["type"]} is not a valid handler type.')
+
+    try:
+        inspect.signature(factory).bind(**kwargs)
+    except TypeError as ex:
+        raise RuntimeError(f'Invalid handler spec: {ex}') from ex
+    for key in LEVEL_KWARGS:
+        if key in kwargs:
+            get_level(kwargs[key])
+    if kwargs.get('facility', 'user') not in SysLogHandler.facility_names:
+        raise RuntimeError(f'{kwargs["facility"]} is not a valid syslog facility.')
+    return factory, kwargs
+
+
+def build_handler(spec: dict) -> LazyHandler:
+    """Return a lazy handler for the spec, shared with any identical spec.
+
+    Args:
+        spec: The handler spec. The "type" (mmap, rotating, or syslog) selects the handler
+            factory and the other keys are passed to the factory.
+    """
+    factory, kwargs = _validate_handler_spec(spec)
+    key = json.dumps(spec, sort_keys=True, default=str)
+    with _shared_lock:
+        handler = _shared_handlers.get(key)
+        if handler is None:
+            handler = _shared_handlers[key] = LazyHandler(factory, kwargs)
+    return handler
+
+
+def load_config(config: dict) -> dict:
+    """Return the validated LoggerMiddleware kwargs for the config.
+
+    Args:
+        config: The middleware kwargs with a "handlers" list of handler specs.
+
+    Raises:
+        RuntimeError: Invalid config.
+    """
+    if not isinstance(config, dict):
+        raise RuntimeError('The logger config must be a dict.')
+    kwargs = dict(config)
+    for key in ('access_log_level', 'level'):
+        if key in kwargs:
+            get_level(kwargs[key])
+    kwargs['handlers'] = [build_handler(spec) for spec in kwargs.get('handlers') or []]
+    return kwargs
+
+
+def read_config(source: str | None = None) -> dict:
+    """Return the config from a TOML or JSON file, or an inline JSON string.
+
+    Args:
+        source: The config file path or JSON string. Defaults to the FALCON_LOGGER_CONFIG
+            environment variable.
+
+    Raises:
+        RuntimeError: No config provided or the config can't be read.
+    """
+    source = source or os.getenv(CONFIG_ENV_VAR)
+    if not source:
+        raise RuntimeError(f'No logger config provided (set {CONFIG_ENV_VAR}).')
+    if source.lstrip().startswith('{'):
+        return json.loads(source)
+
+    if source.endswith('.toml'):
+        if tomllib is None:  # pragma: no cover
+            raise RuntimeError('TOML config files require python 3.11+.')
+        with open(source, 'rb') as fh:
+            return tomllib.load(fh)
+    with open(source, encoding='utf-8') as fh:
+        return json.load(fh)
@@ -0,0 +1,78 @@
+"""Falcon logger request context module."""
+# standard library
+import logging
+import os
+from contextvars import ContextVar
+
+# the request scoped fields added to each log record
+CONTEXT_FIELDS = ('request_id', 'method', 'path', 'route', 'remote_addr')
+
+# the request context for the current thread or asyncio task
+request_context: ContextVar[dict | None] = ContextVar(
+    'falcon_provider_logger_request_context', default=None
+)
+
+
+def clear_request_context() -> None:
+    """Clear the request context for the current thread or asyncio task."""
+    request_context.set(None)
+
+
+def get_request_context() -> dict[str, str | None] | None:
+    """Return the request context for the current thread or asyncio task."""
+    return request_context.get()
+
+
+def new_request_id() -> str:
+    """Return a new random request id."""
+    return os.urandom(8).hex()
+
+
+def set_request_context(
+    req: object, request_id_header: str | None = 'X-Request-ID'
+) -> dict[str, str | None]:
+    """Set the request context for the current thread or asyncio task.
+
+    Args:
+        req: The Falcon request object.
+        request_id_header: The request header that provides the request id. When the
+            header is not present a random request id is generated.
+
+    Returns:
+        dict: The request context.
+    """
+    context = {
+        'request_id': (request_id_header and req.get_header(request_id_header)) or new_request_id(),
+        'method': req.method,
+        'path': req.path,
+        'route': None,
+        'remote_addr': req.remote_addr,
+    }
+    request_context.set(context)
+    return context
+
+
+class RequestContextFilter(logging.Filter):
+    """Filter that adds the current request context fields to each log record.
+
+    Records logged outside of a request have the fields set to the default value, so
+    format strings using the fields (e.g., "%(request_id)s") are always valid.
+    """
+
+    def __init__(self, default: str | None = '-'):
+        """Initialize class properties.
+
+        Args:
+            default: The field value for records logged outside of a request.
+        """
+        logging.Filter.__init__(self)
+        self.defaults = dict.fromkeys(CONTEXT_FIELDS, default)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Add the request context fields to the record.
+
+        Args:
+            record: The log record.
+        """
+        record.__dict__.update(request_context.get() or self.defaults)
+        return True
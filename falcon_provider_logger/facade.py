@@ -0,0 +1,113 @@
+"""Falcon logger facade module."""
+# standard library
+import logging
+import sys
+from collections.abc import Callable
+
+# the frames of this module between the facade caller and Logger._log
+_STACKLEVEL_OFFSET = 2 if sys.version_info >= (3, 11) else 1
+
+
+class LoggerFacade(logging.LoggerAdapter):
+    """Thin logger wrapper with cached level checks and deferred message formatting.
+
+    The is_debug, is_info, is_warning, is_error, and is_critical properties read the enabled
+    level cache of the logger, which logging clears whenever a level changes (e.g., setLevel,
+    dictConfig, or logging.disable), so guarding an expensive message
+    (e.g., ``if self.log.is_debug:``) costs a dict lookup and never sees a stale level. The
+    message can also be a callable that is only called when the level is enabled (e.g.,
+    ``self.log.debug(lambda: f'DEBUG {key}')``).
+
+    Any other attribute (e.g., handlers or addHandler) is read from the wrapped logger.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        """Initialize class properties.
+
+        Args:
+            logger: The logger instance.
+        """
+        logging.LoggerAdapter.__init__(self, logger)
+
+    def __getattr__(self, name: str) -> object:
+        """Return the attribute from the wrapped logger."""
+        if name == 'logger':
+            # the wrapped logger isn't set yet (e.g., copy or pickle)
+            raise AttributeError(name)
+        return getattr(self.logger, name)
+
+    def _log_lazy(self, level: int, msg: str | Callable, args: tuple, kwargs: dict) -> None:
+        """Log the message, calling the message if it is a callable.
+
+        Args:
+            level: The record level.
+            msg: The message or a callable that returns the message.
+            args: The message args.
+            kwargs: The logging keyword args (e.g., exc_info or extra).
+        """
+        if callable(msg):
+            msg = msg()
+        # skip this module frames when finding the caller (python 3.11+ starts counting at
+        # the caller of findCaller while python 3.10 already starts at this frame)
+        kwargs['stacklevel'] = kwargs.get('stacklevel', 1) + _STACKLEVEL_OFFSET
+        self.logger._log(level, msg, args, **kwargs)  # pylint: disable=protected-access
+
+    @property
+    def is_critical(self) -> bool:
+        """Return True if the CRITICAL level is enabled."""
+        return self.logger.isEnabledFor(logging.CRITICAL)
+
+    @property
+    def is_debug(self) -> bool:
+        """Return True if the DEBUG level is enabled."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    @property
+    def is_error(self) -> bool:
+        """Return True if the ERROR level is enabled."""
+        return self.logger.isEnabledFor(logging.ERROR)
+
+    @property
+    def is_info(self) -> bool:
+        """Return True if the INFO level is enabled."""
+        return self.logger.isEnabledFor(logging.INFO)
+
+    @property
+    def is_warning(self) -> bool:
+        """Return True if the WARNING level is enabled."""
+        return self.logger.isEnabledFor(logging.WARNING)
+
+    def critical(self, msg: str | Callable, *args, **kwargs) -> None:
+        """Log the message with the CRITICAL level."""
+        if self.is_critical:
+            self._log_lazy(logging.CRITICAL, msg, args, kwargs)
+
+    def debug(self, msg: str | Callable, *args, **kwargs) -> None:
+        """Log the message with the DEBUG level."""
+        if self.is_debug:
+            self._log_lazy(logging.DEBUG, msg, args, kwargs)
+
+    def error(self, msg: str | Callable, *args, **kwargs) -> None:
+        """Log the message with the ERROR level."""
+        if self.is_error:
+            self._log_lazy(logging.ERROR, msg, args, kwargs)
+
+    def exception(self, msg: str | Callable, *args, exc_info=True, **kwargs) -> None:
+        """Log the message and the exception with the ERROR level."""
+        if self.is_error:
+            self._log_lazy(logging.ERROR, msg, args, dict(kwargs, exc_info=exc_info))
+
+    def info(self, msg: str | Callable, *args, **kwargs) -> None:
+        """Log the message with the INFO level."""
+        if self.is_info:
+            self._log_lazy(logging.INFO, msg, args, kwargs)
+
+    def log(self, level: int, msg: str | Callable, *args, **kwargs) -> None:
+        """Log the message with the provided level."""
+        if self.logger.isEnabledFor(level):
+            self._log_lazy(level, msg, args, kwargs)
+
+    def warning(self, msg: str | Callable, *args, **kwargs) -> None:
+        """Log the message with the WARNING level."""
+        if self.is_warning:
+            self._log_lazy(logging.WARNING, msg, args, kwargs)
@@ -0,0 +1,164 @@
+"""Falcon logger filters module."""
+# standard library
+import collections
+import logging
+import threading
+import time
+
+# first-party
+from falcon_provider_logger.fork import register_fork_reinit
+
+# the message of the summary record for suppressed records
+SUPPRESSED_SUMMARY_FORMAT = 'suppressed %d similar messages: %s'
+
+
+class RateLimitFilter(logging.Filter):
+    """Handler filter that rate limits floods of similar records.
+
+    Records are keyed by (logger name, level, message template) and each key has a token
+    bucket that allows ``burst`` records and refills at ``rate`` records per second. The
+    buckets are stored in a bounded LRU, so the per record cost is O(1) regardless of the
+    number of distinct messages.
+
+    The number of suppressed records is tracked per key and a "suppressed N similar
+    messages" summary record is sent to the handler, at most once per ``summary_interval``.
+    The summaries are checked when records are filtered, so no timer thread is required,
+    and the pending summaries are sent when the handler is closed.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = 10.0,
+        burst: int | None = 20,
+        max_keys: int | None = 1_024,
+        summary_interval: float | None = 60.0,
+    ):
+        """Initialize class properties.
+
+        Args:
+            rate: The number of records per second allowed for each key.
+            burst: The number of records for a key that are allowed before rate limiting.
+            max_keys: The max number of keys tracked before the least recently used is evicted.
+            summary_interval: The number of seconds between suppressed record summaries.
+        """
+        if rate <= 0 or burst < 1:
+            raise RuntimeError('The rate limit rate and burst must be greater than 0.')
+
+        logging.Filter.__init__(self)
+        self.burst = burst
+        self.handler: logging.Handler | None = None
+        self.max_keys = max_keys
+        self.rate = rate
+        self.summary_interval = summary_interval
+
+        # properties
+        self._buckets: collections.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._next_summary = time.monotonic() + summary_interval
+        self._suppressed: dict[tuple, int] = {}
+        register_fork_reinit(self)
+
+    def _allow(self, key: tuple, now: float) -> bool:
+        """Return True if the bucket for the key has a token (lock must be held).
+
+        Args:
+            key: The record key.
+            now: The current monotonic time.
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._buckets.popitem(last=False)
+            # bucket: [tokens, last refill time]
+            bucket = self._buckets[key] = [float(self.burst), now]
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return True
+        self._suppressed[key] = self._suppressed.get(key, 0) + 1
+        return False
+
+    def _emit_summaries(self, suppressed: dict[tuple, int]) -> None:
+        """Send a summary record for each key with suppressed records to the handler.
+
+        Args:
+            suppressed: The number of suppressed records per key.
+        """
+        for (name, levelno, msg), count in suppressed.items():
+            record = logging.makeLogRecord(
+                {
+                    'name': name,
+                    'levelno': levelno,
+                    'levelname': logging.getLevelName(levelno),
+                    'msg': SUPPRESSED_SUMMARY_FORMAT,
+                    'args': (count, msg),
+                    'rate_limit_summary': True,
+                }
+            )
+            self.handler.handle(record)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if the record is allowed by the rate limit.
+
+        Args:
+            record: The log record.
+        """
+        if getattr(record, 'rate_limit_summary', False):
+            return True
+
+        # the QueueHandlerCustom replaces the msg with the merged message
+        msg = getattr(record, 'msg_template', record.msg)
+        now = time.monotonic()
+        summaries = None
+        with self._lock:
+            try:
+                allowed = self._allow((record.name, record.levelno, msg), now)
+            except TypeError:
+                # an unhashable message (e.g., a dict) is keyed by its repr
+                allowed = self._allow((record.name, record.levelno, repr(msg)), now)
+            if now >= self._next_summary:
+                self._next_summary = now + self.summary_interval
+                summaries, self._suppressed = self._suppressed, {}
+
+        if summaries and self.handler is not None:
+            # the summaries are handled outside the lock as they pass through this filter
+            self._emit_summaries(summaries)
+        return allowed
+
+    def flush_summaries(self) -> None:
+        """Send the summaries for any suppressed records to the handler immediately."""
+        with self._lock:
+            summaries, self._suppressed = self._suppressed, {}
+            self._next_summary = time.monotonic() + self.summary_interval
+        if summaries and self.handler is not None:
+            self._emit_summaries(summaries)
+
+    def reinit_after_fork(self) -> None:
+        """Reset the lock and the suppressed counts (reported by the parent) in the child."""
+        self._lock = threading.Lock()
+        self._suppressed = {}
+
+    def install(self, handler: logging.Handler) -> None:
+        """Add the filter to the handler that receives the summary records.
+
+        The close method of the handler is wrapped to send the pending summaries, so the
+        suppressed counts of the last flood are not lost on shutdown.
+
+        Args:
+            handler: The logging handler.
+        """
+        self.handler = handler
+        handler.addFilter(self)
+        close = handler.close
+
+        def _close() -> None:
+            """Send the pending summaries and close the handler."""
+            if self.handler is handler:
+                self.flush_summaries()
+            close()
+
+        handler.close = _close
@@ -0,0 +1,234 @@
+"""Falcon logger flight recorder handler module."""
+# standard library
+import collections
+import logging
+
+# first-party
+from falcon_provider_logger.fork import register_fork_reinit, unregister_fork_reinit
+
+# the estimated size of a buffered log record without the message and args
+RECORD_OVERHEAD_BYTES = 512
+
+
+class RecordRing:
+    """Preallocated ring buffer of unformatted log records and their estimated size."""
+
+    __slots__ = ('bytes', 'count', 'records', 'sizes', 'start')
+
+    def __init__(self, capacity: int):
+        """Initialize class properties.
+
+        Args:
+            capacity: The max number of records in the ring.
+        """
+        self.bytes = 0
+        self.count = 0
+        self.records: list[logging.LogRecord | None] = [None] * capacity
+        self.sizes: list[int] = [0] * capacity
+        self.start = 0
+
+    def append(self, record: logging.LogRecord, size: int) -> None:
+        """Add the record, overwriting the oldest record when the ring is full.
+
+        Args:
+            record: The log record.
+            size: The estimated size of the record.
+        """
+        capacity = len(self.records)
+        if self.count == capacity:
+            self.popleft()
+        index = (self.start + self.count) % capacity
+        self.records[index] = record
+        self.sizes[index] = size
+        self.bytes += size
+        self.count += 1
+
+    def drain(self) -> list[logging.LogRecord]:
+        """Remove and return the records in the order they were added."""
+        records = []
+        while self.count:
+            records.append(self.records[self.start])
+            self.popleft()
+        return records
+
+    def popleft(self) -> None:
+        """Discard the oldest record."""
+        self.records[self.start] = None
+        self.bytes -= self.sizes[self.start]
+        self.start = (self.start + 1) % len(self.records)
+        self.count -= 1
+
+
+class FlightRecorderHandler(logging.Handler):
+    """Handler that keeps the recent low level records and only writes them on error.
+
+    Records below the forward level (e.g., DEBUG) are kept unformatted in a preallocated ring
+    buffer, globally or per request (using the request_id added by the request context).
+    Records at or above the forward level are passed to the handlers immediately. When a
+    record at or above the flush level is handled, the buffered records are passed to the
+    handlers first, so the debug context for a failure is written while the steady state I/O
+    is only the forwarded records.
+
+    The buffer is bounded by the number of records per ring and by the estimated size of all
+    buffered records. When the handler is behind a queue, the records are formatted by the
+    queue handler before they are buffered.
+    """
+
+    def __init__(
+        self,
+        handlers: list[logging.Handler],
+        capacity: int | None = 1_000,
+        max_bytes: int | None = 1_048_576,
+        flush_level: int | None = logging.ERROR,
+        forward_level: int | None = logging.INFO,
+        per_request: bool | None = False,
+        max_requests: int | None = 100,
+    ):
+        """Initialize class properties.
+
+        Args:
+            handlers: The handlers that write the forwarded and dumped records.
+            capacity: The max number of records buffered (per request when per_request).
+            max_bytes: The max estimated size of all buffered records.
+            flush_level: Records at or above this level dump the buffered records.
+            forward_level: Records at or above this level are passed to the handlers
+                immediately. Records below this level are buffered.
+            per_request: If True, buffer the records per request and only dump the records of
+                the failed request. Requires the middleware request_context.
+            max_requests: The max number of request buffers (the least recently used is
+                discarded).
+        """
+        logging.Handler.__init__(self)
+        self.capacity = capacity
+        self.flush_level = flush_level
+        self.forward_level = forward_level
+        self.handlers = handlers
+        self.max_bytes = max_bytes
+        self.max_requests = max_requests
+        self.per_request = per_request
+
+        # properties
+        self._bytes = 0
+        self._rings: collections.OrderedDict = collections.OrderedDict()
+        register_fork_reinit(self)
+
+    @staticmethod
+    def _record_size(record: logging.LogRecord) -> int:
+        """Return the estimated size of the record without formatting it.
+
+        Args:
+            record: The log record.
+        """
+        size = RECORD_OVERHEAD_BYTES
+        if isinstance(record.msg, str):
+            size += len(record.msg)
+        for arg in record.args or ():
+            size += len(arg) if isinstance(arg, (str, bytes)) else 16
+        return size
+
+    def _buffer(self, key: str | None, record: logging.LogRecord) -> None:
+        """Add the record to the ring for the key.
+
+        Args:
+            key: The request id or None for the global ring.
+            record: The log record.
+        """
+        ring = self._rings.get(key)
+        if ring is None:
+            if len(self._rings) >= self.max_requests:
+                _, evicted = self._rings.popitem(last=False)
+                self._bytes -= evicted.bytes
+            ring = self._rings[key] = RecordRing(self.capacity)
+        else:
+            self._rings.move_to_end(key)
+
+        ring_bytes = ring.bytes
+        ring.append(record, self._record_size(record))
+        self._bytes += ring.bytes - ring_bytes
+
+        # discard the oldest records of the least recently used rings
+        while self._bytes > self.max_bytes:
+            oldest_ring = next(iter(self._rings.values()))
+            ring_bytes = oldest_ring.bytes
+            oldest_ring.popleft()
+            self._bytes -= ring_bytes - oldest_ring.bytes
+            if not oldest_ring.count:
+                self._rings.popitem(last=False)
+
+    def _forward(self, record: logging.LogRecord, dumped: bool | None = False) -> None:
+        """Pass the record to the handlers.
+
+        Args:
+            record: The log record.
+            dumped: If True, the record is from the buffer and the handler level is ignored.
+        """
+        for h in self.handlers:
+            if dumped or record.levelno >= h.level:
+                h.handle(record)
+
+    def close(self) -> None:
+        """Close the handlers."""
+        unregister_fork_reinit(self)
+        for h in self.handlers:
+            h.close()
+        logging.Handler.close(self)
+
+    def discard(self, key: str | None = None) -> None:
+        """Discard the buffered records for the key (e.g., the request succeeded).
+
+        Args:
+            key: The request id or None for the global ring.
+        """
+        self.acquire()
+        try:
+            ring = self._rings.pop(key, None)
+            if ring is not None:
+                self._bytes -= ring.bytes
+        finally:
+            self.release()
+
+    def dump(self, key: str | None = None) -> None:
+        """Pass the buffered records for the key to the handlers.
+
+        Args:
+            key: The request id or None for the global ring.
+        """
+        self.acquire()
+        try:
+            ring = self._rings.pop(key, None)
+            if ring is not None:
+                self._bytes -= ring.bytes
+                for record in ring.drain():
+                    self._forward(record, dumped=True)
+        finally:
+            self.release()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Buffer the record or pass it to the handlers.
+
+        Args:
+            record: The log record.
+        """
+        try:
+            key = getattr(record, 'request_id', None) if self.per_request else None
+            dump = record.levelno >= self.flush_level or getattr(
+                record, 'flight_recorder_dump', False
+            )
+            if dump:
+                self.dump(key)
+            elif record.levelno < self.forward_level:
+                self._buffer(key, record)
+                return
+            self._forward(record)
+        except Exception:  # pragma: no cover
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush the handlers."""
+        for h in self.handlers:
+            h.flush()
+
+    def reinit_after_fork(self) -> None:
+        """Discard the records buffered by the parent in the child process."""
+        self._rings.clear()
+        self._bytes = 0
@@ -0,0 +1,46 @@
+"""Falcon logger fork support module."""
+# standard library
+import os
+import sys
+import traceback
+import weakref
+
+# the objects reinitialized in the child process after a fork, in registration order (so
+# the handlers are reinitialized before the queue listener that writes to them)
+_fork_objects: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _reinit_after_fork() -> None:
+    """Reinitialize the registered objects in the child process."""
+    for obj in list(_fork_objects.keys()):
+        try:
+            obj.reinit_after_fork()
+        except Exception:  # pragma: no cover
+            traceback.print_exc(file=sys.stderr)
+
+
+def register_fork_reinit(obj: object) -> None:
+    """Register an object with a reinit_after_fork() method called in the child after a fork.
+
+    Pre-fork servers that import the app before forking (e.g., gunicorn --preload) would
+    otherwise share the file descriptions and sockets of the parent, inherit locks that were
+    held by other threads, and lose the background threads, which don't exist in the child.
+    The logging handler locks are reinitialized by the logging module before this hook runs.
+
+    Args:
+        obj: The handler, filter, or other object that holds the process state.
+    """
+    _fork_objects[obj] = None
+
+
+def unregister_fork_reinit(obj: object) -> None:
+    """Unregister an object so a closed handler doesn't reopen its sockets or threads in a child.
+
+    Args:
+        obj: The registered object.
+    """
+    _fork_objects.pop(obj, None)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reinit_after_fork)
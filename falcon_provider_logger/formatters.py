@@ -0,0 +1,401 @@
+"""Falcon logger formatters module."""
+# standard library
+import json
+import logging
+import operator
+import re
+import time
+from collections.abc import Callable
+
+try:
+    # third-party
+    import orjson
+except ImportError:  # pragma: no cover
+    # orjson is an optional dependency
+    orjson = None
+
+# the record attributes that require the logger to find the caller (stack walk)
+CALLER_ATTRIBUTES = ('filename', 'funcName', 'lineno', 'module', 'pathname')
+
+# the fast profile format (no caller fields)
+FAST_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# the record attributes with few distinct values, which are encoded once and cached
+CACHED_BYTES_ATTRIBUTES = ('filename', 'funcName', 'levelname', 'module', 'name', 'threadName')
+
+# the max number of cached encoded values per attribute
+CACHED_BYTES_MAX = 1_024
+
+# a %-style format field (e.g., "%(levelname)-8s" or "%(lineno)d")
+PERCENT_FIELD_PATTERN = re.compile(
+    r'%\((?P<field>[^)]+)\)(?P<spec>[#0+ -]*\d*(?:\.\d+)?)(?P<type>[a-zA-Z])'
+)
+
+# the conversion types that output a string
+STRING_CONVERSIONS = ('a', 'r', 's')
+
+# characters that require a logfmt value to be quoted
+LOGFMT_QUOTE_PATTERN = re.compile(r'[\s="\\]')
+
+# the default fields for the structured formatter (output key -> record attribute)
+DEFAULT_FIELDS = {
+    'time': 'asctime',
+    'logger': 'name',
+    'level': 'levelname',
+    'message': 'message',
+    'module': 'module',
+    'function': 'funcName',
+    'line': 'lineno',
+}
+
+
+def _json_dumps_orjson(data: dict) -> str:  # pragma: no cover
+    """Serialize data to JSON using orjson."""
+    return orjson.dumps(data, default=str).decode()
+
+
+def _json_dumps_stdlib(data: dict) -> str:
+    """Serialize data to JSON using the standard library."""
+    return json.dumps(data, default=str, ensure_ascii=False, separators=(',', ':'))
+
+
+def _cached_bytes_getter(attr: str, field_format: str | None = '%s') -> Callable:
+    """Return a function that returns the encoded attribute value, caching the encoded values.
+
+    Args:
+        attr: The record attribute name.
+        field_format: The %-style format applied to the value before it is encoded.
+    """
+    cache: dict[object, bytes] = {}
+
+    def getter(record: logging.LogRecord) -> bytes:
+        value = getattr(record, attr)
+        encoded = cache.get(value)
+        if encoded is None:
+            encoded = (field_format % (value,)).encode('utf-8')
+            if len(cache) < CACHED_BYTES_MAX:
+                cache[value] = encoded
+        return encoded
+
+    return getter
+
+
+def _logfmt_value(value: object) -> str:
+    """Return the logfmt representation of a value.
+
+    Args:
+        value: The field value.
+    """
+    if value is None:
+        return ''
+    value = str(value)
+    if value and LOGFMT_QUOTE_PATTERN.search(value) is None:
+        return value
+    value = value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return f'"{value}"'
+
+
+def formatter_uses_caller(formatter: logging.Formatter | None) -> bool:
+    """Return True if the formatter output requires the caller (file/function/line) info.
+
+    Args:
+        formatter: The logging formatter.
+    """
+    if formatter is None:
+        # the default formatter only outputs the message
+        return False
+    if hasattr(formatter, 'uses_caller'):
+        return formatter.uses_caller
+    fmt = getattr(getattr(formatter, '_style', None), '_fmt', None)
+    if type(formatter).format is not logging.Formatter.format or fmt is None:
+        # a custom formatter could use any attribute
+        return True
+    return any(attr in fmt for attr in CALLER_ATTRIBUTES)
+
+
+class CachedTimeMixin:
+    """Formatter mixin that formats asctime once per second instead of once per record."""
+
+    _time_bytes_cache: tuple[int | None, bytes, bool] = (None, b'', False)
+    _time_cache: tuple[int | None, str | None, str] = (None, None, '')
+
+    def format_time_bytes(self, record: logging.LogRecord) -> bytes:
+        """Return the encoded asctime for the record using a per second cache.
+
+        Args:
+            record: The log record.
+        """
+        second = int(record.created)
+        cached_second, formatted, msec = self._time_bytes_cache
+        if second != cached_second:
+            formatted = time.strftime(
+                self.datefmt or self.default_time_format, self.converter(record.created)
+            ).encode('utf-8')
+            msec = not self.datefmt and bool(self.default_msec_format)
+            if msec:
+                # the formatted second is cached as a template for the milliseconds
+                formatted = self.default_msec_format.encode('utf-8').replace(
+                    b'%s', formatted.replace(b'%', b'%%'), 1
+                )
+            self._time_bytes_cache = (second, formatted, msec)
+        return formatted % int(record.msecs) if msec else formatted
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Return the formatted record creation time using a per second cache.
+
+        Args:
+            record: The log record.
+            datefmt: The date format.
+        """
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            formatted = time.strftime(
+                datefmt or self.default_time_format, self.converter(record.created)
+            )
+            self._time_cache = (second, datefmt, formatted)
+        if datefmt or not self.default_msec_format:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+class CachedTimeFormatter(CachedTimeMixin, logging.Formatter):
+    """Formatter that caches asctime per second and reports if it uses caller info."""
+
+    def __init__(
+        self,
+        fmt: str | None = None,
+        datefmt: str | None = None,
+        style: str | None = '%',
+        validate: bool | None = True,
+    ):
+        """Initialize class properties.
+
+        Args:
+            fmt: The format string.
+            datefmt: The date format for the asctime field.
+            style: The format string style.
+            validate: If True, validate the format string.
+        """
+        logging.Formatter.__init__(self, fmt, datefmt, style, validate)
+        self.uses_caller = any(attr in self._style._fmt for attr in CALLER_ATTRIBUTES)
+
+        # the bytes template and field getters used by format_bytes
+        self._bytes_plan = self._compile_bytes_plan(self._style._fmt) if style == '%' else None
+        self.bytes_native = self._bytes_plan is not None
+
+    def _compile_bytes_plan(self, fmt: str) -> tuple[bytes, list[Callable]] | None:
+        """Return the bytes template and field getters for a %-style format string.
+
+        Args:
+            fmt: The format string.
+        """
+        getters = []
+        for match in PERCENT_FIELD_PATTERN.finditer(fmt):
+            getters.append(
+                self._field_getter(match.group('field'), match.group('type'), match.group('spec'))
+            )
+        if fmt.count('%(') != len(getters):  # pragma: no cover
+            # an unsupported field, records are formatted with the str path
+            return None
+        template = PERCENT_FIELD_PATTERN.sub(self._field_spec, fmt)
+        # the prefix and suffix are added in the same operation as the fields
+        return b'%b' + template.encode('utf-8') + b'%b', getters
+
+    @staticmethod
+    def _field_spec(match: re.Match) -> str:
+        """Return the bytes template spec for a format field.
+
+        Args:
+            match: The format field match.
+        """
+        conversion = match.group('type')
+        if conversion in STRING_CONVERSIONS:
+            # the string fields are formatted and encoded by the getters
+            return '%b'
+        return f'%{match.group("spec")}{conversion}'
+
+    def _field_getter(self, attr: str, conversion: str, spec: str | None = '') -> Callable:
+        """Return a function that resolves the encoded (or numeric) field value from a record.
+
+        Args:
+            attr: The record attribute name.
+            conversion: The %-style conversion type.
+            spec: The %-style flags, width, and precision.
+        """
+        if conversion not in STRING_CONVERSIONS:
+            # numeric conversions are applied to the value by the bytes template
+            return operator.attrgetter(attr)
+        if spec:
+            # the width and precision count characters, so the value is padded or truncated
+            # before it is encoded (a bytes template would count the encoded bytes)
+            field_format = f'%{spec}{conversion}'
+            if attr == 'asctime':
+                return lambda r: (field_format % self.format_time_bytes(r).decode('utf-8')).encode(
+                    'utf-8'
+                )
+            if attr in CACHED_BYTES_ATTRIBUTES:
+                return _cached_bytes_getter(attr, field_format)
+            return lambda r: (field_format % (getattr(r, attr),)).encode('utf-8')
+        if attr == 'asctime':
+            return self.format_time_bytes
+        if attr == 'message' and conversion == 's':
+            return lambda r: r.message.encode('utf-8')
+        if conversion in ('a', 'r'):
+            func = ascii if conversion == 'a' else repr
+            return lambda r: func(getattr(r, attr)).encode('utf-8')
+        if attr in CACHED_BYTES_ATTRIBUTES:
+            return _cached_bytes_getter(attr)
+        return lambda r: str(getattr(r, attr)).encode('utf-8')
+
+    def format_bytes(
+        self, record: logging.LogRecord, prefix: bytes | None = b'', suffix: bytes | None = b''
+    ) -> bytes:
+        """Return the UTF-8 encoded formatted record with the prefix and suffix.
+
+        The fields are encoded (the logger name, level name, and asctime are cached) and
+        joined with the prefix (e.g., the syslog header) and suffix (e.g., the terminator) by
+        a single bytes template, so no str is created for the formatted record and no
+        concatenation copies are made.
+
+        Args:
+            record: The log record.
+            prefix: The bytes before the formatted record.
+            suffix: The bytes after the formatted record.
+        """
+        if record.exc_info or record.exc_text or record.stack_info:
+            # the exception and stack text are appended by the str path
+            return prefix + self.format(record).encode('utf-8') + suffix
+        record.message = record.getMessage()
+        template, getters = self._bytes_plan
+        # a single list and tuple (a comprehension and unpacking would add a second list)
+        values = [prefix]
+        for getter in getters:
+            values.append(getter(record))
+        values.append(suffix)
+        return template % tuple(values)
+
+
+class StructuredFormatter(CachedTimeMixin, logging.Formatter):
+    """Formatter that outputs JSON or logfmt using a field plan compiled at construction.
+
+    Only the requested fields are computed for each record (e.g., asctime is only
+    formatted when it is part of the field list).
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str] | list[str] | None = None,
+        output: str | None = 'json',
+        datefmt: str | None = None,
+        static_fields: dict | None = None,
+        json_backend: str | None = 'auto',
+    ):
+        """Initialize class properties.
+
+        Args:
+            fields: The record attributes to output. A dict maps the output key to the record
+                attribute, while a list uses the attribute name as the output key.
+            output: The output format (json or logfmt).
+            datefmt: The date format for the asctime field.
+            static_fields: Fields added to every record (e.g., app name or environment).
+            json_backend: The JSON backend (auto, orjson, or stdlib). The auto backend uses
+                orjson when installed.
+        """
+        if output not in ('json', 'logfmt'):
+            raise RuntimeError(f'{output} is not a valid structured output.')
+        if json_backend == 'orjson' and orjson is None:  # pragma: no cover
+            raise RuntimeError('The orjson package is required for the orjson backend.')
+        if json_backend not in ('auto', 'orjson', 'stdlib'):
+            raise RuntimeError(f'{json_backend} is not a valid json backend.')
+
+        logging.Formatter.__init__(self, datefmt=datefmt)
+        fields = fields or DEFAULT_FIELDS
+        if isinstance(fields, list):
+            fields = {f: f for f in fields}
+
+        self.fields = fields
+        self.output = output
+        self.static_fields = static_fields or {}
+
+        # properties
+        self._dumps = _json_dumps_stdlib
+        if json_backend != 'stdlib' and orjson is not None:
+            self._dumps = _json_dumps_orjson
+        self._plan: list[tuple[str, Callable]] = [
+            (key, self._compile_field(attr)) for key, attr in fields.items()
+        ]
+        self.uses_caller = any(attr in CALLER_ATTRIBUTES for attr in fields.values())
+        # the records are serialized by format_bytes without a str copy (orjson returns bytes)
+        self.bytes_native = True
+
+    def _compile_field(self, attr: str) -> Callable:
+        """Return a function that resolves the attribute value from a record.
+
+        Args:
+            attr: The record attribute name.
+        """
+        if attr == 'asctime':
+            return lambda r: self.formatTime(r, self.datefmt)
+        if attr == 'message':
+            return lambda r: r.getMessage()
+        return lambda r: getattr(r, attr, None)
+
+    def _exception_fields(self, record: logging.LogRecord) -> dict:
+        """Return the exception and stack fields for the record.
+
+        Args:
+            record: The log record.
+        """
+        data = {}
+        if record.exc_info:
+            # cache the traceback text to avoid converting it multiple times
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data['exc_info'] = record.exc_text
+        if record.stack_info:
+            data['stack_info'] = self.formatStack(record.stack_info)
+        return data
+
+    def _record_data(self, record: logging.LogRecord) -> dict:
+        """Return the output fields for the record using the compiled field plan.
+
+        Args:
+            record: The log record.
+        """
+        data = {key: getter(record) for key, getter in self._plan}
+        if self.static_fields:
+            data.update(self.static_fields)
+        if record.exc_info or record.exc_text or record.stack_info:
+            data.update(self._exception_fields(record))
+        return data
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record using the compiled field plan.
+
+        Args:
+            record: The log record.
+        """
+        data = self._record_data(record)
+        if self.output == 'logfmt':
+            return ' '.join(f'{k}={_logfmt_value(v)}' for k, v in data.items())
+        return self._dumps(data)
+
+    def format_bytes(
+        self, record: logging.LogRecord, prefix: bytes | None = b'', suffix: bytes | None = b''
+    ) -> bytes:
+        """Return the UTF-8 encoded formatted record with the prefix and suffix.
+
+        Args:
+            record: The log record.
+            prefix: The bytes before the formatted record.
+            suffix: The bytes after the formatted record.
+        """
+        if self.output == 'json' and self._dumps is _json_dumps_orjson:
+            return b'%b%b%b' % (
+                prefix,
+                orjson.dumps(self._record_data(record), default=str),
+                suffix,
+            )
+        return b'%b%b%b' % (prefix, self.format(record).encode('utf-8'), suffix)
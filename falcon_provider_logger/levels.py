@@ -0,0 +1,212 @@
+"""Falcon logger runtime level module."""
+# standard library
+import logging
+import threading
+import time
+
+# first-party
+from falcon_provider_logger.fork import register_fork_reinit
+from falcon_provider_logger.utils import get_level
+
+
+class LevelController:
+    """Change the logger and handler levels at runtime.
+
+    The level of a logger and its handlers are changed together under a lock, so
+    concurrent changes can't leave a logger and its handlers at different levels. Changing a
+    logger level clears the enabled level cache of all loggers (used by the LoggerFacade
+    checks), so every thread sees the new level on the next record.
+
+    A change can be time-boxed with a duration, after which the levels that were set before
+    the first pending change are restored.
+    """
+
+    def __init__(self):
+        """Initialize class properties."""
+        self._handlers: dict[str, list[logging.Handler]] = {}
+        self._lock = threading.Lock()
+        # logger name -> (timer, expires, saved levels)
+        self._pending: dict[str, tuple[threading.Timer, float, tuple]] = {}
+        register_fork_reinit(self)
+
+    def _get_logger(self, name: str) -> logging.Logger:
+        """Return the registered or existing logger without creating a new logger.
+
+        Args:
+            name: The logger name.
+
+        Raises:
+            RuntimeError: The logger doesn't exist.
+        """
+        if not self.exists(name):
+            raise RuntimeError(f'{name} is not a registered or existing logger.')
+        return logging.getLogger(name)
+
+    def _handlers_for(self, name: str) -> list[logging.Handler]:
+        """Return the handlers that are changed with the logger level.
+
+        Args:
+            name: The logger name.
+        """
+        if name in self._handlers:
+            return self._handlers[name]
+        return self._get_logger(name).handlers
+
+    def _expire(self, name: str) -> None:
+        """Restore the saved levels when the time-boxed change expires (timer thread).
+
+        Args:
+            name: The logger name.
+        """
+        with self._lock:
+            pending = self._pending.get(name)
+            if pending is None or pending[0] is not threading.current_thread():
+                # the change was replaced or restored while the timer was waiting on the lock
+                return
+            del self._pending[name]
+            self._restore(name, pending[2])
+
+    @staticmethod
+    def _restore(name: str, saved: tuple) -> None:
+        """Restore the saved logger and handler levels (lock must be held).
+
+        Args:
+            name: The logger name.
+            saved: The saved logger level and handler levels.
+        """
+        logger_level, handler_levels = saved
+        for h, level in handler_levels:
+            h.setLevel(level)
+        logging.getLogger(name).setLevel(logger_level)
+
+    def _save(self, name: str) -> tuple:
+        """Return the current logger and handler levels.
+
+        Args:
+            name: The logger name.
+        """
+        handler_levels = [(h, h.level) for h in self._handlers_for(name)]
+        return self._get_logger(name).level, handler_levels
+
+    def _start_timer(self, name: str, duration: float) -> threading.Timer:
+        """Return a started timer that restores the saved levels after the duration.
+
+        Args:
+            name: The logger name.
+            duration: The number of seconds before the saved levels are restored.
+        """
+        timer = threading.Timer(duration, self._expire, args=(name,))
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def exists(self, name: str) -> bool:
+        """Return True if the logger is registered or was already created.
+
+        The name is checked without calling logging.getLogger, which would create (and
+        never release) a logger for any name.
+
+        Args:
+            name: The logger name.
+        """
+        if name in self._handlers or name == logging.root.name:
+            return True
+        return isinstance(logging.root.manager.loggerDict.get(name), logging.Logger)
+
+    def levels(self, name: str) -> dict:
+        """Return the logger and handler levels.
+
+        Args:
+            name: The logger name.
+        """
+        logger = self._get_logger(name)
+        with self._lock:
+            pending = self._pending.get(name)
+            return {
+                'name': name,
+                'level': logging.getLevelName(logger.level),
+                'effective_level': logging.getLevelName(logger.getEffectiveLevel()),
+                'handlers': {
+                    h.name or type(h).__name__: logging.getLevelName(h.level)
+                    for h in self._handlers_for(name)
+                },
+                'expires_in': None if pending is None else max(0.0, pending[1] - time.monotonic()),
+            }
+
+    def reinit_after_fork(self) -> None:
+        """Reset the lock and restart the timers of the time-boxed changes in the child."""
+        self._lock = threading.Lock()
+        with self._lock:
+            for name, (_, expires, saved) in list(self._pending.items()):
+                timer = self._start_timer(name, max(0.0, expires - time.monotonic()))
+                self._pending[name] = (timer, expires, saved)
+
+    def register(self, logger: logging.Logger, handlers: list[logging.Handler]) -> None:
+        """Register the handlers that are changed with the logger level.
+
+        By default the handlers attached to the logger are changed. The middleware registers
+        the actual handlers when they are behind a queue.
+
+        Args:
+            logger: The logger instance.
+            handlers: The logging handlers.
+        """
+        with self._lock:
+            self._handlers[logger.name] = list(handlers)
+
+    def registered(self) -> list[str]:
+        """Return the names of the registered loggers."""
+        with self._lock:
+            return sorted(self._handlers)
+
+    def restore(self, name: str) -> None:
+        """Cancel a time-boxed change and restore the levels immediately.
+
+        Args:
+            name: The logger name.
+        """
+        with self._lock:
+            pending = self._pending.pop(name, None)
+            if pending is not None:
+                pending[0].cancel()
+                self._restore(name, pending[2])
+
+    def set_level(
+        self,
+        name: str,
+        level: int | str,
+        handlers: bool | None = True,
+        duration: float | None = None,
+    ) -> None:
+        """Set the logger level and optionally the handler levels.
+
+        Args:
+            name: The logger name.
+            level: The new logging level.
+            handlers: If True, the handler levels are also changed.
+            duration: The number of seconds before the previous levels are restored.
+        """
+        level = get_level(level)
+        logger = self._get_logger(name)
+        with self._lock:
+            pending = self._pending.pop(name, None)
+            if pending is not None:
+                # keep the levels saved before the first time-boxed change
+                pending[0].cancel()
+                saved = pending[2]
+            else:
+                saved = self._save(name)
+
+            if handlers is True:
+                for h in self._handlers_for(name):
+                    h.setLevel(level)
+            # setLevel clears the level cache of every logger under the logging lock
+            logger.setLevel(level)
+
+            if duration:
+                timer = self._start_timer(name, duration)
+                self._pending[name] = (timer, time.monotonic() + duration, saved)
+
+
+# the default level controller used by the middleware and the log level resource
+level_controller = LevelController()
@@ -0,0 +1,386 @@
+"""Falcon logger metrics module."""
+# standard library
+import bisect
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Callable
+
+# first-party
+from falcon_provider_logger.fork import register_fork_reinit
+
+# the histogram bucket upper bounds in seconds
+LATENCY_BUCKETS = (
+    0.000_01,
+    0.000_025,
+    0.000_05,
+    0.000_1,
+    0.000_25,
+    0.000_5,
+    0.001,
+    0.002_5,
+    0.005,
+    0.01,
+    0.025,
+    0.1,
+    1.0,
+)
+
+# the prefix of the Prometheus metric names
+PROMETHEUS_PREFIX = 'falcon_logger_'
+
+
+class MetricsShard:
+    """The counters and histograms updated by a single thread."""
+
+    __slots__ = ('counters', 'histograms')
+
+    def __init__(self):
+        """Initialize class properties."""
+        # (name, level) -> count
+        self.counters: dict[tuple[str, str | None], int] = {}
+        # name -> [bucket counts..., +Inf count, sum]
+        self.histograms: dict[str, list] = {}
+
+    def merge(self, shard: 'MetricsShard') -> None:
+        """Add the counters and histograms of another shard.
+
+        Args:
+            shard: The shard to merge.
+        """
+        for key, value in shard.counters.copy().items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for name, values in shard.histograms.copy().items():
+            histogram = self.histograms.setdefault(name, [0] * (len(values) - 1) + [0.0])
+            for i, value in enumerate(values.copy()):
+                histogram[i] += value
+
+
+class Metrics:
+    """Counters, histograms, and gauges for a handler or the middleware.
+
+    Each thread updates its own shard of counters and histograms, so recording a value is a
+    dict update without a lock (the lock is only taken the first time a thread records a
+    value). The snapshot sums the shards of all threads and merges the shards of threads
+    that have exited.
+
+    Gauges and counters that are already tracked by a handler (e.g., the queue depth or the
+    syslog reconnects) are registered as callbacks that are only called by snapshot().
+    """
+
+    def __init__(
+        self,
+        name: str,
+        buckets: tuple[float, ...] | None = LATENCY_BUCKETS,
+        registry: 'MetricsRegistry | None' = None,
+    ):
+        """Initialize class properties.
+
+        Args:
+            name: The metrics name (e.g., the handler name).
+            buckets: The histogram bucket upper bounds in seconds.
+            registry: The registry used by the metrics resource. Defaults to the module
+                registry.
+        """
+        self.name = name
+        self.buckets = tuple(sorted(buckets))
+
+        # properties
+        self._callbacks: dict[str, tuple[str, Callable[[], float]]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._retired = MetricsShard()
+        self._shards: list[tuple[weakref.ref, MetricsShard]] = []
+
+        (registry or metrics_registry).register(self)
+        register_fork_reinit(self)
+
+    def _shard(self) -> MetricsShard:
+        """Return the shard of the current thread."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = MetricsShard()
+            with self._lock:
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+            return shard
+
+    def _totals(self) -> MetricsShard:
+        """Return the sum of all shards, retiring the shards of threads that have exited."""
+        totals = MetricsShard()
+        with self._lock:
+            live = []
+            for thread_ref, shard in self._shards:
+                thread = thread_ref()
+                if thread is None or not thread.is_alive():
+                    # the thread no longer updates the shard
+                    self._retired.merge(shard)
+                else:
+                    live.append((thread_ref, shard))
+            self._shards = live
+            totals.merge(self._retired)
+            for _, shard in live:
+                totals.merge(shard)
+        return totals
+
+    def callback(self, name: str, func: Callable[[], float], kind: str | None = 'gauge') -> None:
+        """Register a value that is read when a snapshot is taken.
+
+        Args:
+            name: The metric name.
+            func: A callable that returns the current value.
+            kind: The metric type (counter or gauge).
+        """
+        self._callbacks[name] = (kind, func)
+
+    def inc(self, name: str, level: str | None = None, value: int | None = 1) -> None:
+        """Increment a counter for the current thread.
+
+        Args:
+            name: The counter name.
+            level: The optional level name label.
+            value: The amount to add.
+        """
+        counters = self._shard().counters
+        key = (name, level)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """Add a value to a histogram for the current thread.
+
+        Args:
+            name: The histogram name.
+            value: The observed value in seconds.
+        """
+        histograms = self._shard().histograms
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = [0] * (len(self.buckets) + 1) + [0.0]
+        histogram[bisect.bisect_left(self.buckets, value)] += 1
+        histogram[-1] += value
+
+    def reinit_after_fork(self) -> None:
+        """Reset the counters and histograms in the child process.
+
+        Each process reports its own metrics, so the counts of the parent are not repeated
+        by every child.
+        """
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._retired = MetricsShard()
+        self._shards = []
+
+    def snapshot(self) -> dict:
+        """Return the current counter, histogram, and gauge values.
+
+        Counters with a level are returned as a mapping of level name to count. Histogram
+        buckets are cumulative, as in the Prometheus format.
+        """
+        totals = self._totals()
+        counters: dict = {}
+        for (name, level), value in sorted(totals.counters.items(), key=str):
+            if level is None:
+                counters[name] = value
+            else:
+                counters.setdefault(name, {})[level] = value
+
+        histograms = {}
+        for name, values in sorted(totals.histograms.items()):
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self.buckets + ('+Inf',), values):
+                cumulative += count
+                buckets[bound] = cumulative
+            histograms[name] = {'buckets': buckets, 'count': cumulative, 'sum': values[-1]}
+
+        gauges = {}
+        for name, (kind, func) in sorted(self._callbacks.items()):
+            if kind == 'counter':
+                counters[name] = func()
+            else:
+                gauges[name] = func()
+        return {'counters': counters, 'gauges': gauges, 'histograms': histograms}
+
+
+class MetricsFilter(logging.Filter):
+    """Logger filter that counts the records logged per level and never filters records."""
+
+    def __init__(self, metrics: Metrics):
+        """Initialize class properties.
+
+        Args:
+            metrics: The metrics that count the records.
+        """
+        logging.Filter.__init__(self)
+        self.metrics = metrics
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Count the record.
+
+        Args:
+            record: The log record.
+        """
+        self.metrics.inc('records_logged_total', record.levelname)
+        return True
+
+
+class MetricsRegistry:
+    """The metrics exposed by the metrics resource.
+
+    The metrics are held by weak reference, so the metrics of a handler that is no longer
+    used are removed from the registry.
+    """
+
+    def __init__(self):
+        """Initialize class properties."""
+        self._metrics: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def metrics(self) -> list[Metrics]:
+        """Return the registered metrics sorted by name."""
+        return [self._metrics[name] for name in sorted(self._metrics.keys())]
+
+    def prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        samples: dict[str, tuple[str, list[str]]] = {}
+        for metrics in self.metrics():
+            _prometheus_samples(metrics.name, metrics.snapshot(), samples)
+
+        lines = []
+        for name, (kind, values) in sorted(samples.items()):
+            lines.append(f'# TYPE {name} {kind}')
+            lines.extend(values)
+        return '\n'.join(lines) + '\n'
+
+    def register(self, metrics: Metrics) -> None:
+        """Register the metrics, adding a numeric suffix to the name if it is already used.
+
+        Handlers of the same type share a default name (e.g., "rfh"), so the metrics of
+        another handler are never replaced.
+
+        Args:
+            metrics: The metrics instance.
+        """
+        name = metrics.name
+        suffix = 1
+        while self._metrics.get(metrics.name) not in (None, metrics):
+            suffix += 1
+            metrics.name = f'{name}-{suffix}'
+        self._metrics[metrics.name] = metrics
+
+    def snapshot(self) -> dict:
+        """Return the snapshot of all registered metrics by name."""
+        return {metrics.name: metrics.snapshot() for metrics in self.metrics()}
+
+
+def _prometheus_labels(**labels) -> str:
+    """Return the Prometheus labels for the sample.
+
+    Args:
+        labels: The label names and values.
+    """
+    values = []
+    for key, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        values.append(f'{key}="{value}"')
+    return '{' + ','.join(values) + '}'
+
+
+def _prometheus_samples(source: str, snapshot: dict, samples: dict) -> None:
+    """Add the Prometheus samples of the metrics snapshot, grouped by metric name.
+
+    Args:
+        source: The metrics name, used as the source label.
+        snapshot: The metrics snapshot.
+        samples: The metric name -> (type, sample lines) mapping to update.
+    """
+    for name, value in snapshot['counters'].items():
+        lines = samples.setdefault(PROMETHEUS_PREFIX + name, ('counter', []))[1]
+        values = value if isinstance(value, dict) else {None: value}
+        for level, count in values.items():
+            labels = {'source': source} if level is None else {'source': source, 'level': level}
+            lines.append(f'{PROMETHEUS_PREFIX}{name}{_prometheus_labels(**labels)} {count}')
+
+    for name, value in snapshot['gauges'].items():
+        labels = _prometheus_labels(source=source)
+        samples.setdefault(PROMETHEUS_PREFIX + name, ('gauge', []))[1].append(
+            f'{PROMETHEUS_PREFIX}{name}{labels} {value}'
+        )
+
+    for name, histogram in snapshot['histograms'].items():
+        metric = PROMETHEUS_PREFIX + name
+        lines = samples.setdefault(metric, ('histogram', []))[1]
+        for bound, count in histogram['buckets'].items():
+            lines.append(f'{metric}_bucket{_prometheus_labels(source=source, le=bound)} {count}')
+        labels = _prometheus_labels(source=source)
+        lines.append(f'{metric}_count{labels} {histogram["count"]}')
+        lines.append(f'{metric}_sum{labels} {histogram["sum"]}')
+
+
+def _instrument_handle(handler: logging.Handler, metrics: Metrics) -> None:
+    """Measure the handle latency of a handler that doesn't support metrics directly.
+
+    The handle method is overridden on the handler instance, so the format and emit
+    latency are measured together.
+
+    Args:
+        handler: The logging handler.
+        metrics: The handler metrics.
+    """
+    handle = handler.handle
+
+    def _handle(record: logging.LogRecord) -> bool:
+        """Handle the record and record the metrics."""
+        start = time.perf_counter()
+        rv = handle(record)
+        if rv:
+            metrics.observe('emit_seconds', time.perf_counter() - start)
+            metrics.inc('records_emitted_total', record.levelname)
+        else:
+            metrics.inc('records_dropped_total', record.levelname)
+        return rv
+
+    handler.handle = _handle
+
+
+def instrument_handler(
+    handler: logging.Handler, name: str | None = None, registry: MetricsRegistry | None = None
+) -> Metrics:
+    """Add metrics to the handler and return the metrics.
+
+    Handlers that format outside of the handler lock (the rotating, mmap, and syslog
+    handlers) record the records emitted and dropped (filtered) per level, the bytes
+    written, and the format and emit latency. Other handlers record the records emitted and
+    dropped per level and the handle latency. The rotations, reconnects, dropped
+    (undeliverable), spooled, and replayed records that the handler tracks are reported when
+    a snapshot is taken.
+
+    Args:
+        handler: The logging handler.
+        name: The metrics name. Defaults to the handler name.
+        registry: The registry used by the metrics resource. Defaults to the module registry.
+    """
+    metrics = getattr(handler, 'metrics', None)
+    if metrics is not None:
+        # the handler is already instrumented
+        return metrics
+
+    metrics = Metrics(
+        name or handler.name or f'{type(handler).__name__}-{id(handler)}', registry=registry
+    )
+    if not hasattr(handler, 'write_encoded'):
+        _instrument_handle(handler, metrics)
+    handler.metrics = metrics
+
+    for attribute, metric in [
+        ('dropped', 'send_dropped_total'),
+        ('reconnects', 'reconnects_total'),
+        ('replayed', 'records_replayed_total'),
+        ('spooled', 'records_spooled_total'),
+    ]:
+        if hasattr(handler, attribute):
+            metrics.callback(metric, lambda a=attribute: getattr(handler, a), kind='counter')
+    return metrics
+
+
+# the default registry used by the metrics resource
+metrics_registry = MetricsRegistry()
@@ -1,6 +1,35 @@
 """Falcon logger middleware module."""
 # standard library
+import asyncio
+import atexit
 import logging
+import queue
+
+# third-party
+from falcon import http_status_to_code
+
+# first-party
+from falcon_provider_logger.access import AccessLogger
+from falcon_provider_logger.aio import AsyncHandler
+from falcon_provider_logger.config import load_config, read_config
+from falcon_provider_logger.context import (
+    RequestContextFilter,
+    clear_request_context,
+    get_request_context,
+    set_request_context,
+)
+from falcon_provider_logger.facade import LoggerFacade
+from falcon_provider_logger.flight_recorder import FlightRecorderHandler
+from falcon_provider_logger.fork import register_fork_reinit
+from falcon_provider_logger.levels import level_controller
+from falcon_provider_logger.metrics import Metrics, MetricsFilter, instrument_handler
+from falcon_provider_logger.utils import (
+    QueueHandlerCustom,
+    QueueListenerCustom,
+    disable_caller_lookup,
+    get_level,
+    handlers_use_caller,
+)
 
 
 class LoggerMiddleware:
@@ -12,6 +41,17 @@ class LoggerMiddleware:
         level: str | None = 'DEBUG',
         name: str | None = 'SERVER',
         logger: logging.Logger | None = None,
+        use_queue: bool | None = False,
+        queue_size: int | None = 10_000,
+        queue_overflow: str | None = 'block',
+        caller_lookup: bool | str | None = True,
+        request_context: bool | None = False,
+        request_id_header: str | None = 'X-Request-ID',
+        access_log: bool | None = False,
+        access_log_level: str | None = 'INFO',
+        access_log_routes: dict[str, bool | float] | None = None,
+        access_log_sample_rate: float | None = 1.0,
+        metrics: bool | None = False,
     ):
         """Initialize class properties.
 
@@ -20,6 +60,26 @@ class LoggerMiddleware:
             level: The logger level.
             name: The logger name as displayed in the log file.
             logger: A pre-configured logger instance.
+            use_queue: If True, route all handlers through a queue so handler I/O is
+                performed on a background thread instead of the request thread.
+            queue_size: The maximum number of records held in the queue.
+            queue_overflow: The policy when the queue is full (block, count-and-drop,
+                drop-newest, or drop-oldest).
+            caller_lookup: If False, disable the stack walk that finds the caller
+                (module/funcName/lineno) of each record. If "auto", disable it when none of
+                the handler formatters use the caller info.
+            request_context: If True, add the request context fields (request_id, method,
+                path, route, and remote_addr) to each record logged during a request.
+            request_id_header: The request header that provides the request id. When the
+                header is not present a random request id is generated.
+            access_log: If True, log one record per request with the method, path, status,
+                response bytes, and latency to the "<name>.access" child logger.
+            access_log_level: The level of the access log records.
+            access_log_routes: A mapping of route (URI template) to a sample rate, or False
+                to disable the access log for the route.
+            access_log_sample_rate: The fraction (0.0 - 1.0) of requests that are logged.
+            metrics: If True, record the records logged per level and the queue depth under
+                the logger name, and the metrics of each handler under the handler name.
         """
         handlers: list = handlers or []
 
@@ -32,10 +92,142 @@ class LoggerMiddleware:
             self.log: object = logging.getLogger(name)
             self.log.setLevel(self.get_level(level))
 
+        # properties
+        self.handlers: list = handlers
+        self.flight_recorder = any(isinstance(h, FlightRecorderHandler) for h in handlers)
+        # the flight recorders that buffer the records per request
+        self.request_recorders = [
+            h for h in handlers if isinstance(h, FlightRecorderHandler) and h.per_request
+        ]
+        # the logger provided to resources, with cached level checks
+        self.log_facade = LoggerFacade(self.log)
+        self.request_context = request_context
+        self.request_id_header = request_id_header
+        self.access_logger: AccessLogger | None = None
+        if access_log is True:
+            self.access_logger = AccessLogger(
+                self.log.getChild('access'),
+                level=self.get_level(access_log_level),
+                sample_rate=access_log_sample_rate,
+                routes=access_log_routes,
+            )
+        # the loggers the filters are added to, the access log records don't pass through the
+        # filters of the parent logger
+        self.loggers: list[logging.Logger] = [self.log]
+        if self.access_logger is not None:
+            self.loggers.append(self.access_logger.logger)
+
+        if caller_lookup is False or (
+            caller_lookup == 'auto' and not self._caller_required(handlers)
+        ):
+            for log in self.loggers:
+                disable_caller_lookup(log)
+
+        self.queue_handler: QueueHandlerCustom | None = None
+        self.queue_listener: QueueListenerCustom | None = None
+
+        if use_queue is True and handlers:
+            self.queue_handler = QueueHandlerCustom(
+                queue.Queue(maxsize=queue_size), overflow=queue_overflow
+            )
+            self.queue_listener = QueueListenerCustom(
+                self.queue_handler.queue, *handlers, respect_handler_level=True
+            )
+            self.queue_listener.start()
+            atexit.register(self.shutdown)
+            register_fork_reinit(self)
+            handlers = [self.queue_handler]
+
         for h in handlers:
             # add logging handlers
             self.log.addHandler(h)
 
+        # the handler levels are changed with the logger level by the LogLevelResource
+        level_controller.register(self.log, self.handlers)
+
+        if request_context is True:
+            # the filter runs on the logging thread, so the context is always correct
+            for log in self.loggers:
+                log.addFilter(RequestContextFilter())
+
+        self.metrics: Metrics | None = None
+        if metrics is True:
+            self._init_metrics()
+
+    @classmethod
+    def from_config(cls, config: dict | str | None = None) -> 'LoggerMiddleware':
+        """Return a middleware instance configured from a dict, a TOML/JSON file, or the env.
+
+        The handlers are validated when the config is loaded, but are only built (opening
+        files and sockets) when the first record is handled. Identical handler specs share
+        one handler, so multiple apps in a process share the file descriptors and sockets.
+
+        Args:
+            config: The config dict, a config file path or inline JSON string. Defaults to
+                the FALCON_LOGGER_CONFIG environment variable.
+        """
+        if not isinstance(config, dict):
+            config = read_config(config)
+        return cls(**load_config(config))
+
+    def _caller_required(self, handlers: list) -> bool:
+        """Return True if any handler that receives records from the logger uses caller info.
+
+        Args:
+            handlers: The handlers being added to the logger.
+        """
+        if self.log.propagate and logging.getLogger().handlers:
+            # the root logger handlers could use the caller info
+            return True
+        return handlers_use_caller(handlers + self.log.handlers)
+
+    def _init_metrics(self) -> None:
+        """Record the logger, queue, and handler metrics."""
+        self.metrics = Metrics(self.log.name)
+        # the filter counts the records on the logging thread without a lock
+        metrics_filter = MetricsFilter(self.metrics)
+        for log in self.loggers:
+            log.addFilter(metrics_filter)
+        if self.queue_handler is not None:
+            queue_handler = self.queue_handler
+            self.metrics.callback('queue_depth', queue_handler.qsize)
+            self.metrics.callback('queue_dropped_total', lambda: queue_handler.dropped, 'counter')
+        for h in self.handlers:
+            instrument_handler(h)
+
+    def _discard_request(self) -> None:
+        """Discard the buffered flight recorder records of the succeeded request."""
+        context = get_request_context()
+        if context is None:
+            return
+        if self.queue_listener is not None:
+            # the marker is handled in order with the queued records of the request
+            marker = logging.makeLogRecord(
+                {'name': self.log.name, 'flight_recorder_discard': context['request_id']}
+            )
+            self.queue_handler.enqueue(marker)
+            return
+        for h in self.request_recorders:
+            h.discard(context['request_id'])
+
+    def _log_failed_request(self, req: object, resp: object) -> None:
+        """Log the failed request, which dumps the buffered flight recorder records.
+
+        Args:
+            req: The Falcon request object.
+            resp: The Falcon response object.
+        """
+        status = http_status_to_code(resp.status)
+        if status >= 500:
+            # the record is handled in order with the buffered records (e.g., behind a queue)
+            self.log.error(
+                'Request failed: %s %s %s',
+                req.method,
+                req.path,
+                status,
+                extra={'flight_recorder_dump': True},
+            )
+
     @staticmethod
     def get_level(level: str) -> int:
         """Return proper logging level.
@@ -49,13 +241,99 @@ class LoggerMiddleware:
         Returns:
             int: The logging level as an int.
         """
-        if not isinstance(level, int):
-            level = logging.getLevelName(level.upper())
-            if not isinstance(level, int):  # pragma: no cover
-                # only valid levels will return a int. invalid numbers don't throw an exception.
-                raise RuntimeError('Invalid logging level.')
-        return level
+        return get_level(level)
+
+    def reinit_after_fork(self) -> None:
+        """Start a queue listener for the new queue in the child process.
+
+        The handlers and the queue handler are reinitialized before the middleware.
+        """
+        if self.queue_listener is None:
+            # the queue was shut down before the fork
+            return
+        self.queue_listener = QueueListenerCustom(
+            self.queue_handler.queue, *self.handlers, respect_handler_level=True
+        )
+        self.queue_listener.start()
+
+    def shutdown(self) -> None:
+        """Flush all queued records to the handlers and stop the queue listener.
+
+        This method is registered with atexit when the queue is enabled, but can be
+        called directly (e.g., from a server shutdown hook). Records logged after the
+        shutdown are written directly to the handlers, since nothing drains the queue.
+        """
+        if self.queue_listener is None:
+            return
+
+        # the handlers replace the queue handler before the queue is drained, so a record
+        # logged after the shutdown can't block on a full queue
+        for h in self.handlers:
+            self.log.addHandler(h)
+        self.log.removeHandler(self.queue_handler)
+
+        # stop() enqueues a sentinel and waits for all queued records to be handled
+        listener: QueueListenerCustom = self.queue_listener
+        self.queue_listener = None
+        listener.stop()
+        for h in listener.handlers:
+            h.flush()
+
+    def process_request(self, req, resp):  # pylint: disable=unused-argument
+        """Process request method."""
+        if self.request_context is True:
+            set_request_context(req, self.request_id_header)
+        if self.access_logger is not None:
+            self.access_logger.start(req)
+
+    async def process_request_async(self, req, resp):
+        """Process request method for ASGI apps."""
+        self.process_request(req, resp)
 
     def process_resource(self, req, resp, resource, params):  # pylint: disable=unused-argument
         """Process resource method."""
-        resource.log = self.log
+        if self.request_context is True:
+            context = get_request_context()
+            if context is not None:
+                context['route'] = req.uri_template
+
+        # only write the shared resource attribute once
+        if getattr(resource, 'log', None) is not self.log_facade:
+            resource.log = self.log_facade
+
+    async def process_resource_async(self, req, resp, resource, params):
+        """Process resource method for ASGI apps."""
+        self.process_resource(req, resp, resource, params)
+
+    def process_response(  # pylint: disable=unused-argument
+        self, req, resp, resource, req_succeeded
+    ):
+        """Process response method."""
+        if self.flight_recorder is True and not req_succeeded:
+            self._log_failed_request(req, resp)
+        elif self.request_recorders and req_succeeded:
+            self._discard_request()
+        if self.access_logger is not None:
+            # logged before the request context is cleared, so the RequestContextFilter of the
+            # access logger adds the context to the record
+            self.access_logger.log(req, resp)
+        if self.request_context is True:
+            clear_request_context()
+
+    async def process_response_async(self, req, resp, resource, req_succeeded):
+        """Process response method for ASGI apps."""
+        self.process_response(req, resp, resource, req_succeeded)
+
+    async def process_shutdown(self, scope, event):  # pylint: disable=unused-argument
+        """Flush and close the asyncio handlers and the queue on ASGI app shutdown."""
+        for h in self.handlers:
+            if isinstance(h, AsyncHandler):
+                await h.aclose()
+        if self.queue_listener is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
+
+    async def process_startup(self, scope, event):  # pylint: disable=unused-argument
+        """Start the asyncio handlers on ASGI app startup."""
+        for h in self.handlers:
+            if isinstance(h, AsyncHandler):
+                await h.start()
@@ -0,0 +1,100 @@
+"""Falcon logger handler mixins module."""
+# standard library
+import logging
+import time
+
+
+class FormatOutsideLockMixin:
+    """Handler mixin that formats and encodes records before acquiring the handler lock.
+
+    The stdlib Handler.handle() holds the handler lock while the record is formatted and
+    written, so all logging threads serialize on the formatting. With this mixin the lock is
+    only held while the encoded record is written (or not at all when the write is thread
+    safe, e.g., a UDP datagram).
+
+    The handler must provide encode_record() and write_encoded(). Handlers build the encoded
+    record with encode_formatted(), which uses the bytes-native path of the formatter when
+    available (see CachedTimeFormatter.format_bytes).
+    """
+
+    # the optional handler metrics (see metrics.instrument_handler)
+    metrics = None
+
+    # if False, write_encoded() is called without holding the handler lock
+    write_requires_lock = True
+
+    def _handle_measured(self, record: logging.LogRecord) -> None:
+        """Encode and write the record, recording the latency and size in the metrics.
+
+        Args:
+            record: The log record.
+        """
+        metrics = self.metrics
+        start = time.perf_counter()
+        data = self.encode_record(record)
+        encoded = time.perf_counter()
+        self._write(data, record.levelno)
+        metrics.observe('emit_seconds', time.perf_counter() - encoded)
+        metrics.observe('format_seconds', encoded - start)
+        metrics.inc('records_emitted_total', record.levelname)
+        # the UDP handler encodes a record as a tuple of datagrams
+        metrics.inc(
+            'bytes_total', value=sum(map(len, data)) if isinstance(data, tuple) else len(data)
+        )
+
+    def _write(self, data: bytes, levelno: int) -> None:
+        """Write the encoded record, holding the lock if required.
+
+        Args:
+            data: The encoded record.
+            levelno: The record level.
+        """
+        if self.write_requires_lock:
+            self.acquire()
+            try:
+                self.write_encoded(data, levelno)
+            finally:
+                self.release()
+        else:
+            self.write_encoded(data, levelno)
+
+    def encode_formatted(
+        self, record: logging.LogRecord, prefix: bytes | None = b'', suffix: bytes | None = b''
+    ) -> bytes:
+        """Return the UTF-8 encoded formatted record with the prefix and suffix.
+
+        Formatters with a bytes-native path encode the fields and add the prefix and suffix
+        in a single operation, without the formatted str and the concatenation copies.
+
+        Args:
+            record: The log record.
+            prefix: The bytes before the formatted record (e.g., the syslog header).
+            suffix: The bytes after the formatted record (e.g., the terminator).
+        """
+        formatter = self.formatter
+        if getattr(formatter, 'bytes_native', False):
+            return formatter.format_bytes(record, prefix, suffix)
+        return prefix + self.format(record).encode('utf-8') + suffix
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Filter, encode, and write the record, holding the lock only for the write.
+
+        Args:
+            record: The log record.
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):  # pragma: no cover
+            # python 3.12+ filters can return a replacement record
+            record = rv
+        if not rv:
+            if self.metrics is not None:
+                self.metrics.inc('records_dropped_total', record.levelname)
+            return rv
+        try:
+            if self.metrics is None:
+                self._write(self.encode_record(record), record.levelno)
+            else:
+                self._handle_measured(record)
+        except Exception:
+            self.handleError(record)
+        return rv
@@ -0,0 +1,155 @@
+"""Falcon logger resources module."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_logger.levels import LevelController, level_controller
+from falcon_provider_logger.metrics import MetricsRegistry, metrics_registry
+
+# the content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class LogLevelResource:
+    """Admin resource to view and change the logger levels at runtime.
+
+    GET returns the levels of the logger in the "name" param or of all loggers registered by
+    the middleware. PUT sets the level from a JSON body (e.g., ``{"name": "SERVER", "level":
+    "DEBUG", "duration": 600}``), with an optional duration in seconds after which the
+    previous levels are restored. DELETE restores the previous levels of the logger in the
+    "name" param immediately. A name that isn't registered or an existing logger returns a
+    404 error, so a request can't create loggers.
+
+    The resource doesn't provide any authentication, so it should only be added to an app
+    that is protected by an auth middleware or only reachable on an admin interface.
+    """
+
+    def __init__(
+        self, controller: LevelController | None = None, max_duration: float | None = 3_600
+    ):
+        """Initialize class properties.
+
+        Args:
+            controller: The level controller. Defaults to the controller used by the
+                middleware.
+            max_duration: The max number of seconds for a time-boxed level change.
+        """
+        self.controller = controller or level_controller
+        self.max_duration = max_duration
+
+    def check_name(self, name: str) -> None:
+        """Raise a not found error unless the logger is registered or already exists.
+
+        Args:
+            name: The logger name.
+
+        Raises:
+            HTTPNotFound: The logger doesn't exist.
+        """
+        if not self.controller.exists(name):
+            raise falcon.HTTPNotFound(description=f'The logger {name} was not found.')
+
+    def get_levels(self, name: str | None) -> dict:
+        """Return the levels for the logger or all registered loggers.
+
+        Args:
+            name: The logger name.
+        """
+        if name is not None:
+            self.check_name(name)
+            return self.controller.levels(name)
+        return {'loggers': [self.controller.levels(n) for n in self.controller.registered()]}
+
+    def set_levels(self, media: dict) -> dict:
+        """Set the logger level from the request media and return the new levels.
+
+        Args:
+            media: The request media.
+
+        Raises:
+            HTTPBadRequest: Invalid name, level, or duration provided.
+        """
+        if not isinstance(media, dict) or not isinstance(media.get('name'), str):
+            raise falcon.HTTPBadRequest(description='A logger name is required.')
+        self.check_name(media['name'])
+        duration = media.get('duration')
+        if duration is not None and (
+            not isinstance(duration, (int, float)) or not 0 < duration <= self.max_duration
+        ):
+            raise falcon.HTTPBadRequest(
+                description=f'The duration must be between 0 and {self.max_duration} seconds.'
+            )
+        try:
+            self.controller.set_level(
+                media['name'],
+                media.get('level'),
+                handlers=media.get('handlers', True) is True,
+                duration=duration,
+            )
+        except (AttributeError, RuntimeError, TypeError) as ex:
+            raise falcon.HTTPBadRequest(description='Invalid logging level.') from ex
+        return self.controller.levels(media['name'])
+
+    def on_delete(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Restore the previous levels of a time-boxed change."""
+        name: str = req.get_param('name', required=True)
+        self.check_name(name)
+        self.controller.restore(name)
+        resp.media = self.controller.levels(name)
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Return the logger levels."""
+        resp.media = self.get_levels(req.get_param('name'))
+
+    def on_put(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Set the logger levels."""
+        resp.media = self.set_levels(req.get_media())
+
+
+class LogLevelResourceAsync(LogLevelResource):
+    """Admin resource to view and change the logger levels at runtime for ASGI apps."""
+
+    async def on_delete(self, req, resp) -> None:  # pylint: disable=invalid-overridden-method
+        """Restore the previous levels of a time-boxed change."""
+        LogLevelResource.on_delete(self, req, resp)
+
+    async def on_get(self, req, resp) -> None:  # pylint: disable=invalid-overridden-method
+        """Return the logger levels."""
+        LogLevelResource.on_get(self, req, resp)
+
+    async def on_put(self, req, resp) -> None:  # pylint: disable=invalid-overridden-method
+        """Set the logger levels."""
+        resp.media = self.set_levels(await req.get_media())
+
+
+class MetricsResource:
+    """Admin resource that returns the logging metrics.
+
+    GET returns all registered metrics in the Prometheus text format, or as JSON when the
+    "format" param is "json".
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None):
+        """Initialize class properties.
+
+        Args:
+            registry: The metrics registry. Defaults to the registry used by the handlers
+                and the middleware.
+        """
+        self.registry = registry or metrics_registry
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Return the metrics."""
+        if req.get_param('format') == 'json':
+            resp.media = self.registry.snapshot()
+            return
+        resp.content_type = PROMETHEUS_CONTENT_TYPE
+        resp.text = self.registry.prometheus()
+
+
+class MetricsResourceAsync(MetricsResource):
+    """Admin resource that returns the logging metrics for ASGI apps."""
+
+    async def on_get(self, req, resp) -> None:  # pylint: disable=invalid-overridden-method
+        """Return the metrics."""
+        MetricsResource.on_get(self, req, resp)
@@ -0,0 +1,628 @@
+"""Falcon logger rotating file handlers module."""
+# standard library
+import codecs
+import gzip
+import logging
+import os
+import queue
+import shutil
+import stat
+import sys
+import threading
+import time
+import traceback
+from logging.handlers import RotatingFileHandler
+
+# first-party
+from falcon_provider_logger.fork import register_fork_reinit, unregister_fork_reinit
+from falcon_provider_logger.mixins import FormatOutsideLockMixin
+
+try:
+    # standard library
+    import fcntl
+except ImportError:  # pragma: no cover
+    # fcntl is not available on windows
+    fcntl = None
+
+try:
+    # third-party
+    import zstandard
+except ImportError:  # pragma: no cover
+    # zstandard is an optional dependency
+    zstandard = None
+
+# the supported compression methods for rotated log files and the file extension
+COMPRESSION_EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+class BackupCompressor:
+    """Rotator/namer pair that compresses rotated log files on a background thread.
+
+    The rotator only renames the log file to a unique pending name, so a rollover is a
+    single rename on the logging thread. The background thread shifts the existing
+    backups and compresses the pending file into the first backup slot.
+    """
+
+    def __init__(self, method: str | None = 'gzip', backup_count: int | None = 0):
+        """Initialize class properties.
+
+        Args:
+            method: The compression method (gzip or zstd).
+            backup_count: The maximum number of compressed backup files.
+        """
+        if method not in COMPRESSION_EXTENSIONS:
+            raise RuntimeError(f'{method} is not a valid compression method.')
+        if method == 'zstd' and zstandard is None:  # pragma: no cover
+            raise RuntimeError('The zstandard package is required for zstd compression.')
+
+        self.backup_count = backup_count
+        self.extension = COMPRESSION_EXTENSIONS[method]
+        self.method = method
+
+        # properties
+        self._queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    def _compress(self, source: str, dest: str) -> None:
+        """Compress the source file to dest and remove the source file.
+
+        Args:
+            source: The uncompressed file.
+            dest: The compressed file name.
+        """
+        temp_dest = f'{dest}.tmp'
+        with open(source, 'rb') as src, self._open_compressed(temp_dest) as dst:
+            shutil.copyfileobj(src, dst, 1_048_576)
+        os.replace(temp_dest, dest)
+        os.remove(source)
+
+    def _open_compressed(self, filename: str) -> object:
+        """Return a writable compressed file object.
+
+        Args:
+            filename: The name of the compressed file.
+        """
+        if self.method == 'zstd':  # pragma: no cover
+            return zstandard.ZstdCompressor().stream_writer(open(filename, 'wb'))
+        return gzip.open(filename, 'wb')
+
+    def _shift(self, base_filename: str) -> None:
+        """Shift the compressed backups to make room for a new first backup.
+
+        Args:
+            base_filename: The name of the log file.
+        """
+        oldest = self.namer(f'{base_filename}.{self.backup_count}')
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for i in range(self.backup_count - 1, 0, -1):
+            sfn = self.namer(f'{base_filename}.{i}')
+            if os.path.exists(sfn):
+                os.replace(sfn, self.namer(f'{base_filename}.{i + 1}'))
+
+    def _worker(self) -> None:
+        """Shift and compress pending rotated files in order."""
+        while True:
+            base_filename, pending, dest = self._queue.get()
+            try:
+                self._shift(base_filename)
+                self._compress(pending, dest)
+            except OSError:  # pragma: no cover
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                self._queue.task_done()
+
+    def join(self) -> None:
+        """Block until all pending rotated files have been compressed."""
+        self._queue.join()
+
+    def namer(self, name: str) -> str:
+        """Return the name of a rotated log file.
+
+        Args:
+            name: The default rotated file name.
+        """
+        return f'{name}{self.extension}'
+
+    def reinit_after_fork(self) -> None:
+        """Reset the queue and worker thread in the child process.
+
+        The files rotated by the parent are compressed by the parent.
+        """
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    def rotator(self, source: str, dest: str) -> None:
+        """Rename the log file and queue it for background compression.
+
+        Args:
+            source: The log file name.
+            dest: The compressed name of the first backup file.
+        """
+        if not os.path.exists(source):
+            return
+        pending = f'{source}.{time.time_ns()}.pending'
+        os.rename(source, pending)
+        self._queue.put((source, pending, dest))
+
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    name='rfh-compressor', target=self._worker, daemon=True
+                )
+                self._thread.start()
+
+
+class RotatingFileHandlerCustom(FormatOutsideLockMixin, RotatingFileHandler):
+    """Customized Rotating handler that will ensure log directory path is created."""
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str | None = 'a',
+        maxBytes: int | None = 0,
+        backupCount: int | None = 0,
+        encoding: str | None = None,
+        delay: int | None = 0,
+        buffer_size: int | None = 0,
+        buffer_records: int | None = 0,
+        flush_interval: float | None = 1.0,
+        flush_level: int | None = logging.ERROR,
+        stat_interval: float | None = 1.0,
+        compress: str | None = None,
+    ):
+        """Create a customized RotatingFileHandler that supports creation of the full log path.
+
+        When buffer_size or buffer_records is set the handler collects formatted records
+        and writes them to the file with a single write/flush once a threshold is reached,
+        the flush interval expires, or a record at or above flush_level is logged.
+
+        The size of the log file is tracked in memory so each record is formatted and
+        encoded once, and the file is only stat'ed every stat_interval seconds to detect
+        the file being rotated or truncated externally.
+
+        When compress is set rotated files are compressed on a background thread and a
+        rollover is a single rename on the logging thread.
+
+        Args:
+            filename: The name of the logfile.
+            mode: The write mode for the file.
+            maxBytes: The max file size before rotating.
+            backupCount: The maximum number of backup files.
+            encoding: The log file encoding.
+            delay: The delay period.
+            buffer_size: The number of buffered bytes that triggers a write (0 disables).
+            buffer_records: The number of buffered records that triggers a write (0 disables).
+            flush_interval: The max number of seconds a record is held in the buffer.
+            flush_level: Records at or above this level are written immediately.
+            stat_interval: The number of seconds between checks for external rotation.
+            compress: The compression method (gzip or zstd) for rotated files.
+        """
+        if not os.path.exists(os.path.dirname(filename)):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        # file state properties (updated each time the stream is opened)
+        self.stat_interval = stat_interval or 0
+        self._stream_encoding: tuple[str, str] | None = None
+        self._stream_utf8 = False
+        self._file_id: tuple[int, int] | None = None
+        self._file_size = 0
+        self._next_stat = 0.0
+        self._regular_file = True
+
+        # compression properties
+        self.compressor: BackupCompressor | None = None
+        if compress is not None:
+            self.compressor = BackupCompressor(compress, backupCount)
+
+        RotatingFileHandler.__init__(self, filename, mode, maxBytes, backupCount, encoding, delay)
+
+        if self.compressor is not None:
+            self.namer = self.compressor.namer
+            self.rotator = self.compressor.rotator
+
+        # buffer properties
+        self.buffer_size = buffer_size or 0
+        self.buffer_records = buffer_records or 0
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._buffer: list[bytes] = []
+        self._buffer_len = 0
+        self._flush_event = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+        self._start_flush_thread()
+        register_fork_reinit(self)
+
+    @property
+    def buffered(self) -> bool:
+        """Return True if the handler buffers records."""
+        return bool(self.buffer_size or self.buffer_records)
+
+    def _buffer_full(self) -> bool:
+        """Return True if the buffer has reached a size or record threshold."""
+        return bool(
+            (self.buffer_size and self._buffer_len >= self.buffer_size)
+            or (self.buffer_records and len(self._buffer) >= self.buffer_records)
+        )
+
+    def _flush_buffer(self) -> None:
+        """Write all buffered records to the stream with a single write/flush."""
+        if not self._buffer:
+            return
+        if self.stream is None:
+            self.stream = self._open()
+        data = self._buffer[0] if len(self._buffer) == 1 else b''.join(self._buffer)
+        # all writes go through the binary layer, so the text layer never holds data
+        self.stream.buffer.write(data)
+        self.stream.buffer.flush()
+        self._file_size += len(data)
+        self._buffer.clear()
+        self._buffer_len = 0
+
+    def _flush_loop(self) -> None:
+        """Periodically write buffered records so no record waits longer than the interval."""
+        while not self._flush_event.wait(self.flush_interval):
+            self.flush()
+
+    def _open(self) -> object:
+        """Open the stream and reset the tracked file state.
+
+        Returns:
+            TextIOWrapper: The opened stream.
+        """
+        stream = RotatingFileHandler._open(self)
+        self._stream_encoding = (stream.encoding, stream.errors)
+        # the bytes-native path encodes as strict UTF-8
+        self._stream_utf8 = (
+            codecs.lookup(stream.encoding).name == 'utf-8' and stream.errors == 'strict'
+        )
+        st = os.fstat(stream.fileno())
+        self._file_id = (st.st_dev, st.st_ino)
+        self._file_size = st.st_size
+        self._next_stat = time.monotonic() + self.stat_interval
+        # see bpo-45401: never rollover anything other than regular files
+        self._regular_file = stat.S_ISREG(st.st_mode)
+        return stream
+
+    def _reopen(self) -> None:
+        """Write buffered records to the current stream and open the log file again."""
+        self._flush_buffer()
+        self.stream.close()
+        self.stream = self._open()
+
+    def _rollover(self) -> None:
+        """Rotate the log file.
+
+        When compression is enabled only the log file is renamed here, the backups are
+        shifted and compressed by the background thread.
+        """
+        if self.compressor is None:
+            RotatingFileHandler.doRollover(self)
+            return
+
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if self.backupCount > 0:
+            self.rotate(self.baseFilename, self.rotation_filename(f'{self.baseFilename}.1'))
+        if not self.delay:
+            self.stream = self._open()
+
+    def _should_rollover_size(self, msg_len: int) -> bool:
+        """Return True if writing the buffer plus the new message would exceed maxBytes.
+
+        Args:
+            msg_len: The length of the new encoded message.
+        """
+        if self.maxBytes <= 0 or not self._regular_file:
+            return False
+        if self._file_size + self._buffer_len + msg_len < self.maxBytes:
+            return False
+
+        # confirm the size with a single fstat before rotating (e.g., external truncation)
+        self._file_size = os.fstat(self.stream.fileno()).st_size
+        pending = self._file_size + self._buffer_len
+        return pending > 0 and pending + msg_len >= self.maxBytes
+
+    def _start_flush_thread(self) -> None:
+        """Start the thread that writes the buffer every flush interval."""
+        self._flush_event = threading.Event()
+        if self.buffered and self.flush_interval:
+            self._flush_thread = threading.Thread(
+                name=f'rfh-flush-{os.path.basename(self.baseFilename)}',
+                target=self._flush_loop,
+                daemon=True,
+            )
+            self._flush_thread.start()
+
+    def _sync_file_state(self) -> None:
+        """Reopen the log file or reset the tracked size if it was changed externally."""
+        now = time.monotonic()
+        if now < self._next_stat or not self._regular_file:
+            return
+        self._next_stat = now + self.stat_interval
+
+        try:
+            st = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            st = None
+
+        if st is None or (st.st_dev, st.st_ino) != self._file_id:
+            # the file was moved or deleted (e.g., logrotate)
+            self._reopen()
+        elif st.st_size < self._file_size:
+            # the file was truncated
+            self._file_size = st.st_size
+
+    def close(self) -> None:
+        """Write any buffered records, stop the flush thread, and close the stream."""
+        unregister_fork_reinit(self)
+        self._flush_event.set()
+        self.acquire()
+        try:
+            self._flush_buffer()
+        finally:
+            self.release()
+        RotatingFileHandler.close(self)
+        if self.compressor is not None:
+            self.compressor.join()
+
+    def doRollover(self) -> None:
+        """Rotate the log file, recording the rotation in the handler metrics."""
+        start = time.perf_counter()
+        self._rollover()
+        if self.metrics is not None:
+            self.metrics.inc('rotations_total')
+            self.metrics.observe('rotation_seconds', time.perf_counter() - start)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a record, formatting and encoding it only once.
+
+        Args:
+            record: The log record.
+        """
+        try:
+            self.write_encoded(self.encode_record(record), record.levelno)
+        except Exception:
+            self.handleError(record)
+
+    def encode_record(self, record: logging.LogRecord) -> bytes:
+        """Return the formatted record encoded with the stream encoding.
+
+        This method is called without holding the handler lock.
+
+        Args:
+            record: The log record.
+        """
+        if self._stream_encoding is None:
+            # the stream is opened on first use (delay)
+            self.acquire()
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+            finally:
+                self.release()
+        if self._stream_utf8:
+            return self.encode_formatted(record, suffix=self.terminator.encode('utf-8'))
+        msg = self.format(record) + self.terminator
+        return msg.encode(*self._stream_encoding)
+
+    def flush(self) -> None:
+        """Write any buffered records and flush the stream."""
+        self.acquire()
+        try:
+            self._flush_buffer()
+        finally:
+            self.release()
+        RotatingFileHandler.flush(self)
+
+    def reinit_after_fork(self) -> None:
+        """Reopen the log file and restart the flush thread in the child process.
+
+        The records buffered before the fork are written by the parent.
+        """
+        self._buffer.clear()
+        self._buffer_len = 0
+        if self.stream is not None:
+            # the stream is flushed after each write, so closing it doesn't write any data
+            self.stream.close()
+            self.stream = self._open()
+        if self.compressor is not None:
+            self.compressor.reinit_after_fork()
+        self._start_flush_thread()
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Return True if the record would cause the file to exceed maxBytes.
+
+        Args:
+            record: The log record.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        msg = self.format(record) + self.terminator
+        return self._should_rollover_size(len(msg.encode(self.stream.encoding, self.stream.errors)))
+
+    def write_encoded(self, data: bytes, levelno: int | None = logging.NOTSET) -> None:
+        """Write (or buffer) an encoded record, rotating the file as required.
+
+        The caller must hold the handler lock.
+
+        Args:
+            data: The encoded record.
+            levelno: The record level, used to decide if the buffer is flushed.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+
+        self._sync_file_state()
+        if self._should_rollover_size(len(data)):
+            self._flush_buffer()
+            self.doRollover()
+
+        self._buffer.append(data)
+        self._buffer_len += len(data)
+        if not self.buffered or levelno >= self.flush_level or self._buffer_full():
+            self._flush_buffer()
+
+
+class RotatingFileHandlerMultiProcess(RotatingFileHandlerCustom):
+    """Rotating handler that is safe to share one log file between multiple processes.
+
+    Each write (a single record or a buffered batch) is done while holding an exclusive
+    lock on a companion lock file. While holding the lock the handler detects if another
+    process has rotated the file (by inode), rotates the file if required, and appends
+    the data with O_APPEND writes so lines are never lost or interleaved.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str | None = 'a',
+        maxBytes: int | None = 0,
+        backupCount: int | None = 0,
+        encoding: str | None = None,
+        delay: int | None = 0,
+        buffer_size: int | None = 0,
+        buffer_records: int | None = 0,
+        flush_interval: float | None = 1.0,
+        flush_level: int | None = logging.ERROR,
+        lock_filename: str | None = None,
+    ):
+        """Create a multiprocess safe rotating file handler.
+
+        Args:
+            filename: The name of the logfile.
+            mode: The write mode for the file (only append is supported).
+            maxBytes: The max file size before rotating.
+            backupCount: The maximum number of backup files.
+            encoding: The log file encoding.
+            delay: The delay period.
+            buffer_size: The number of buffered bytes that triggers a write (0 disables).
+            buffer_records: The number of buffered records that triggers a write (0 disables).
+            flush_interval: The max number of seconds a record is held in the buffer.
+            flush_level: Records at or above this level are written immediately.
+            lock_filename: The lock file name. Defaults to the logfile name with .lock suffix.
+        """
+        if fcntl is None:  # pragma: no cover
+            raise RuntimeError('The multiprocess rotating handler requires fcntl (POSIX only).')
+        if mode != 'a':
+            raise RuntimeError('The multiprocess rotating handler only supports append mode.')
+
+        RotatingFileHandlerCustom.__init__(
+            self,
+            filename,
+            mode,
+            maxBytes,
+            backupCount,
+            encoding,
+            delay,
+            buffer_size=buffer_size,
+            buffer_records=buffer_records,
+            flush_interval=flush_interval,
+            flush_level=flush_level,
+        )
+        self.lock_filename = lock_filename or f'{self.baseFilename}.lock'
+        self._lock_fd: int = os.open(self.lock_filename, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def _flush_buffer(self) -> None:
+        """Write all buffered records while holding the lock file."""
+        if not self._buffer:
+            return
+
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            self._sync_file_state_locked()
+            chunk: list[bytes] = []
+            chunk_len = 0
+            for data in self._buffer:
+                if self._should_rollover_locked(chunk_len + len(data)):
+                    self._write_locked(chunk)
+                    chunk, chunk_len = [], 0
+                    self.doRollover()
+                chunk.append(data)
+                chunk_len += len(data)
+            self._write_locked(chunk)
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+        self._buffer.clear()
+        self._buffer_len = 0
+
+    def _should_rollover_locked(self, msg_len: int) -> bool:
+        """Return True if the message would cause the file to exceed maxBytes.
+
+        Args:
+            msg_len: The length of the pending data.
+        """
+        return bool(
+            self.maxBytes > 0
+            and self.backupCount > 0
+            and self._regular_file
+            and self._file_size > 0
+            and self._file_size + msg_len >= self.maxBytes
+        )
+
+    def _should_rollover_size(self, msg_len: int) -> bool:  # pylint: disable=unused-argument
+        """Return False, the rollover decision is made while holding the lock.
+
+        Args:
+            msg_len: The length of the new encoded message.
+        """
+        return False
+
+    def _sync_file_state(self) -> None:
+        """Skip the periodic check, the file state is synced while holding the lock."""
+
+    def _sync_file_state_locked(self) -> None:
+        """Reopen the log file if another process rotated it and refresh the file size."""
+        if self.stream is None:
+            self.stream = self._open()
+            return
+
+        try:
+            st = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            st = None
+
+        if st is None or (st.st_dev, st.st_ino) != self._file_id:
+            self.stream.close()
+            self.stream = self._open()
+        else:
+            self._file_size = st.st_size
+
+    def _write_locked(self, chunk: list[bytes]) -> None:
+        """Append the chunk to the log file with O_APPEND writes.
+
+        Args:
+            chunk: The encoded records to write.
+        """
+        if not chunk:
+            return
+        if self.stream is None:
+            self.stream = self._open()
+
+        data = memoryview(chunk[0] if len(chunk) == 1 else b''.join(chunk))
+        self._file_size += len(data)
+        fd = self.stream.fileno()
+        while data:
+            data = data[os.write(fd, data) :]
+
+    def close(self) -> None:
+        """Close the stream and the lock file."""
+        RotatingFileHandlerCustom.close(self)
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def reinit_after_fork(self) -> None:
+        """Reopen the log file and the lock file in the child process.
+
+        The flock is held per open file description, so the child must not share the lock
+        file description of the parent.
+        """
+        RotatingFileHandlerCustom.reinit_after_fork(self)
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = os.open(self.lock_filename, os.O_RDWR | os.O_CREAT, 0o644)
@@ -0,0 +1,293 @@
+"""Falcon logger memory mapped segment handler module."""
+# standard library
+import codecs
+import logging
+import mmap
+import os
+import threading
+import time
+
+# first-party
+from falcon_provider_logger.fork import register_fork_reinit, unregister_fork_reinit
+from falcon_provider_logger.mixins import FormatOutsideLockMixin
+
+try:
+    # standard library
+    import fcntl
+except ImportError:  # pragma: no cover
+    # fcntl is not available on windows
+    fcntl = None
+
+
+class MmapSegmentHandler(FormatOutsideLockMixin, logging.Handler):
+    """File handler that writes records into preallocated memory mapped segment files.
+
+    Each segment file ("<filename>.<index>") is preallocated (posix_fallocate when available)
+    and memory mapped, so a record is written with a memory copy at the shared write offset
+    instead of a write syscall. When a record doesn't fit in the segment the handler moves to
+    the next segment and removes the segments beyond segment_count. Each writer holds a
+    shared flock on its active segment, so the segments still written by other processes
+    (e.g., the workers of a pre-fork server) are never removed.
+
+    The first byte of each record is copied last, so a reader that stops at the first NUL byte
+    (read_mmap_segment) only sees whole records, even if the process crashes during a write.
+    NUL bytes in a record are escaped. The mapped pages are written to disk by the OS, or with
+    msync every sync_interval seconds and for each record at or above sync_level. When the
+    handler is closed the segment is truncated to the written size.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        segment_size: int | None = 16_777_216,
+        segment_count: int | None = 10,
+        sync_interval: float | None = 1.0,
+        sync_level: int | None = logging.ERROR,
+        encoding: str | None = 'utf-8',
+    ):
+        """Initialize class properties.
+
+        Args:
+            filename: The base name of the segment files.
+            segment_size: The size of each preallocated segment file.
+            segment_count: The number of segment files to keep.
+            sync_interval: The number of seconds between msync calls (0 or None disables).
+            sync_level: Records at or above this level are synced to disk immediately.
+            encoding: The log file encoding.
+        """
+        if segment_size < mmap.PAGESIZE:
+            raise RuntimeError(f'The segment size must be at least {mmap.PAGESIZE} bytes.')
+
+        logging.Handler.__init__(self)
+        self.baseFilename = os.path.abspath(filename)
+        self.encoding = encoding
+        self.segment_count = segment_count
+        self.segment_size = segment_size
+        self.sync_interval = sync_interval
+        self.sync_level = sync_level
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+
+        # properties
+        self.index = max(segment_indexes(self.baseFilename), default=0)
+        self.mmap: mmap.mmap | None = None
+        self.offset = 0
+        self._fd: int | None = None
+        self._sync_event = threading.Event()
+        self._sync_thread: threading.Thread | None = None
+        # the bytes-native path encodes as UTF-8
+        self._utf8 = codecs.lookup(encoding).name == 'utf-8'
+
+        self._open_segment()
+        self._start_sync_thread()
+        register_fork_reinit(self)
+
+    def _close_segment(self) -> None:
+        """Sync, unmap, and truncate the current segment to the written size."""
+        if self.mmap is None:
+            return
+        self.mmap.flush()
+        self.mmap.close()
+        self.mmap = None
+        os.ftruncate(self._fd, self.offset)
+        os.close(self._fd)
+        self._fd = None
+
+    def _open_segment(self) -> None:
+        """Create, preallocate, and map the next segment file."""
+        while self._fd is None:
+            self.index += 1
+            try:
+                self._fd = os.open(
+                    segment_filename(self.baseFilename, self.index),
+                    os.O_RDWR | os.O_CREAT | os.O_EXCL,
+                    0o644,
+                )
+            except FileExistsError:
+                # the segment was created by another process (e.g., a forked worker)
+                continue
+        if fcntl is not None:
+            # the segment is in use until it is closed (see _segment_in_use)
+            fcntl.flock(self._fd, fcntl.LOCK_SH)
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(self._fd, 0, self.segment_size)
+        else:  # pragma: no cover
+            os.ftruncate(self._fd, self.segment_size)
+        self.mmap = mmap.mmap(self._fd, self.segment_size)
+        self.offset = 0
+
+        # remove the segments beyond the segment count that no writer has open
+        for index in segment_indexes(self.baseFilename):
+            if index <= self.index - self.segment_count and not self._segment_in_use(index):
+                try:
+                    os.remove(segment_filename(self.baseFilename, index))
+                except FileNotFoundError:  # pragma: no cover
+                    # removed by another writer
+                    pass
+
+    def _segment_in_use(self, index: int) -> bool:
+        """Return True if another writer holds the lock of an active segment.
+
+        Args:
+            index: The segment index.
+        """
+        if fcntl is None:  # pragma: no cover
+            # without locks a single writer per segment directory is supported
+            return False
+        try:
+            fd = os.open(segment_filename(self.baseFilename, index), os.O_RDONLY)
+        except FileNotFoundError:  # pragma: no cover
+            return False
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+        finally:
+            os.close(fd)
+        return False
+
+    def _start_sync_thread(self) -> None:
+        """Start the thread that syncs the mapped segment every sync interval."""
+        self._sync_event = threading.Event()
+        if self.sync_interval:
+            self._sync_thread = threading.Thread(
+                name=f'mmap-sync-{os.path.basename(self.baseFilename)}',
+                target=self._sync_loop,
+                daemon=True,
+            )
+            self._sync_thread.start()
+
+    def _sync_loop(self) -> None:
+        """Periodically msync the mapped segment."""
+        while not self._sync_event.wait(self.sync_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the sync thread and close the segment."""
+        unregister_fork_reinit(self)
+        self._sync_event.set()
+        self.acquire()
+        try:
+            self._close_segment()
+        finally:
+            self.release()
+        logging.Handler.close(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Encode and write the record.
+
+        Args:
+            record: The log record.
+        """
+        try:
+            self.write_encoded(self.encode_record(record), record.levelno)
+        except Exception:
+            self.handleError(record)
+
+    def encode_record(self, record: logging.LogRecord) -> bytes:
+        """Return the formatted and encoded record (without NUL bytes).
+
+        Args:
+            record: The log record.
+        """
+        try:
+            if self._utf8:
+                data = self.encode_formatted(record, suffix=b'\n')
+            else:
+                data = (self.format(record) + '\n').encode(self.encoding, 'backslashreplace')
+        except UnicodeEncodeError:
+            # e.g., a lone surrogate, which is escaped as in the str path
+            data = (self.format(record) + '\n').encode(self.encoding, 'backslashreplace')
+        if b'\0' in data:
+            data = data.replace(b'\0', b'\\x00')
+        return data
+
+    def flush(self) -> None:
+        """Write the mapped pages to disk (msync)."""
+        self.acquire()
+        try:
+            if self.mmap is not None:
+                self.mmap.flush()
+        finally:
+            self.release()
+
+    def reinit_after_fork(self) -> None:
+        """Map a new segment and restart the sync thread in the child process.
+
+        The segment mapped before the fork is still written (and truncated) by the parent.
+        """
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+            os.close(self._fd)
+            self._fd = None
+            self._open_segment()
+        self._start_sync_thread()
+
+    def write_encoded(self, data: bytes, levelno: int | None = logging.NOTSET) -> None:
+        """Copy the encoded record into the mapped segment at the write offset.
+
+        The caller must hold the handler lock.
+
+        Args:
+            data: The encoded record.
+            levelno: The record level, used to decide if the segment is synced.
+        """
+        if self.mmap is None:
+            # the handler was closed
+            return
+        if len(data) > self.segment_size:
+            data = data[: self.segment_size - 1] + b'\n'
+        if self.offset + len(data) > self.segment_size:
+            start = time.perf_counter()
+            self._close_segment()
+            self._open_segment()
+            if self.metrics is not None:
+                self.metrics.inc('rotations_total')
+                self.metrics.observe('rotation_seconds', time.perf_counter() - start)
+
+        offset = self.offset
+        end = offset + len(data)
+        # the first byte marks the record as written, so it is copied last
+        self.mmap[offset + 1 : end] = data[1:]
+        self.mmap[offset : offset + 1] = data[:1]
+        self.offset = end
+
+        if levelno >= self.sync_level:
+            self.mmap.flush()
+
+
+def read_mmap_segment(filename: str) -> bytes:
+    """Return the whole records written to a segment file by the MmapSegmentHandler.
+
+    Args:
+        filename: The segment file name.
+    """
+    with open(filename, 'rb') as fh:
+        data = fh.read()
+    # the preallocated space after the last record is NUL filled
+    return data.split(b'\0', 1)[0]
+
+
+def segment_filename(filename: str, index: int) -> str:
+    """Return the file name of a segment.
+
+    Args:
+        filename: The base name of the segment files.
+        index: The segment index.
+    """
+    return f'{filename}.{index:06d}'
+
+
+def segment_indexes(filename: str) -> list[int]:
+    """Return the sorted indexes of the existing segment files.
+
+    Args:
+        filename: The base name of the segment files.
+    """
+    directory, basename = os.path.split(filename)
+    indexes = []
+    for name in os.listdir(directory or '.'):
+        prefix, _, suffix = name.rpartition('.')
+        if prefix == basename and suffix.isdigit():
+            indexes.append(int(suffix))
+    return sorted(indexes)
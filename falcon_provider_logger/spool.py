@@ -0,0 +1,270 @@
+"""Falcon logger disk spool module."""
+# standard library
+import io
+import os
+import struct
+
+# first-party
+from falcon_provider_logger.segments import segment_filename, segment_indexes
+
+try:
+    # standard library
+    import fcntl
+except ImportError:  # pragma: no cover
+    # fcntl is not available on windows
+    fcntl = None
+
+
+class DiskSpool:
+    """Bounded append-only spool of framed syslog records in local segment files.
+
+    Records are appended with a 4 byte length prefix to the newest segment, and a new segment
+    is started when it reaches segment_size (a new process never appends to an existing
+    segment, so a record torn by a crash is only ever at the end of a closed segment). When
+    the spool would exceed max_bytes the oldest segment is deleted and its unsent records
+    are counted as dropped.
+
+    The replay position (segment index and offset) is saved after each replayed batch is
+    sent, so the records after the saved position are sent again after a crash
+    (at-least-once). Each process owns a spool slot (locked with flock), so the workers of
+    a pre-fork server spool to separate files and a restarted worker replays the spool of a
+    previous worker.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        name: str | None = 'syslog-spool',
+        max_bytes: int | None = 104_857_600,
+        segment_size: int | None = 8_388_608,
+    ):
+        """Initialize class properties.
+
+        Args:
+            directory: The spool directory.
+            name: The base name of the spool files.
+            max_bytes: The max size of the spool segment files for each process.
+            segment_size: The size at which a new segment file is started.
+        """
+        if not 0 < segment_size <= max_bytes:
+            raise RuntimeError('The spool segment size must be between 1 and max_bytes.')
+
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.name = name
+        self.segment_size = segment_size
+        os.makedirs(self.directory, exist_ok=True)
+
+        # properties
+        self.dropped = 0
+        self.filename: str = ''
+        self._consumed: dict[int, int] = {}
+        self._fh: io.BufferedWriter | None = None
+        self._lock_fd: int | None = None
+        self._next: tuple[int, int] = (0, 0)
+        self._read_index = 0
+        self._read_offset = 0
+        # segment index -> [size, unsent records]
+        self._segments: dict[int, list[int]] = {}
+        self._write_index = 0
+        self._open()
+
+    def _acquire_slot(self) -> None:
+        """Lock the first spool slot that isn't owned by another process."""
+        slot = 0
+        while True:
+            filename = os.path.join(self.directory, f'{self.name}-{slot}')
+            if fcntl is None:  # pragma: no cover
+                # no locking on windows, a single process per spool directory is supported
+                break
+            fd = os.open(f'{filename}.lock', os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                slot += 1
+                continue
+            self._lock_fd = fd
+            break
+        self.filename = filename
+
+    def _load_position(self) -> tuple[int, int]:
+        """Return the saved replay position."""
+        try:
+            with open(f'{self.filename}.pos', encoding='utf-8') as fh:
+                index, offset = fh.read().split()
+            return int(index), int(offset)
+        except (OSError, ValueError):
+            return 0, 0
+
+    def _open(self) -> None:
+        """Lock a slot and load the existing segments and the replay position."""
+        self._acquire_slot()
+        self._read_index, self._read_offset = self._load_position()
+        for index in segment_indexes(self.filename):
+            if index < self._read_index:
+                # the segment was replayed before the position was saved
+                os.remove(segment_filename(self.filename, index))
+                continue
+            offset = self._read_offset if index == self._read_index else 0
+            self._segments[index] = self._scan(index, offset)
+        if self._read_index not in self._segments:
+            self._read_index = min(self._segments, default=0)
+            self._read_offset = 0
+        # the torn record of a crashed process can only be at the end of an existing segment
+        self._write_index = max(self._segments, default=self._read_index - 1) + 1
+        if not self._segments:
+            self._read_index = self._write_index
+
+    def _remove(self, index: int) -> None:
+        """Delete a segment file.
+
+        Args:
+            index: The segment index.
+        """
+        del self._segments[index]
+        try:
+            os.remove(segment_filename(self.filename, index))
+        except FileNotFoundError:  # pragma: no cover
+            pass
+
+    def _rotate(self) -> None:
+        """Close the current segment and start a new segment."""
+        if self._fh is not None:
+            self._fh.close()
+            self._write_index += 1
+        self._fh = open(  # pylint: disable=consider-using-with
+            segment_filename(self.filename, self._write_index), 'ab'
+        )
+        self._segments[self._write_index] = [0, 0]
+
+    def _save_position(self) -> None:
+        """Save the replay position (atomically replacing the position file)."""
+        tmp = f'{self.filename}.pos.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            fh.write(f'{self._read_index} {self._read_offset}')
+        os.replace(tmp, f'{self.filename}.pos')
+
+    def _scan(self, index: int, offset: int) -> list[int]:
+        """Return the size and the number of whole unsent records of an existing segment.
+
+        Args:
+            index: The segment index.
+            offset: The offset of the first unsent record.
+        """
+        records = 0
+        with open(segment_filename(self.filename, index), 'rb') as fh:
+            fh.seek(offset)
+            while True:
+                header = fh.read(4)
+                if len(header) < 4:
+                    break
+                (size,) = struct.unpack('>I', header)
+                if len(fh.read(size)) < size:
+                    break
+                records += 1
+        return [os.path.getsize(segment_filename(self.filename, index)), records]
+
+    def append(self, frames: list[bytes]) -> int:
+        """Append the records and return the number of records dropped to stay under max_bytes.
+
+        Args:
+            frames: The framed records.
+        """
+        data = b''.join([struct.pack('>I', len(frame)) + frame for frame in frames])
+        if self._fh is None or self._segments[self._write_index][0] >= self.segment_size:
+            self._rotate()
+
+        dropped = 0
+        while self.size + len(data) > self.max_bytes and len(self._segments) > 1:
+            oldest = min(self._segments)
+            dropped += self._segments[oldest][1]
+            self._remove(oldest)
+            if oldest == self._read_index:
+                self._read_index, self._read_offset = min(self._segments), 0
+
+        self._fh.write(data)
+        self._fh.flush()
+        segment = self._segments[self._write_index]
+        segment[0] += len(data)
+        segment[1] += len(frames)
+        self.dropped += dropped
+        return dropped
+
+    def close(self) -> None:
+        """Close the segment and release the slot lock."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def commit(self) -> None:
+        """Advance the replay position past the records returned by the last read."""
+        for index, count in self._consumed.items():
+            if index in self._segments:
+                self._segments[index][1] -= count
+        self._read_index, self._read_offset = self._next
+        for index in [i for i in self._segments if i < self._read_index]:
+            self._remove(index)
+        self._consumed = {}
+        self._save_position()
+
+    @property
+    def empty(self) -> bool:
+        """Return True if all spooled records were replayed."""
+        return not any(records for _, records in self._segments.values())
+
+    def read(self, count: int) -> list[bytes]:
+        """Return up to count records from the replay position without advancing it.
+
+        Args:
+            count: The max number of records.
+        """
+        frames: list[bytes] = []
+        self._consumed = {}
+        index, offset = self._read_index, self._read_offset
+        while len(frames) < count and index <= self._write_index:
+            if index in self._segments:
+                with open(segment_filename(self.filename, index), 'rb') as fh:
+                    fh.seek(offset)
+                    while len(frames) < count:
+                        header = fh.read(4)
+                        if len(header) < 4:
+                            break
+                        (size,) = struct.unpack('>I', header)
+                        frame = fh.read(size)
+                        if len(frame) < size:
+                            # a record torn by a crash
+                            break
+                        frames.append(frame)
+                        offset += 4 + size
+                        self._consumed[index] = self._consumed.get(index, 0) + 1
+            if len(frames) < count and index < self._write_index:
+                index, offset = index + 1, 0
+            else:
+                break
+        self._next = (index, offset)
+        return frames
+
+    def reinit_after_fork(self) -> None:
+        """Release the slot shared with the parent and open the spool of another slot.
+
+        This method is called by the handler in the child process after a fork. The flock is
+        held per open file description, so the parent keeps its slot.
+        """
+        if self._fh is not None:
+            self._fh.close()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+        self._consumed = {}
+        self._fh = None
+        self._lock_fd = None
+        self._segments = {}
+        self._open()
+
+    @property
+    def size(self) -> int:
+        """Return the size of the spool segment files."""
+        return sum(size for size, _ in self._segments.values())
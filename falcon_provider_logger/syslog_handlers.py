@@ -0,0 +1,836 @@
+"""Falcon logger syslog handlers module."""
+# standard library
+import collections
+import logging
+import os
+import socket
+import threading
+import time
+from logging.handlers import SYSLOG_UDP_PORT, SysLogHandler
+
+# first-party
+from falcon_provider_logger.fork import register_fork_reinit, unregister_fork_reinit
+from falcon_provider_logger.mixins import FormatOutsideLockMixin
+from falcon_provider_logger.spool import DiskSpool
+
+# the supported message framing methods for the SysLogHandlerTcp
+TCP_FRAMING_METHODS = ('non-transparent', 'null', 'octet-counting')
+
+
+class SysLogHandlerCustom(FormatOutsideLockMixin, SysLogHandler):
+    """Syslog handler that formats records outside of the handler lock.
+
+    UDP datagrams are sent without the handler lock, TCP and unix socket writes hold the lock
+    only while sending. The priority prefix is cached per level, and for RFC 5424 output the
+    hostname, app-name, and procid header is built once.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int] | str = ('localhost', SYSLOG_UDP_PORT),
+        facility: str | int | None = SysLogHandler.LOG_USER,
+        socktype: int | None = None,
+        rfc5424: bool | None = False,
+        hostname: str | None = None,
+        app_name: str | None = None,
+    ):
+        """Initialize class properties.
+
+        Args:
+            address: The syslog (host, port) address or unix socket path.
+            facility: The syslog facility.
+            socktype: The socket type (socket.SOCK_DGRAM or socket.SOCK_STREAM).
+            rfc5424: If True, send RFC 5424 messages instead of the BSD (RFC 3164) format.
+            hostname: The RFC 5424 hostname. Defaults to the host name.
+            app_name: The RFC 5424 app-name. Defaults to "-" (nil).
+        """
+        SysLogHandler.__init__(self, address=address, facility=facility, socktype=socktype)
+        self.app_name = app_name
+        self.hostname = hostname
+        self.rfc5424 = rfc5424
+
+        # properties
+        self._headers: dict[tuple[str, str], bytes] = {}
+        self._prefixes: dict[str, bytes] = {}
+        self._rfc5424_header = b''
+        self._time_cache: tuple[int | None, bytes] = (None, b'')
+        if rfc5424 is True:
+            self._rfc5424_header = rfc5424_header(hostname, app_name)
+            # the app-name replaces the ident and the NUL is not used by RFC 5424 collectors
+            self.append_nul = False
+        register_fork_reinit(self)
+
+    @property
+    def write_requires_lock(self) -> bool:
+        """Return True unless the record is sent as a UDP datagram on an open socket."""
+        return bool(self.unixsocket or self.socktype != socket.SOCK_DGRAM or not self.socket)
+
+    def _create_socket(self) -> None:
+        """Create the socket, which SysLogHandler.createSocket does on python 3.11+.
+
+        On python 3.10 the socket is only created by SysLogHandler.__init__, so it is
+        created the same way here after the socket shared with the parent is closed.
+        """
+        if hasattr(SysLogHandler, 'createSocket'):
+            self.createSocket()
+            return
+        if self.unixsocket:  # pragma: no cover
+            self._connect_unixsocket(self.address)
+            return
+        err = sock = None
+        host, port = self.address
+        for af, socktype, proto, _, sa in socket.getaddrinfo(host, port, 0, self.socktype):
+            err = sock = None
+            try:
+                sock = socket.socket(af, socktype, proto)
+                if socktype == socket.SOCK_STREAM:
+                    sock.connect(sa)
+                break
+            except OSError as ex:  # pragma: no cover
+                err = ex
+                if sock is not None:
+                    sock.close()
+        if err is not None:  # pragma: no cover
+            raise err
+        self.socket = sock
+
+    def _prefix(self, levelname: str) -> bytes:
+        """Return the cached encoded priority prefix (and RFC 5424 version) for the level.
+
+        Args:
+            levelname: The record level name.
+        """
+        prefix = self._prefixes.get(levelname)
+        if prefix is None:
+            priority = self.encodePriority(self.facility, self.mapPriority(levelname))
+            version = '1 ' if self.rfc5424 else ''
+            prefix = self._prefixes[levelname] = f'<{priority}>{version}'.encode()
+        return prefix
+
+    def _timestamp(self, created: float) -> bytes:
+        """Return the RFC 5424 timestamp, formatting the date and time once per second.
+
+        Args:
+            created: The record creation time.
+        """
+        second = int(created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second)).encode()
+            self._time_cache = (second, formatted)
+        return b'%b.%03dZ' % (formatted, int((created - second) * 1000))
+
+    def close(self) -> None:
+        """Close the socket."""
+        unregister_fork_reinit(self)
+        if self.socket is None:
+            # the socket was closed in a forked child (python 3.10 doesn't check for None)
+            logging.Handler.close(self)
+        else:
+            SysLogHandler.close(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Encode and send the record.
+
+        Args:
+            record: The log record.
+        """
+        try:
+            self.write_encoded(self.encode_record(record), record.levelno)
+        except Exception:
+            self.handleError(record)
+
+    def encode_header(self, record: logging.LogRecord) -> bytes:
+        """Return the syslog header for the record.
+
+        Args:
+            record: The log record.
+        """
+        if self.rfc5424:
+            return (
+                self._prefix(record.levelname)
+                + self._timestamp(record.created)
+                + self._rfc5424_header
+            )
+        # the ident is part of the key, as it can be changed after the handler is created
+        key = (record.levelname, self.ident)
+        header = self._headers.get(key)
+        if header is None:
+            ident = self.ident.encode('utf-8')
+            header = self._headers[key] = self._prefix(record.levelname) + ident
+        return header
+
+    def encode_record(self, record: logging.LogRecord) -> bytes:
+        """Return the syslog message (same BSD format as the stdlib SysLogHandler).
+
+        Args:
+            record: The log record.
+        """
+        return self.encode_formatted(
+            record, self.encode_header(record), b'\0' if self.append_nul else b''
+        )
+
+    def reinit_after_fork(self) -> None:
+        """Close the socket shared with the parent and update the procid in the child process.
+
+        The socket is opened again on the next record.
+        """
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+        if self.rfc5424 is True:
+            self._rfc5424_header = rfc5424_header(self.hostname, self.app_name)
+
+    def write_encoded(  # pylint: disable=unused-argument
+        self, data: bytes, levelno: int | None = logging.NOTSET
+    ) -> None:
+        """Send the encoded record.
+
+        Args:
+            data: The encoded record.
+            levelno: The record level.
+        """
+        if not self.socket:
+            self._create_socket()
+
+        if self.unixsocket:
+            try:
+                self.socket.send(data)
+            except OSError:
+                self.socket.close()
+                self._connect_unixsocket(self.address)
+                self.socket.send(data)
+        elif self.socktype == socket.SOCK_DGRAM:
+            self.socket.sendto(data, self.address)
+        else:
+            self.socket.sendall(data)
+
+
+class SysLogHandlerUdp(SysLogHandlerCustom):
+    """Syslog handler that sends batches of UDP datagrams from a background thread.
+
+    Records are encoded on the logging thread and added to a bounded buffer. A sender thread
+    sends the buffered datagrams in a tight loop on a connected socket every flush interval,
+    or immediately when the buffer reaches the batch size or a record at or above the flush
+    level is logged. Messages larger than the MTU are split into multiple datagrams with the
+    same header instead of being truncated by the network or the collector.
+    """
+
+    # the send buffer is thread safe, so datagrams are added without the handler lock
+    write_requires_lock = False
+
+    def __init__(
+        self,
+        address: tuple[str, int] = ('localhost', SYSLOG_UDP_PORT),
+        facility: str | int | None = SysLogHandler.LOG_USER,
+        mtu: int | None = 1_472,
+        batch_size: int | None = 256,
+        flush_interval: float | None = 0.1,
+        flush_level: int | None = logging.ERROR,
+        max_buffer: int | None = 10_000,
+        rfc5424: bool | None = False,
+        hostname: str | None = None,
+        app_name: str | None = None,
+    ):
+        """Initialize class properties.
+
+        Args:
+            address: The syslog (host, port) address.
+            facility: The syslog facility.
+            mtu: The max datagram payload size (1472 is the payload of a 1500 byte MTU).
+            batch_size: The number of buffered datagrams that wakes the sender thread.
+            flush_interval: The max number of seconds a datagram is held in the buffer.
+            flush_level: Records at or above this level are sent immediately.
+            max_buffer: The max number of datagrams buffered before the oldest are dropped.
+            rfc5424: If True, send RFC 5424 messages instead of the BSD (RFC 3164) format.
+            hostname: The RFC 5424 hostname. Defaults to the host name.
+            app_name: The RFC 5424 app-name. Defaults to "-" (nil).
+        """
+        SysLogHandlerCustom.__init__(
+            self,
+            address=address,
+            facility=facility,
+            socktype=socket.SOCK_DGRAM,
+            rfc5424=rfc5424,
+            hostname=hostname,
+            app_name=app_name,
+        )
+        # connect once so the address isn't resolved for each datagram
+        self.socket.connect(address)
+
+        # properties
+        self.batch_size = batch_size
+        self.dropped = 0
+        self.errors = 0
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.mtu = mtu
+        self._pending: collections.deque = collections.deque(maxlen=max_buffer)
+        self._send_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_sender()
+
+    def _run(self) -> None:
+        """Send buffered datagrams every flush interval until the handler is closed."""
+        while not self._stop.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._send_pending()
+        self._send_pending()
+
+    def _send_pending(self) -> None:
+        """Send all buffered datagrams."""
+        with self._send_lock:
+            send = self.socket.send
+            pending = self._pending
+            while pending:
+                try:
+                    send(pending.popleft())
+                except IndexError:  # pragma: no cover
+                    return
+                except OSError:
+                    # e.g., ECONNREFUSED when the collector isn't listening
+                    self.errors += 1
+
+    def _start_sender(self) -> None:
+        """Start the sender thread."""
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(name='sh-udp-sender', target=self._run, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Send any buffered datagrams, stop the sender thread, and close the socket."""
+        self._stop.set()
+        self._wakeup.set()
+        self._thread.join()
+        SysLogHandlerCustom.close(self)
+
+    def encode_record(self, record: logging.LogRecord) -> tuple[bytes, ...]:
+        """Return the datagrams for the record, splitting the message to fit the MTU.
+
+        Args:
+            record: The log record.
+        """
+        header = self.encode_header(record)
+        nul = b'\0' if self.append_nul else b''
+        data = self.encode_formatted(record, header, nul)
+        if len(data) <= self.mtu:
+            return (data,)
+        msg = data[len(header) : len(data) - len(nul)]
+        size = self.mtu - len(header) - len(nul)
+        return tuple(header + chunk + nul for chunk in split_utf8(msg, max(size, 4)))
+
+    def flush(self) -> None:
+        """Send any buffered datagrams on the calling thread."""
+        if self.socket is not None:
+            # the socket is closed when the handler is closed
+            self._send_pending()
+
+    def reinit_after_fork(self) -> None:
+        """Connect a new socket and restart the sender thread in the child process.
+
+        The datagrams buffered before the fork are sent by the parent.
+        """
+        SysLogHandlerCustom.reinit_after_fork(self)
+        self._create_socket()
+        self.socket.connect(self.address)
+        self._pending.clear()
+        self._send_lock = threading.Lock()
+        self._start_sender()
+
+    def write_encoded(self, data: tuple[bytes, ...], levelno: int | None = logging.NOTSET) -> None:
+        """Add the datagrams to the send buffer.
+
+        Args:
+            data: The datagrams for the record.
+            levelno: The record level, used to decide if the sender thread is woken.
+        """
+        pending = self._pending
+        if len(pending) + len(data) > pending.maxlen:
+            # the oldest datagrams are discarded by the bounded deque
+            self.dropped += len(pending) + len(data) - pending.maxlen
+        pending.extend(data)
+        if levelno >= self.flush_level or len(pending) >= self.batch_size:
+            self._wakeup.set()
+
+
+class SysLogHandlerUnix(SysLogHandlerCustom):
+    """Syslog handler for a local unix socket (e.g., /dev/log) that never blocks the caller.
+
+    Datagram sockets are non-blocking, so a record is dropped (and counted) instead of waiting
+    when the socket buffer is full. Stream sockets use a short send timeout. When the syslog
+    daemon is restarted the socket is reconnected on the next record, and while it is down
+    records are dropped and the reconnect is retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        address: str | None = '/dev/log',
+        facility: str | int | None = SysLogHandler.LOG_USER,
+        socktype: int | None = None,
+        timeout: float | None = 0.1,
+        backoff_max: float | None = 30.0,
+        rfc5424: bool | None = False,
+        hostname: str | None = None,
+        app_name: str | None = None,
+    ):
+        """Initialize class properties.
+
+        Args:
+            address: The unix socket path.
+            facility: The syslog facility.
+            socktype: The socket type (socket.SOCK_DGRAM or socket.SOCK_STREAM). Defaults to
+                datagram with a fallback to stream.
+            timeout: The send timeout for stream sockets.
+            backoff_max: The max number of seconds between reconnect attempts.
+            rfc5424: If True, send RFC 5424 messages instead of the BSD (RFC 3164) format.
+            hostname: The RFC 5424 hostname. Defaults to the host name.
+            app_name: The RFC 5424 app-name. Defaults to "-" (nil).
+        """
+        # properties (used by _connect_unixsocket, which is called by the parent init)
+        self.backoff_max = backoff_max
+        self.dropped = 0
+        self.reconnects = 0
+        self.timeout = timeout
+        self._backoff = 0.0
+        self._next_connect = 0.0
+        self._socktype = socktype
+
+        SysLogHandlerCustom.__init__(
+            self,
+            address=address,
+            facility=facility,
+            socktype=socktype,
+            rfc5424=rfc5424,
+            hostname=hostname,
+            app_name=app_name,
+        )
+
+    def _connect_unixsocket(self, address: str) -> None:
+        """Connect the unix socket, leaving the socket closed if the daemon isn't listening.
+
+        Args:
+            address: The unix socket path.
+        """
+        self.socket = None
+        for socktype in (
+            [self._socktype]
+            if self._socktype
+            else [
+                socket.SOCK_DGRAM,
+                socket.SOCK_STREAM,
+            ]
+        ):
+            sock = socket.socket(socket.AF_UNIX, socktype)
+            try:
+                sock.connect(address)
+            except OSError:
+                sock.close()
+                continue
+            if socktype == socket.SOCK_DGRAM:
+                sock.setblocking(False)
+            else:
+                sock.settimeout(self.timeout)
+            self.socket = sock
+            self.socktype = socktype
+            self._backoff = 0.0
+            return
+
+        self._backoff = min(max(self._backoff * 2, 0.1), self.backoff_max)
+        self._next_connect = time.monotonic() + self._backoff
+
+    def _reconnect(self) -> bool:
+        """Reconnect the socket if the backoff period has passed."""
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+        if time.monotonic() < self._next_connect:
+            return False
+        self._connect_unixsocket(self.address)
+        if self.socket is not None:
+            self.reconnects += 1
+        return self.socket is not None
+
+    def _send(self, data: bytes) -> None:
+        """Send the data on the connected socket.
+
+        Args:
+            data: The encoded record.
+        """
+        if self.socktype == socket.SOCK_DGRAM:
+            self.socket.send(data)
+        else:
+            self.socket.sendall(data)
+
+    def reinit_after_fork(self) -> None:
+        """Connect a new socket in the child process."""
+        SysLogHandlerCustom.reinit_after_fork(self)
+        self._backoff = 0.0
+        self._next_connect = 0.0
+        self._connect_unixsocket(self.address)
+
+    def write_encoded(  # pylint: disable=unused-argument
+        self, data: bytes, levelno: int | None = logging.NOTSET
+    ) -> None:
+        """Send the encoded record, dropping it if the socket is full or disconnected.
+
+        Args:
+            data: The encoded record.
+            levelno: The record level.
+        """
+        if self.socket is None and not self._reconnect():
+            self.dropped += 1
+            return
+
+        try:
+            self._send(data)
+        except BlockingIOError:
+            # the socket buffer is full (the syslog daemon is behind)
+            self.dropped += 1
+        except OSError:
+            # the daemon was restarted (e.g., ECONNREFUSED) or a stream send timed out
+            self._next_connect = 0.0
+            if not self._reconnect():
+                self.dropped += 1
+                return
+            try:
+                self._send(data)
+            except OSError:
+                self.dropped += 1
+
+
+class SysLogHandlerTcp(FormatOutsideLockMixin, SysLogHandler):
+    """Syslog handler that sends records over a persistent TCP connection.
+
+    Records are framed and added to a bounded buffer on the logging thread. A background
+    thread packs all buffered records into a single send and reconnects with exponential
+    backoff when the connection fails, so the logging thread never blocks on the network.
+
+    With a spool directory, the records that can't be sent are written to a DiskSpool by
+    the background thread instead of being dropped when the buffer is full (or lost when the
+    handler is closed). Once the server is back the spool is replayed in order at
+    spool_replay_rate records per second between the sends of the new records, so only the
+    backlog is throttled and it drains under any live traffic (the new records can arrive
+    before the older spooled records).
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        address: tuple[str, int],
+        facility: str | int | None = SysLogHandler.LOG_USER,
+        framing: str | None = 'octet-counting',
+        max_buffer: int | None = 10_000,
+        batch_size: int | None = 1_000,
+        backoff_max: float | None = 30.0,
+        timeout: float | None = 5.0,
+        spool_directory: str | None = None,
+        spool_max_bytes: int | None = 104_857_600,
+        spool_replay_rate: float | None = 1_000.0,
+    ):
+        """Initialize class properties.
+
+        Framing:
+            octet-counting: Prefix each message with its length (RFC 6587).
+            non-transparent: Terminate each message with a LF (RFC 6587).
+            null: Terminate each message with a NUL (stdlib SysLogHandler compatible).
+
+        Args:
+            address: The syslog (host, port) address.
+            facility: The syslog facility.
+            framing: The message framing.
+            max_buffer: The max number of records buffered while the connection is down.
+            batch_size: The max number of records packed into a single send.
+            backoff_max: The max number of seconds between reconnect attempts.
+            timeout: The socket connect/send timeout.
+            spool_directory: The directory of the spool for records that can't be sent.
+            spool_max_bytes: The max size of the spool files for each process.
+            spool_replay_rate: The max number of spooled records sent per second (0 or None
+                disables the limit).
+        """
+        if framing not in TCP_FRAMING_METHODS:
+            raise RuntimeError(f'{framing} is not a valid framing method.')
+
+        # SysLogHandler.__init__ connects the socket, which is done by the sender thread
+        logging.Handler.__init__(self)  # pylint: disable=non-parent-init-called
+        self.address = address
+        self.append_nul = False
+        self.facility = facility
+        self.socket: socket.socket | None = None
+        self.socktype = socket.SOCK_STREAM
+        self.unixsocket = False
+
+        # properties
+        self.backoff_max = backoff_max
+        self.batch_size = batch_size
+        self.dropped = 0
+        self.framing = framing
+        self.reconnects = 0
+        self.replayed = 0
+        self.spool: DiskSpool | None = None
+        self.spool_replay_rate = spool_replay_rate
+        self.spooled = 0
+        self.timeout = timeout
+        self._backoff = 0.0
+        self._next_replay = 0.0
+        self._pending: collections.deque = collections.deque(maxlen=max_buffer)
+        self._prefixes: dict[tuple[str, str], bytes] = {}
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        # the send buffer is thread safe, so records are added without the handler lock
+        self.write_requires_lock = False
+        self._thread: threading.Thread | None = None
+        if spool_directory is not None:
+            self.spool = DiskSpool(
+                spool_directory,
+                max_bytes=spool_max_bytes,
+                segment_size=min(8_388_608, spool_max_bytes // 4 or 1),
+            )
+        self._start_sender()
+        register_fork_reinit(self)
+
+    def _close_socket(self) -> None:
+        """Close the socket so the next send reconnects."""
+        sock, self.socket = self.socket, None
+        if sock is not None:
+            sock.close()
+
+    def _connect(self) -> bool:
+        """Connect to the syslog server, waiting for the backoff period on failure."""
+        try:
+            self.socket = socket.create_connection(self.address, timeout=self.timeout)
+        except OSError:
+            self._backoff = min(max(self._backoff * 2, 0.1), self.backoff_max)
+            self._wait_backoff(self._backoff)
+            return False
+
+        self._backoff = 0.0
+        self.reconnects += 1
+        return True
+
+    def write_encoded(  # pylint: disable=unused-argument
+        self, frame: bytes, levelno: int | None = logging.NOTSET
+    ) -> None:
+        """Add a framed message to the send buffer and wake the sender thread.
+
+        Args:
+            frame: The framed message.
+            levelno: The record level.
+        """
+        if len(self._pending) == self._pending.maxlen:
+            # the oldest record is discarded by the bounded deque
+            self.dropped += 1
+        self._pending.append(frame)
+        self._wakeup.set()
+
+    def _replay_spool(self) -> None:
+        """Send the next batch of spooled records and schedule the next batch."""
+        frames = self.spool.read(self.batch_size)
+        try:
+            self.socket.sendall(b''.join(frames))
+        except OSError:
+            # the batch is read again after the reconnect (at-least-once)
+            self._close_socket()
+            return
+        self.spool.commit()
+        self.replayed += len(frames)
+        if self.spool_replay_rate:
+            self._next_replay = time.monotonic() + len(frames) / self.spool_replay_rate
+
+    def _requeue(self, batch: list[bytes]) -> None:
+        """Add a batch that failed to send back to the front of the buffer.
+
+        The newest buffered records that no longer fit in the buffer are moved to the spool
+        (if enabled) or dropped, instead of being pushed off the end of the bounded deque.
+
+        Args:
+            batch: The framed messages that failed to send.
+        """
+        overflow = []
+        while self._pending and len(self._pending) + len(batch) > self._pending.maxlen:
+            overflow.append(self._pending.pop())
+        self._pending.extendleft(reversed(batch))
+        if not overflow:
+            return
+        overflow.reverse()
+        if self.spool is not None:
+            self.dropped += self.spool.append(overflow)
+            self.spooled += len(overflow)
+        else:
+            self.dropped += len(overflow)
+
+    def _run(self) -> None:
+        """Send buffered records until the handler is closed."""
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self._send_pending()
+            if self._stop.is_set():
+                break
+        self._close_socket()
+
+    def _start_sender(self) -> None:
+        """Start the sender thread."""
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(name='sh-tcp-sender', target=self._run, daemon=True)
+        self._thread.start()
+        if self.spool is not None and not self.spool.empty:
+            # replay the records spooled by a previous process
+            self._wakeup.set()
+
+    def _send_pending(self) -> None:
+        """Send all buffered records, packing up to batch_size records per send.
+
+        A batch of spooled records is replayed whenever the replay rate allows it, the
+        buffered records are sent in between without waiting for the backlog.
+        """
+        while self._pending or (self.spool is not None and not self.spool.empty):
+            if self.socket is None:
+                if self._stop.is_set():
+                    self._spool_pending()
+                    return
+                if not self._connect():
+                    continue
+
+            if self.spool is not None and not self.spool.empty and not self._stop.is_set():
+                if time.monotonic() >= self._next_replay:
+                    self._replay_spool()
+                    continue
+                if not self._pending:
+                    # wait for the next replay or a new record
+                    self._wakeup.wait(self._next_replay - time.monotonic())
+                    self._wakeup.clear()
+                    continue
+            elif not self._pending:
+                # the spool is replayed by the next process
+                return
+
+            batch = []
+            while self._pending and len(batch) < self.batch_size:
+                batch.append(self._pending.popleft())
+            try:
+                self.socket.sendall(b''.join(batch))
+            except OSError:
+                # requeue the batch (at-least-once) and reconnect
+                self._requeue(batch)
+                self._close_socket()
+
+    def _spool_pending(self) -> None:
+        """Move the buffered records to the spool (if enabled)."""
+        if self.spool is None or not self._pending:
+            return
+        frames = []
+        while self._pending:
+            frames.append(self._pending.popleft())
+        self.dropped += self.spool.append(frames)
+        self.spooled += len(frames)
+
+    def _wait_backoff(self, timeout: float) -> None:
+        """Wait for the reconnect backoff, moving the buffered records to the spool.
+
+        Args:
+            timeout: The number of seconds to wait.
+        """
+        if self.spool is None:
+            self._stop.wait(timeout)
+            return
+        deadline = time.monotonic() + timeout
+        while not self._stop.is_set():
+            self._spool_pending()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._wakeup.wait(remaining)
+            self._wakeup.clear()
+
+    def close(self) -> None:
+        """Send (or spool) any buffered records and close the connection."""
+        unregister_fork_reinit(self)
+        self._stop.set()
+        self._wakeup.set()
+        self._thread.join(self.timeout)
+        if self.spool is not None and not self._thread.is_alive():
+            self.spool.close()
+        logging.Handler.close(self)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Frame the record and add it to the send buffer.
+
+        Args:
+            record: The log record.
+        """
+        try:
+            self.write_encoded(self.encode_record(record))
+        except Exception:
+            self.handleError(record)
+
+    def encode_record(self, record: logging.LogRecord) -> bytes:
+        """Return the framed syslog message for the record.
+
+        Args:
+            record: The log record.
+        """
+        key = (record.levelname, self.ident)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            prio = self.encodePriority(self.facility, self.mapPriority(record.levelname))
+            prefix = self._prefixes[key] = f'<{prio}>{self.ident}'.encode()
+        if self.framing == 'octet-counting':
+            payload = self.encode_formatted(record, prefix)
+            return b'%d %b' % (len(payload), payload)
+        return self.encode_formatted(
+            record, prefix, b'\n' if self.framing == 'non-transparent' else b'\0'
+        )
+
+    def reinit_after_fork(self) -> None:
+        """Close the connection shared with the parent and restart the sender thread.
+
+        This method is called in the child process after a fork. The records buffered
+        before the fork are sent by the parent.
+        """
+        # the socket is closed in the child only, the parent connection stays open
+        self._close_socket()
+        self._pending.clear()
+        self._backoff = 0.0
+        if self.spool is not None:
+            self.spool.reinit_after_fork()
+        self._start_sender()
+
+
+def rfc5424_header(hostname: str | None = None, app_name: str | None = None) -> bytes:
+    """Return the RFC 5424 header fields after the timestamp (hostname to structured data).
+
+    Args:
+        hostname: The hostname. Defaults to the host name.
+        app_name: The app-name. Defaults to "-" (nil).
+    """
+
+    def field(value: str | None, max_len: int) -> str:
+        # header fields are printable US-ASCII without spaces
+        value = ''.join(c for c in (value or '') if 33 <= ord(c) <= 126)
+        return value[:max_len] or '-'
+
+    hostname = field(hostname or socket.gethostname(), 255)
+    return f' {hostname} {field(app_name, 48)} {os.getpid()} - - '.encode()
+
+
+def split_utf8(data: bytes, size: int) -> list[bytes]:
+    """Return the data split into chunks of at most size bytes on UTF-8 character boundaries.
+
+    Args:
+        data: The UTF-8 encoded data.
+        size: The max size of each chunk.
+    """
+    chunks = []
+    start = 0
+    while start < len(data):
+        end = min(start + size, len(data))
+        # don't split a multi-byte character (continuation bytes are 0b10xxxxxx)
+        while end < len(data) and end > start + 1 and data[end] & 0xC0 == 0x80:
+            end -= 1
+        chunks.append(data[start:end])
+        start = end
+    return chunks
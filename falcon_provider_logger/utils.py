@@ -1,38 +1,258 @@
 """Logger middleware module."""
 # standard library
+import functools
 import logging
 import os
+import queue
 import socket
-from logging.handlers import RotatingFileHandler, SysLogHandler
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, SysLogHandler
 
+# first-party
+from falcon_provider_logger.filters import RateLimitFilter
+from falcon_provider_logger.flight_recorder import FlightRecorderHandler
+from falcon_provider_logger.fork import register_fork_reinit
+from falcon_provider_logger.formatters import (
+    FAST_FORMAT,
+    CachedTimeFormatter,
+    StructuredFormatter,
+    formatter_uses_caller,
+)
+from falcon_provider_logger.metrics import instrument_handler
+from falcon_provider_logger.rotating import (
+    RotatingFileHandlerCustom,
+    RotatingFileHandlerMultiProcess,
+)
+from falcon_provider_logger.segments import MmapSegmentHandler
+from falcon_provider_logger.syslog_handlers import (
+    SysLogHandlerCustom,
+    SysLogHandlerTcp,
+    SysLogHandlerUdp,
+    SysLogHandlerUnix,
+)
 
-class RotatingFileHandlerCustom(RotatingFileHandler):
-    """Customized Rotating handler that will ensure log directory path is created."""
+# the default format for the handler formatters
+DEFAULT_FORMAT = (
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s [%(module)s:%(funcName)s:%(lineno)d]'
+)
 
-    def __init__(
-        self,
-        filename: str,
-        mode: str | None = 'a',
-        maxBytes: int | None = 0,
-        backupCount: int | None = 0,
-        encoding: str | None = None,
-        delay: int | None = 0,
-    ):
-        """Create a customized RotatingFileHandler that supports creation of the full log path.
+# the supported overflow policies for the QueueHandlerCustom
+QUEUE_OVERFLOW_POLICIES = ('block', 'count-and-drop', 'drop-newest', 'drop-oldest')
+
+
+class QueueHandlerCustom(QueueHandler):
+    """Customized Queue handler that supports a bounded queue with an overflow policy."""
+
+    def __init__(self, queue_: queue.Queue, overflow: str | None = 'block'):
+        """Create a customized QueueHandler that handles a full queue based on the overflow policy.
+
+        Policies:
+            block: Wait for space in the queue (no records are lost).
+            count-and-drop: Drop the new record, count it, and enqueue a warning with the
+                number of dropped records once space is available.
+            drop-newest: Drop the new record.
+            drop-oldest: Discard the oldest queued record to make room for the new record.
+
+        Args:
+            queue_: The queue instance to add log records.
+            overflow: The policy to apply when the queue is full.
+        """
+        if overflow not in QUEUE_OVERFLOW_POLICIES:
+            raise RuntimeError(f'{overflow} is not a valid overflow policy.')
+        QueueHandler.__init__(self, queue_)
+        self.overflow = overflow
+
+        # properties
+        self._dropped_lock = threading.Lock()
+        self._pending_dropped = 0
+        self.dropped = 0
+        register_fork_reinit(self)
+
+    def _count_dropped(self) -> None:
+        """Increment the dropped record counters."""
+        with self._dropped_lock:
+            self.dropped += 1
+            self._pending_dropped += 1
+
+    def _enqueue_dropped_summary(self, record: logging.LogRecord) -> None:
+        """Enqueue a warning record reporting the number of dropped records.
+
+        Args:
+            record: The record currently being enqueued (used for the logger name).
+        """
+        with self._dropped_lock:
+            count = self._pending_dropped
+            self._pending_dropped = 0
+        summary = logging.makeLogRecord(
+            {
+                'name': record.name,
+                'levelno': logging.WARNING,
+                'levelname': 'WARNING',
+                'msg': f'Log queue full, dropped {count} record(s).',
+            }
+        )
+        try:
+            self.queue.put_nowait(summary)
+        except queue.Full:  # pragma: no cover
+            with self._dropped_lock:
+                self._pending_dropped += count
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record using the configured overflow policy.
+
+        Args:
+            record: The prepared log record.
+        """
+        if self.overflow == 'block':
+            self.queue.put(record)
+            return
+
+        if self.overflow == 'count-and-drop' and self._pending_dropped:
+            self._enqueue_dropped_summary(record)
+
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                if self.overflow != 'drop-oldest':
+                    self._count_dropped()
+                    return
+
+            # discard the oldest record and retry
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self._count_dropped()
+            except queue.Empty:  # pragma: no cover
+                pass
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record with the merged message, keeping the message template.
+
+        The template is used by the RateLimitFilter of the queued handlers to group the
+        records with different args.
+
+        Args:
+            record: The log record.
+        """
+        template = record.msg
+        record = QueueHandler.prepare(self, record)
+        record.msg_template = template
+        return record
+
+    def qsize(self) -> int:
+        """Return the approximate number of queued records (the queue is replaced after a fork)."""
+        return self.queue.qsize()
+
+    def reinit_after_fork(self) -> None:
+        """Replace the queue in the child process.
+
+        The queue lock could be held by another thread of the parent, and the records queued
+        before the fork are handled by the parent.
+        """
+        self.queue = queue.Queue(maxsize=self.queue.maxsize)
+        self._dropped_lock = threading.Lock()
+        self._pending_dropped = 0
+
+
+class QueueListenerCustom(QueueListener):
+    """Customized Queue listener that can be stopped while the bounded queue is full."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Handle the record, discarding the flight recorder request rings for a marker record.
+
+        The marker is queued by the middleware when a request succeeds, so the request
+        records queued before it are buffered (and discarded) first.
 
         Args:
-            filename: The name of the logfile.
-            mode: The write mode for the file.
-            maxBytes: The max file size before rotating.
-            backupCount: The maximum number of backup files.
-            encoding: The log file encoding.
-            delay: The delay period.
+            record: The log record.
         """
-        if not os.path.exists(os.path.dirname(filename)):
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-        RotatingFileHandler.__init__(self, filename, mode, maxBytes, backupCount, encoding, delay)
+        request_id = getattr(record, 'flight_recorder_discard', None)
+        if request_id is None:
+            QueueListener.handle(self, record)
+            return
+        for h in self.handlers:
+            if isinstance(h, FlightRecorderHandler) and h.per_request:
+                h.discard(request_id)
+
+    def enqueue_sentinel(self) -> None:
+        """Block until the sentinel can be added so stop() never fails on a full queue."""
+        self.queue.put(self._sentinel)
+
+
+def disable_caller_lookup(logger: logging.Logger) -> None:
+    """Disable the stack walk the logger does to find the caller for each record.
+
+    Records will have "(unknown file)", 0, and "(unknown function)" for the pathname,
+    lineno, and funcName. Unlike clearing logging._srcfile, only this logger is affected.
+    Records logged with stack_info=True still walk the stack.
+
+    Args:
+        logger: The logger instance.
+    """
+    logger.findCaller = functools.partial(_find_caller_disabled, logger)
+
+
+def _find_caller_disabled(
+    logger: logging.Logger, stack_info: bool | None = False, stacklevel: int | None = 1
+) -> tuple:
+    """Return the placeholder caller info without walking the stack unless stack_info is set.
+
+    Args:
+        logger: The logger instance.
+        stack_info: If True, return the caller info and the stack info.
+        stacklevel: The number of frames to skip to find the caller.
+    """
+    if stack_info:
+        if sys.version_info >= (3, 11):
+            # python 3.11+ counts this frame when skipping stacklevel frames
+            stacklevel += 1
+        return logging.Logger.findCaller(logger, stack_info, stacklevel)
+    return '(unknown file)', 0, '(unknown function)', None
 
 
+def get_formatter(formatter: logging.Formatter | str | None = None) -> logging.Formatter:
+    """Return a logging formatter.
+
+    Args:
+        formatter: A logging formatter, a % style format string, or the name of a profile
+            (fast, json, or logfmt). The fast profile doesn't output the caller info (no
+            module/lineno). Defaults to a sane formatter with module/lineno.
+
+    Returns:
+        Formatter: The logging formatter.
+    """
+    if isinstance(formatter, logging.Formatter):
+        return formatter
+    if formatter in ('json', 'logfmt'):
+        return StructuredFormatter(output=formatter)
+    if formatter == 'fast':
+        return CachedTimeFormatter(FAST_FORMAT)
+    # a sane formatter that includes method and line number
+    return CachedTimeFormatter(formatter or DEFAULT_FORMAT)
+
+
+def handlers_use_caller(handlers: list[logging.Handler]) -> bool:
+    """Return True if any of the handler formatters require the caller info.
+
+    Args:
+        handlers: The logging handlers.
+    """
+    for h in handlers:
+        if isinstance(h, FlightRecorderHandler):
+            if handlers_use_caller(h.handlers):
+                return True
+            continue
+        # asyncio file handlers format with the target handler formatter
+        h = getattr(h, 'target', h)
+        if formatter_uses_caller(h.formatter):
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=64)
 def get_level(level: str) -> int:
     """Return proper logging level.
 
@@ -53,15 +273,45 @@ def get_level(level: str) -> int:
     return level
 
 
+def install_rate_limit(
+    handler: logging.Handler, rate_limit: float | None = None, burst: int | None = 20
+) -> RateLimitFilter | None:
+    """Add a rate limit filter to the handler.
+
+    Args:
+        handler: The logging handler.
+        rate_limit: The number of similar records per second allowed (None disables).
+        burst: The number of similar records allowed before rate limiting.
+
+    Returns:
+        RateLimitFilter | None: The installed filter.
+    """
+    if rate_limit is None:
+        return None
+    rate_limit_filter = RateLimitFilter(rate=rate_limit, burst=burst)
+    rate_limit_filter.install(handler)
+    return rate_limit_filter
+
+
 def rotating_handler(
     backup_count: int | None = 10,
     directory: str | None = 'log',
     filename: str | None = 'server.log',
-    formatter: logging.Formatter | None = None,
+    formatter: logging.Formatter | str | None = None,
     level: str | None = 'INFO',
     max_bytes: int | None = 10_485_760,
     mode: str | None = 'a',
     name: str | None = 'rfh',
+    buffer_size: int | None = 0,
+    buffer_records: int | None = 0,
+    flush_interval: float | None = 1.0,
+    flush_level: str | None = 'ERROR',
+    stat_interval: float | None = 1.0,
+    multiprocess: bool | None = False,
+    compress: str | None = None,
+    rate_limit: float | None = None,
+    rate_limit_burst: int | None = 20,
+    metrics: bool | None = False,
 ) -> RotatingFileHandlerCustom:
     """Return a configured instance of a rotating file handler with sane defaults.
 
@@ -69,51 +319,124 @@ def rotating_handler(
         backup_count: The number of backup log files to keep.
         directory: The directory to write the log file.
         filename: The name of the log file.
-        formatter: A logging formatter to format logging handler.
-            Defaults to a sane formatter with module/lineno.
+        formatter: A logging formatter, format string, or structured output (json or
+            logfmt) to format logging handler. Defaults to a sane formatter with module/lineno.
         level: The logging level for the handler.
         name: The handler name.
         max_bytes: The maximum size of the log file.
         mode: The write mode for the log file.
+        buffer_size: The number of buffered bytes that triggers a write (0 disables).
+        buffer_records: The number of buffered records that triggers a write (0 disables).
+        flush_interval: The max number of seconds a record is held in the buffer.
+        flush_level: Records at or above this level are written immediately.
+        stat_interval: The number of seconds between checks for external rotation.
+        multiprocess: If True, use a handler that is safe to share the log file between
+            multiple processes (e.g., gunicorn workers).
+        compress: The compression method (gzip or zstd) for rotated files. The files are
+            compressed on a background thread.
+        rate_limit: The number of records per second allowed for each (logger, level,
+            message template). Suppressed records are reported in periodic summaries.
+        rate_limit_burst: The number of similar records allowed before rate limiting.
+        metrics: If True, record the handler metrics (records, bytes, latency, and
+            rotations) under the handler name.
 
     Returns:
         RotatingFileHandlerCustom: A customized instance of the RotatingFileHandler.
     """
-    lh = RotatingFileHandlerCustom(
-        os.path.join(directory, filename), backupCount=backup_count, maxBytes=max_bytes, mode=mode
-    )
-    lh.setLevel(get_level(level))
-    if formatter is None:
-        # a sane formatter that includes method and line number
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s '
-            '[%(module)s:%(funcName)s:%(lineno)d]'
+    filename = os.path.join(directory, filename)
+    kwargs = {
+        'backupCount': backup_count,
+        'maxBytes': max_bytes,
+        'mode': mode,
+        'buffer_size': buffer_size,
+        'buffer_records': buffer_records,
+        'flush_interval': flush_interval,
+        'flush_level': get_level(flush_level),
+    }
+    if multiprocess is True:
+        if compress is not None:
+            # the background compressor can't coordinate the backup chain across processes
+            raise RuntimeError('Compression is not supported with the multiprocess handler.')
+        lh = RotatingFileHandlerMultiProcess(filename, **kwargs)
+    else:
+        lh = RotatingFileHandlerCustom(
+            filename, stat_interval=stat_interval, compress=compress, **kwargs
         )
-    lh.setFormatter(formatter)
+    lh.setLevel(get_level(level))
+    lh.setFormatter(get_formatter(formatter))
     lh.set_name(name)
+    install_rate_limit(lh, rate_limit, rate_limit_burst)
+    if metrics is True:
+        instrument_handler(lh)
     return lh
 
 
 def syslog_handler(
     host: str | None = 'localhost',
     facility: str | None = 'user',
-    formatter: logging.Formatter | None = None,
+    formatter: logging.Formatter | str | None = None,
     level: str | None = 'INFO',
     name: str | None = 'sh',
     port: int | None = 514,
     socktype: str | None = 'UDP',
+    persistent: bool | None = False,
+    framing: str | None = 'octet-counting',
+    max_buffer: int | None = 10_000,
+    rate_limit: float | None = None,
+    rate_limit_burst: int | None = 20,
+    batch: bool | None = False,
+    mtu: int | None = 1_472,
+    flush_interval: float | None = 0.1,
+    rfc5424: bool | None = False,
+    app_name: str | None = None,
+    hostname: str | None = None,
+    unix_socket: str | None = None,
+    metrics: bool | None = False,
+    spool_directory: str | None = None,
+    spool_max_bytes: int | None = 104_857_600,
+    spool_replay_rate: float | None = 1_000.0,
 ) -> SysLogHandler:
     """Return a configured instance of a syslog handler with sane defaults.
 
     Args:
         host: The syslog hostname/ip.
         facility: The syslog facility.
-        formatter: A logging formatter to format logging handler.
-            Defaults to a sane formatter with module/lineno.
+        formatter: A logging formatter, format string, or structured output (json or
+            logfmt) to format logging handler. Defaults to a sane formatter with module/lineno.
         level: The logging level for the handler.
         name: The handler name.
         port: The syslog port.
         socktype: The socket type. Either TCP or UDP.
+        persistent: If True, send records over a persistent connection from a background
+            thread that batches records and reconnects with backoff. Only supported when
+            socktype is TCP.
+        framing: The TCP message framing for the persistent handler (octet-counting,
+            non-transparent, or null).
+        max_buffer: The max number of records the persistent or batch handler buffers.
+        rate_limit: The number of records per second allowed for each (logger, level,
+            message template). Suppressed records are reported in periodic summaries.
+        rate_limit_burst: The number of similar records allowed before rate limiting.
+        batch: If True, send batches of datagrams from a background thread and split
+            messages larger than the MTU. Only supported when socktype is UDP.
+        mtu: The max datagram payload size for the batch handler.
+        flush_interval: The max number of seconds the batch handler holds a datagram.
+        rfc5424: If True, send RFC 5424 messages (not supported by the persistent handler).
+        app_name: The RFC 5424 app-name.
+        hostname: The RFC 5424 hostname. Defaults to the host name.
+        unix_socket: The path of a local unix socket (e.g., /dev/log). When set, the host
+            and port are not used and socktype selects a datagram (UDP) or stream (TCP)
+            socket, or None to use a datagram socket with a fallback to stream.
+        metrics: If True, record the handler metrics (records, bytes, latency, dropped
+            records, and reconnects) under the handler name.
+        spool_directory: If set, records that can't be sent while the server is unreachable
+            are spooled to this directory and replayed once it is back (implies persistent).
+            Only supported when socktype is TCP.
+        spool_max_bytes: The max size of the spool files for each process. The oldest
+            spooled records are dropped when the spool is full.
+        spool_replay_rate: The max number of spooled records replayed per second.
+
+    Raises:
+        RuntimeError: Invalid socktype or an option not supported by the socket type.
 
     Returns:
         SyslogHandler: A configured instance of the SyslogHandler.
@@ -122,22 +445,147 @@ def syslog_handler(
     address = (host, int(port))
 
     # set socktype
-    if socktype.upper() == 'TCP':
+    if socktype is None:
+        # only valid for unix sockets (datagram with a fallback to stream)
+        pass
+    elif socktype.upper() == 'TCP':
         socktype = socket.SOCK_STREAM
     elif socktype.upper() == 'UDP':
         socktype = socket.SOCK_DGRAM  # default
     else:  # pragma: no cover
         raise RuntimeError(f'{socktype} is not a valid socktype.')
 
+    if spool_directory is not None and (unix_socket is not None or socktype != socket.SOCK_STREAM):
+        raise RuntimeError('The spool is only supported by the TCP syslog handler.')
+    if unix_socket is not None and (batch is True or persistent is True):
+        raise RuntimeError('Batch and persistent are not supported by the unix socket handler.')
+    if batch is True and socktype != socket.SOCK_DGRAM:
+        raise RuntimeError('Batch is only supported by the UDP syslog handler.')
+    if persistent is True and socktype != socket.SOCK_STREAM:
+        raise RuntimeError('Persistent is only supported by the TCP syslog handler.')
+
     # create the handler
-    lh = SysLogHandler(address=address, facility=facility, socktype=socktype)
-    lh.setLevel(get_level(level.upper()))
-    if formatter is None:
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s '
-            '[%(module)s:%(funcName)s:%(lineno)d]'
+    rfc5424_kwargs = {'rfc5424': rfc5424, 'app_name': app_name, 'hostname': hostname}
+    if unix_socket is not None:
+        lh = SysLogHandlerUnix(
+            address=unix_socket, facility=facility, socktype=socktype, **rfc5424_kwargs
         )
-    lh.setFormatter(formatter)
+    elif (persistent is True or spool_directory is not None) and socktype == socket.SOCK_STREAM:
+        if rfc5424 is True or app_name is not None or hostname is not None:
+            raise RuntimeError('RFC 5424 messages are not supported by the persistent handler.')
+        lh = SysLogHandlerTcp(
+            address=address,
+            facility=facility,
+            framing=framing,
+            max_buffer=max_buffer,
+            spool_directory=spool_directory,
+            spool_max_bytes=spool_max_bytes,
+            spool_replay_rate=spool_replay_rate,
+        )
+    elif batch is True and socktype == socket.SOCK_DGRAM:
+        lh = SysLogHandlerUdp(
+            address=address,
+            facility=facility,
+            mtu=mtu,
+            flush_interval=flush_interval,
+            max_buffer=max_buffer,
+            **rfc5424_kwargs,
+        )
+    else:
+        lh = SysLogHandlerCustom(
+            address=address, facility=facility, socktype=socktype, **rfc5424_kwargs
+        )
+    lh.setLevel(get_level(level.upper()))
+    lh.setFormatter(get_formatter(formatter))
     lh.set_name(name)
+    install_rate_limit(lh, rate_limit, rate_limit_burst)
+    if metrics is True:
+        instrument_handler(lh)
+
+    return lh
 
+
+def flight_recorder_handler(
+    handlers: list[logging.Handler],
+    capacity: int | None = 1_000,
+    max_bytes: int | None = 1_048_576,
+    flush_level: str | None = 'ERROR',
+    forward_level: str | None = 'INFO',
+    name: str | None = 'frh',
+    per_request: bool | None = False,
+    max_requests: int | None = 100,
+) -> FlightRecorderHandler:
+    """Return a configured instance of a flight recorder handler with sane defaults.
+
+    Args:
+        handlers: The handlers that write the forwarded and dumped records.
+        capacity: The max number of records buffered (per request when per_request).
+        max_bytes: The max estimated size of all buffered records.
+        flush_level: Records at or above this level dump the buffered records.
+        forward_level: Records at or above this level are passed to the handlers immediately.
+        name: The handler name.
+        per_request: If True, buffer the records per request and only dump the records of
+            the failed request. Requires the middleware request_context.
+        max_requests: The max number of request buffers.
+
+    Returns:
+        FlightRecorderHandler: A configured instance of the FlightRecorderHandler.
+    """
+    lh = FlightRecorderHandler(
+        handlers,
+        capacity=capacity,
+        max_bytes=max_bytes,
+        flush_level=get_level(flush_level),
+        forward_level=get_level(forward_level),
+        per_request=per_request,
+        max_requests=max_requests,
+    )
+    lh.setLevel(logging.DEBUG)
+    lh.set_name(name)
+    return lh
+
+
+def mmap_handler(
+    directory: str | None = 'log',
+    filename: str | None = 'server.log',
+    formatter: logging.Formatter | str | None = None,
+    level: str | None = 'INFO',
+    name: str | None = 'mfh',
+    segment_size: int | None = 16_777_216,
+    segment_count: int | None = 10,
+    sync_interval: float | None = 1.0,
+    sync_level: str | None = 'ERROR',
+    metrics: bool | None = False,
+) -> MmapSegmentHandler:
+    """Return a configured instance of a memory mapped segment file handler with sane defaults.
+
+    Args:
+        directory: The directory to write the segment files.
+        filename: The base name of the segment files.
+        formatter: A logging formatter, format string, or structured output (json or
+            logfmt) to format logging handler. Defaults to a sane formatter with module/lineno.
+        level: The logging level for the handler.
+        name: The handler name.
+        segment_size: The size of each preallocated segment file.
+        segment_count: The number of segment files to keep.
+        sync_interval: The number of seconds between msync calls (0 disables).
+        sync_level: Records at or above this level are synced to disk immediately.
+        metrics: If True, record the handler metrics (records, bytes, latency, and
+            segment rotations) under the handler name.
+
+    Returns:
+        MmapSegmentHandler: A configured instance of the MmapSegmentHandler.
+    """
+    lh = MmapSegmentHandler(
+        os.path.join(directory, filename),
+        segment_size=segment_size,
+        segment_count=segment_count,
+        sync_interval=sync_interval,
+        sync_level=get_level(sync_level),
+    )
+    lh.setLevel(get_level(level))
+    lh.setFormatter(get_formatter(formatter))
+    lh.set_name(name)
+    if metrics is True:
+        instrument_handler(lh)
     return lh
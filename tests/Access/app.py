@@ -0,0 +1,56 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.utils import rotating_handler
+
+
+class LoggerAccessLoggerResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        resp.text = f'Logged - {key}'
+
+
+class LoggerAccessMediaResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        resp.media = {'key': req.get_param('key')}
+
+
+class LoggerAccessHealthResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        resp.text = 'ok'
+
+
+rh: object = rotating_handler(
+    filename='access.log',
+    formatter='%(name)s - %(message)s - %(status)s %(bytes)s',
+    level='debug',
+    name='access-rfh',
+)
+app_access_logger = falcon.App(
+    middleware=[
+        LoggerMiddleware(
+            [rh], name='SERVER-ACCESS', access_log=True, access_log_routes={'/health': False}
+        )
+    ]
+)
+app_access_logger.add_route('/middleware', LoggerAccessLoggerResource())
+app_access_logger.add_route('/media', LoggerAccessMediaResource())
+app_access_logger.add_route('/health', LoggerAccessHealthResource())
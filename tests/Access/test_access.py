@@ -0,0 +1,128 @@
+"""Test logger middleware access log."""
+# standard library
+import logging
+import os
+import re
+from uuid import uuid4
+
+# third-party
+import falcon
+from falcon import testing
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_logger.access import AccessLogger
+from falcon_provider_logger.middleware import LoggerMiddleware
+
+
+def find_line(logfile: str, text: str) -> str | None:
+    """Return the first line in the log file that contains the text.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        str | None: The matching line.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        for line in fh.read().strip().split('\n'):
+            if text in line:
+                return line
+    return None
+
+
+def test_access_get(client_access: object, log_directory: str) -> None:
+    """Testing GET resource
+
+    Args:
+        client_access (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'access.log')
+    key = f'{uuid4()}'
+    response: Result = client_access.simulate_get('/middleware', params={'key': key})
+
+    assert response.status_code == 200
+    line = find_line(logfile, 'SERVER-ACCESS.access - GET /middleware 200 ')
+    assert line is not None
+    assert re.search(r' 200 (\d+) [\d.]+ms - 200 \1$', line)
+    assert f' {len(response.content)} ' in line
+
+
+def test_access_media(client_access: object, log_directory: str) -> None:
+    """Testing the response bytes for a media response.
+
+    Args:
+        client_access (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'access.log')
+    response: Result = client_access.simulate_get('/media', params={'key': 'media'})
+
+    assert response.json == {'key': 'media'}
+    line = find_line(logfile, 'SERVER-ACCESS.access - GET /media 200 ')
+    assert line is not None
+    assert f' 200 {len(response.content)} ' in line
+
+
+def test_access_route_disabled(client_access: object, log_directory: str) -> None:
+    """Testing that the access log can be disabled for a route.
+
+    Args:
+        client_access (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'access.log')
+    response: Result = client_access.simulate_get('/health')
+
+    assert response.text == 'ok'
+    assert find_line(logfile, 'GET /health') is None
+
+
+def test_access_sample_rate() -> None:
+    """Test that only sampled requests are logged."""
+    records: list = []
+    logger = logging.getLogger('access-sample')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.addHandler(handler)
+
+    access_logger = AccessLogger(logger, sample_rate=0.0, routes={'/sampled': 1.0})
+    for path in ['/sampled', '/other']:
+        req = testing.create_req(path=path)
+        req.uri_template = path
+        resp = falcon.Response()
+        resp.text = 'sampled'
+        access_logger.start(req)
+        access_logger.log(req, resp)
+
+    assert [r.args[1] for r in records] == ['/sampled']
+    assert records[0].bytes == len('sampled')
+
+
+def test_access_request_context() -> None:
+    """Test that the access log records include the request context."""
+    lines: list = []
+    handler = logging.Handler()
+    handler.setFormatter(logging.Formatter('%(request_id)s %(route)s - %(message)s'))
+    handler.emit = lambda record: lines.append(handler.format(record))
+    app = falcon.App(
+        middleware=[
+            LoggerMiddleware(
+                [handler], name='SERVER-ACCESS-CONTEXT', access_log=True, request_context=True
+            )
+        ]
+    )
+    app.add_route('/context/{item_id}', testing.SimpleTestResource(body='ok'))
+
+    request_id = f'{uuid4()}'
+    response: Result = testing.TestClient(app).simulate_get(
+        '/context/123', headers={'X-Request-ID': request_id}
+    )
+
+    assert response.status_code == 200
+    assert len(lines) == 1
+    assert lines[0].startswith(f'{request_id} /context/{{item_id}} - GET /context/123 200 ')
@@ -0,0 +1,35 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+import falcon.asgi
+
+# first-party
+from falcon_provider_logger.aio import async_rotating_handler, async_syslog_handler
+from falcon_provider_logger.middleware import LoggerMiddleware
+
+
+class LoggerAsgiLoggerResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    async def on_get(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        self.log.debug(f'DEBUG {key}')
+        self.log.info(f'INFO {key}')
+        self.log.warning(f'WARNING {key}')
+        self.log.error(f'ERROR {key}')
+        self.log.critical(f'CRITICAL {key}')
+        resp.text = f'Logged - {key}'
+
+
+rh: object = async_rotating_handler(filename='asgi.log', level='debug', name='asgi-rfh')
+sh_tcp: object = async_syslog_handler(
+    framing='null', host='0.0.0.0', level='debug', name='asgi-tcp', port=5141, socktype='TCP'
+)
+sh_udp: object = async_syslog_handler(host='0.0.0.0', level='debug', name='asgi-udp', port=5140)
+app_asgi_logger = falcon.asgi.App(
+    middleware=[LoggerMiddleware([rh, sh_tcp, sh_udp], name='SERVER-ASGI')]
+)
+app_asgi_logger.add_route('/middleware', LoggerAsgiLoggerResource())
@@ -0,0 +1,115 @@
+"""Test logger middleware."""
+# standard library
+import asyncio
+import logging
+import os
+import threading
+import time
+from uuid import uuid4
+
+# third-party
+import pytest
+from falcon import testing
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_logger.aio import AsyncFileHandler, AsyncHandler
+from falcon_provider_logger.rotating import RotatingFileHandlerCustom
+
+
+def count_text(logfile: str, text: str) -> int:
+    """Count the lines in the log file that contain the unique text.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        int: The number of lines that contain the text.
+    """
+    time.sleep(0.10)  # allow time for log to flush
+    with open(logfile, encoding='utf-8') as fh:
+        return sum(1 for line in fh.read().strip().split('\n') if text in line)
+
+
+def test_asgi_get(app_asgi: object, log_directory: str) -> None:
+    """Testing GET resource
+
+    Args:
+        app_asgi (fixture): The ASGI app.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    key = f'{uuid4()}'
+
+    async def run() -> Result:
+        # the conductor runs the lifespan events that start and flush the handlers
+        async with testing.ASGIConductor(app_asgi) as conductor:
+            return await conductor.simulate_get('/middleware', params={'key': key})
+
+    response: Result = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert response.text == f'Logged - {key}'
+    for level in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
+        text = f'SERVER-ASGI - {level} - {level} {key}'
+        # the file handler writes each record once
+        assert count_text(os.path.join(log_directory, 'asgi.log'), text) == 1
+        # the tcp and udp syslog handlers each send every record to the syslog server
+        assert count_text(os.path.join(log_directory, 'syslog_server.log'), text) == 2
+
+
+def test_async_handler_abstract() -> None:
+    """Test that the base asyncio handler can't be created without encode and write."""
+    with pytest.raises(TypeError):
+        AsyncHandler()  # pylint: disable=abstract-class-instantiated
+
+
+def test_async_file_handler_open(tmp_path: object) -> None:
+    """Test that the delayed log file is opened in the executor and not on the event loop.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    target = RotatingFileHandlerCustom(str(tmp_path / 'delay.log'), delay=True)
+    target.setFormatter(logging.Formatter('%(message)s'))
+    open_threads = []
+    target_open = target._open  # pylint: disable=protected-access
+
+    def _open() -> object:
+        open_threads.append(threading.current_thread())
+        return target_open()
+
+    target._open = _open  # pylint: disable=protected-access
+    lh = AsyncFileHandler(target)
+
+    async def run() -> None:
+        await lh.start()
+        lh.handle(logging.makeLogRecord({'msg': 'delayed', 'levelno': logging.INFO}))
+        await lh.aclose()
+
+    asyncio.run(run())
+
+    assert len(open_threads) == 1
+    assert open_threads[0] is not threading.main_thread()
+    assert (tmp_path / 'delay.log').read_text(encoding='utf-8') == 'delayed\n'
+
+
+def test_async_file_handler_restart(tmp_path: object) -> None:
+    """Test that the handler can be started again after it is closed (e.g., a new lifespan).
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    target = RotatingFileHandlerCustom(str(tmp_path / 'restart.log'), delay=True)
+    target.setFormatter(logging.Formatter('%(message)s'))
+    lh = AsyncFileHandler(target)
+
+    async def run(msg: str) -> None:
+        await lh.start()
+        lh.handle(logging.makeLogRecord({'msg': msg, 'levelno': logging.INFO}))
+        await lh.aclose()
+
+    asyncio.run(run('first'))
+    asyncio.run(run('second'))
+
+    assert (tmp_path / 'restart.log').read_text(encoding='utf-8') == 'first\nsecond\n'
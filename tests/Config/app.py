@@ -0,0 +1,41 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+
+
+class LoggerConfigResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        self.log.debug(f'DEBUG {key}')
+        self.log.info(f'INFO {key}')
+        resp.text = f'Logged - {key}'
+
+
+# the handler spec shared by both apps
+HANDLER_SPEC = {
+    'type': 'rotating',
+    'filename': 'config.log',
+    'formatter': '%(name)s - %(levelname)s - %(message)s',
+    'level': 'INFO',
+    'name': 'config-rfh',
+}
+
+config_middleware_a = LoggerMiddleware.from_config(
+    {'name': 'SERVER-CONFIG-A', 'level': 'DEBUG', 'handlers': [HANDLER_SPEC]}
+)
+app_config_logger_a = falcon.App(middleware=[config_middleware_a])
+app_config_logger_a.add_route('/middleware', LoggerConfigResource())
+
+config_middleware_b = LoggerMiddleware.from_config(
+    {'name': 'SERVER-CONFIG-B', 'level': 'DEBUG', 'handlers': [dict(HANDLER_SPEC)]}
+)
+app_config_logger_b = falcon.App(middleware=[config_middleware_b])
+app_config_logger_b.add_route('/middleware', LoggerConfigResource())
@@ -0,0 +1,149 @@
+"""Test the declarative logger config."""
+# standard library
+import json
+import logging
+import os
+from uuid import uuid4
+
+# third-party
+import pytest
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_logger.config import LazyHandler, build_handler, load_config, read_config
+from falcon_provider_logger.levels import level_controller
+from falcon_provider_logger.middleware import LoggerMiddleware
+
+
+def count_text(logfile: str, text: str) -> int:
+    """Count the lines in the log file that contain the unique text.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        int: The number of lines that contain the text.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        return sum(1 for line in fh.read().strip().split('\n') if text in line)
+
+
+def test_config_shared_lazy_handler(
+    client_config_a: object, client_config_b: object, log_directory: str
+) -> None:
+    """Test that identical specs share one handler that is built on the first record.
+
+    Args:
+        client_config_a (fixture): The test client for the first app.
+        client_config_b (fixture): The test client for the second app.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    handlers_a = logging.getLogger('SERVER-CONFIG-A').handlers
+    handlers_b = logging.getLogger('SERVER-CONFIG-B').handlers
+    assert len(handlers_a) == 1 and handlers_a[0] is handlers_b[0]
+    handler: LazyHandler = handlers_a[0]
+    assert handler.name == 'config-rfh'
+
+    key = str(uuid4())
+    for client in [client_config_a, client_config_b]:
+        response: Result = client.simulate_get('/middleware', params={'key': key})
+        assert response.status_code == 200
+    assert handler.handler is not None
+
+    logfile = os.path.join(log_directory, 'config.log')
+    assert count_text(logfile, f'SERVER-CONFIG-A - INFO - INFO {key}') == 1
+    assert count_text(logfile, f'SERVER-CONFIG-B - INFO - INFO {key}') == 1
+    assert count_text(logfile, f'DEBUG {key}') == 0
+
+
+def test_config_level_change(client_config_a: object, log_directory: str) -> None:
+    """Test that a runtime level change applies to the lazy handler.
+
+    Args:
+        client_config_a (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    level_controller.set_level('SERVER-CONFIG-A', 'DEBUG', duration=30)
+    try:
+        key = str(uuid4())
+        client_config_a.simulate_get('/middleware', params={'key': key})
+    finally:
+        level_controller.restore('SERVER-CONFIG-A')
+
+    logfile = os.path.join(log_directory, 'config.log')
+    assert count_text(logfile, f'SERVER-CONFIG-A - DEBUG - DEBUG {key}') == 1
+    assert logging.getLogger('SERVER-CONFIG-A').handlers[0].level == logging.INFO
+
+
+def test_config_not_built(tmp_path: object) -> None:
+    """Test that loading a config doesn't open the handler file.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    kwargs = load_config(
+        {
+            'name': 'SERVER-CONFIG-LAZY',
+            'handlers': [{'type': 'rotating', 'directory': str(tmp_path), 'filename': 'lazy.log'}],
+        }
+    )
+    assert kwargs['handlers'][0].handler is None
+    assert not os.listdir(tmp_path)
+
+
+@pytest.mark.parametrize(
+    'spec',
+    [
+        {'type': 'unknown'},
+        {'type': 'rotating', 'level': 'VERBOSE'},
+        {'type': 'rotating', 'flush_level': 'VERBOSE'},
+        {'type': 'rotating', 'unknown': True},
+        {'type': 'syslog', 'facility': 'unknown'},
+        'rotating',
+    ],
+)
+def test_config_invalid_handler(spec: object) -> None:
+    """Test that invalid handler specs are rejected when the config is loaded.
+
+    Args:
+        spec: The invalid handler spec.
+    """
+    with pytest.raises(RuntimeError):
+        build_handler(spec)
+
+
+def test_config_invalid_level() -> None:
+    """Test that an invalid middleware level is rejected when the config is loaded."""
+    with pytest.raises(RuntimeError):
+        load_config({'level': 'VERBOSE'})
+
+
+def test_config_read(monkeypatch: object, tmp_path: object) -> None:
+    """Test reading the config from a TOML file, a JSON file, and the environment.
+
+    Args:
+        monkeypatch (fixture): The pytest monkeypatch fixture.
+        tmp_path (fixture): A temporary directory.
+    """
+    config = {'name': 'SERVER-CONFIG-FILE', 'handlers': [{'type': 'syslog', 'port': 5140}]}
+
+    toml_file = tmp_path / 'logger.toml'
+    toml_file.write_text(
+        'name = "SERVER-CONFIG-FILE"\n\n[[handlers]]\ntype = "syslog"\nport = 5140\n',
+        encoding='utf-8',
+    )
+    assert read_config(str(toml_file)) == config
+
+    json_file = tmp_path / 'logger.json'
+    json_file.write_text(json.dumps(config), encoding='utf-8')
+    assert read_config(str(json_file)) == config
+
+    monkeypatch.setenv('FALCON_LOGGER_CONFIG', json.dumps(config))
+    middleware = LoggerMiddleware.from_config()
+    assert middleware.log.name == 'SERVER-CONFIG-FILE'
+    assert isinstance(middleware.handlers[0], LazyHandler)
+
+    monkeypatch.delenv('FALCON_LOGGER_CONFIG')
+    with pytest.raises(RuntimeError):
+        read_config()
@@ -0,0 +1,31 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.utils import rotating_handler
+
+
+class LoggerContextLoggerResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response, item_id: str) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        self.log.info(f'INFO {key} {item_id}')
+        resp.text = f'Logged - {key}'
+
+
+rh: object = rotating_handler(
+    filename='context.log',
+    formatter='%(name)s - %(request_id)s %(method)s %(path)s %(route)s - %(message)s',
+    level='debug',
+    name='context-rfh',
+)
+app_context_logger = falcon.App(
+    middleware=[LoggerMiddleware([rh], name='SERVER-CONTEXT', request_context=True)]
+)
+app_context_logger.add_route('/middleware/{item_id}', LoggerContextLoggerResource())
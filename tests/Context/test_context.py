@@ -0,0 +1,102 @@
+"""Test logger middleware request context."""
+# standard library
+import asyncio
+import logging
+import os
+import threading
+from uuid import uuid4
+
+# third-party
+from falcon import testing
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_logger.context import (
+    RequestContextFilter,
+    clear_request_context,
+    get_request_context,
+    set_request_context,
+)
+
+
+def has_text(logfile: str, text: str) -> bool:
+    """Search for unique text in log file.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        bool: True if text is found, else False.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        for line in fh.read().strip().split('\n'):
+            if text in line:
+                break
+        else:
+            return False
+    return True
+
+
+def test_context_get(client_context: object, log_directory: str) -> None:
+    """Testing GET resource
+
+    Args:
+        client_context (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'context.log')
+    key = f'{uuid4()}'
+    request_id = f'{uuid4()}'
+    response: Result = client_context.simulate_get(
+        '/middleware/123', headers={'X-Request-ID': request_id}, params={'key': key}
+    )
+
+    assert response.status_code == 200
+    text = (
+        f'SERVER-CONTEXT - {request_id} GET /middleware/123 /middleware/{{item_id}} - '
+        f'INFO {key} 123'
+    )
+    assert has_text(logfile, text) is True, f'Failed to find text {text}'
+    # the context is cleared after the response
+    assert get_request_context() is None
+
+
+def test_context_filter_default() -> None:
+    """Test that records logged outside of a request get the default values."""
+    record = logging.makeLogRecord({'msg': 'no request'})
+    RequestContextFilter().filter(record)
+    assert record.request_id == '-'
+    assert record.route == '-'
+
+
+def test_context_threads() -> None:
+    """Test that the request context is isolated per thread."""
+    req = testing.create_req(headers={'X-Request-ID': 'main-thread'})
+    set_request_context(req)
+    seen = []
+
+    def worker() -> None:
+        seen.append(get_request_context())
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen == [None]
+    assert get_request_context()['request_id'] == 'main-thread'
+    clear_request_context()
+
+
+def test_context_asyncio_tasks() -> None:
+    """Test that the request context is isolated per asyncio task."""
+
+    async def handle(request_id: str) -> str:
+        set_request_context(testing.create_req(headers={'X-Request-ID': request_id}))
+        await asyncio.sleep(0.01)
+        return get_request_context()['request_id']
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*[handle(f'task-{i}') for i in range(5)])
+
+    assert asyncio.run(run()) == [f'task-{i}' for i in range(5)]
@@ -0,0 +1,143 @@
+"""Test the logger facade."""
+# standard library
+import logging
+import logging.config
+import sys
+
+# third-party
+import falcon
+from falcon import testing
+
+# first-party
+from falcon_provider_logger.facade import LoggerFacade
+from falcon_provider_logger.levels import level_controller
+from falcon_provider_logger.middleware import LoggerMiddleware
+
+
+class ListHandler(logging.Handler):
+    """Handler that stores the records in a list."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        logging.Handler.__init__(self)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store the record."""
+        self.records.append(record)
+
+
+def test_facade_level_change() -> None:
+    """Test that the level checks follow every level change."""
+    logger = logging.getLogger('facade-refresh')
+    logger.setLevel(logging.INFO)
+    facade = LoggerFacade(logger)
+
+    assert (facade.is_debug, facade.is_info, facade.is_error) == (False, True, True)
+
+    level_controller.set_level('facade-refresh', 'DEBUG')
+    assert facade.is_debug is True
+    level_controller.set_level('facade-refresh', 'INFO', duration=60)
+    assert facade.is_debug is False
+    level_controller.restore('facade-refresh')
+    assert facade.is_debug is True
+
+    # the level changes made outside the level controller are seen
+    logger.setLevel(logging.NOTSET)
+    logging.getLogger().setLevel(logging.ERROR)
+    try:
+        assert (facade.is_info, facade.is_error) == (False, True)
+        logging.disable(logging.CRITICAL)
+        assert (facade.is_error, facade.is_critical) == (False, False)
+        logging.disable(logging.NOTSET)
+        logging.config.dictConfig(
+            {
+                'version': 1,
+                'incremental': True,
+                'loggers': {'facade-refresh': {'level': 'DEBUG'}},
+            }
+        )
+        assert facade.is_debug is True
+    finally:
+        logging.disable(logging.NOTSET)
+        logging.getLogger().setLevel(logging.WARNING)
+
+
+def test_facade_lazy_message() -> None:
+    """Test that a callable message is only called when the level is enabled."""
+    handler = ListHandler()
+    logger = logging.getLogger('facade-lazy')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    facade = LoggerFacade(logger)
+
+    calls = []
+
+    def message() -> str:
+        calls.append(1)
+        return 'lazy message'
+
+    facade.debug(message)
+    facade.info(message)
+    facade.warning('args %s', 'message')
+
+    assert len(calls) == 1
+    assert [r.getMessage() for r in handler.records] == ['lazy message', 'args message']
+    # the caller is the test function and not the facade
+    assert {r.funcName for r in handler.records} == {'test_facade_lazy_message'}
+    assert handler.records[0].module == 'test_facade'
+
+
+def test_facade_caller() -> None:
+    """Test that the records have the function and line number of the facade caller."""
+    handler = ListHandler()
+    logger = logging.getLogger('facade-caller')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    facade = LoggerFacade(logger)
+
+    def log_all() -> int:
+        lineno = sys._getframe().f_lineno  # pylint: disable=protected-access
+        facade.debug(lambda: 'debug')
+        facade.info('info')
+        facade.warning('warning')
+        facade.error('error')
+        facade.critical('critical')
+        facade.log(logging.INFO, 'log')
+        try:
+            raise ValueError('exception')
+        except ValueError:
+            facade.exception('exception')
+        return lineno
+
+    lineno = log_all()
+
+    assert [r.funcName for r in handler.records] == ['log_all'] * 7
+    assert [r.lineno for r in handler.records] == [lineno + n for n in (1, 2, 3, 4, 5, 6, 10)]
+    assert {r.pathname for r in handler.records} == {__file__}
+
+
+def test_facade_middleware() -> None:
+    """Test that the middleware provides the facade to resources."""
+
+    class FacadeResource:
+        """Logger middleware testing resource."""
+
+        log = None
+
+        def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+            """Support GET method."""
+            resp.media = {'is_debug': self.log.is_debug, 'name': self.log.name}
+
+    middleware = LoggerMiddleware(name='SERVER-FACADE', level='INFO')
+    app = falcon.App(middleware=[middleware])
+    app.add_route('/facade', FacadeResource())
+
+    response = testing.TestClient(app).simulate_get('/facade')
+    assert response.json == {'is_debug': False, 'name': 'SERVER-FACADE'}
+
+    level_controller.set_level('SERVER-FACADE', 'DEBUG')
+    response = testing.TestClient(app).simulate_get('/facade')
+    assert response.json['is_debug'] is True
@@ -0,0 +1,203 @@
+"""Test the rate limit filter."""
+# standard library
+import logging
+import queue
+import threading
+import time
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_logger.filters import RateLimitFilter
+from falcon_provider_logger.utils import (
+    QueueHandlerCustom,
+    QueueListenerCustom,
+    rotating_handler,
+)
+
+
+class ListHandler(logging.Handler):
+    """Handler that stores the records in a list."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        logging.Handler.__init__(self)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store the record."""
+        self.records.append(record)
+
+
+def get_logger(name: str, rate_limit_filter: RateLimitFilter) -> tuple[logging.Logger, ListHandler]:
+    """Return a logger with a list handler using the rate limit filter.
+
+    Args:
+        name: The logger name.
+        rate_limit_filter: The rate limit filter.
+    """
+    handler = ListHandler()
+    rate_limit_filter.install(handler)
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def test_rate_limit_burst() -> None:
+    """Test that records above the burst are suppressed per key."""
+    rate_limit_filter = RateLimitFilter(rate=0.001, burst=5)
+    logger, handler = get_logger('rate-limit-burst', rate_limit_filter)
+
+    for i in range(100):
+        logger.error('dependency failed %s', i)
+        logger.warning('dependency failed %s', i)
+
+    messages = [r.getMessage() for r in handler.records]
+    assert len(messages) == 10
+    assert messages[:2] == ['dependency failed 0', 'dependency failed 0']
+
+    rate_limit_filter.flush_summaries()
+    summaries = [r for r in handler.records if getattr(r, 'rate_limit_summary', False)]
+    assert sorted((r.levelname, r.getMessage()) for r in summaries) == [
+        ('ERROR', 'suppressed 95 similar messages: dependency failed %s'),
+        ('WARNING', 'suppressed 95 similar messages: dependency failed %s'),
+    ]
+
+
+def test_rate_limit_periodic_summary() -> None:
+    """Test that the summary is sent once the summary interval has passed."""
+    rate_limit_filter = RateLimitFilter(rate=0.001, burst=1, summary_interval=0.05)
+    logger, handler = get_logger('rate-limit-summary', rate_limit_filter)
+
+    for _ in range(10):
+        logger.error('flood')
+    time.sleep(0.06)
+    logger.info('next')
+
+    assert [r.getMessage() for r in handler.records] == [
+        'flood',
+        'suppressed 9 similar messages: flood',
+        'next',
+    ]
+
+
+def test_rate_limit_summary_on_close() -> None:
+    """Test that the pending summaries are sent when the handler is closed."""
+    rate_limit_filter = RateLimitFilter(rate=0.001, burst=1)
+    logger, handler = get_logger('rate-limit-close', rate_limit_filter)
+
+    for _ in range(10):
+        logger.error('flood')
+    handler.close()
+    handler.close()
+
+    assert [r.getMessage() for r in handler.records] == [
+        'flood',
+        'suppressed 9 similar messages: flood',
+    ]
+
+
+def test_rate_limit_unhashable_msg() -> None:
+    """Test that records with an unhashable message are rate limited by the message repr."""
+    rate_limit_filter = RateLimitFilter(rate=0.001, burst=2)
+    logger, handler = get_logger('rate-limit-unhashable', rate_limit_filter)
+
+    for _ in range(10):
+        logger.error({'event': 'flood'})
+        logger.error(['flood'])
+
+    assert [r.msg for r in handler.records] == [{'event': 'flood'}, ['flood']] * 2
+    rate_limit_filter.flush_summaries()
+    assert [r.getMessage() for r in handler.records[4:]] == [
+        "suppressed 8 similar messages: {'event': 'flood'}",
+        "suppressed 8 similar messages: ['flood']",
+    ]
+
+
+def test_rate_limit_queue() -> None:
+    """Test that the records passed through the queue are keyed by the message template."""
+    rate_limit_filter = RateLimitFilter(rate=0.001, burst=5)
+    handler = ListHandler()
+    rate_limit_filter.install(handler)
+    queue_handler = QueueHandlerCustom(queue.Queue())
+    listener = QueueListenerCustom(queue_handler.queue, handler)
+    logger = logging.getLogger('rate-limit-queue')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(queue_handler)
+
+    listener.start()
+    for i in range(100):
+        logger.error('dependency failed %s', i)
+    listener.stop()
+    rate_limit_filter.flush_summaries()
+
+    messages = [r.getMessage() for r in handler.records]
+    assert messages == [f'dependency failed {i}' for i in range(5)] + [
+        'suppressed 95 similar messages: dependency failed %s'
+    ]
+
+
+def test_rate_limit_refill() -> None:
+    """Test that the bucket is refilled at the rate."""
+    rate_limit_filter = RateLimitFilter(rate=100, burst=1)
+    logger, handler = get_logger('rate-limit-refill', rate_limit_filter)
+
+    logger.error('refill')
+    logger.error('refill')
+    time.sleep(0.02)
+    logger.error('refill')
+
+    assert len(handler.records) == 2
+
+
+def test_rate_limit_lru() -> None:
+    """Test that the number of tracked keys is bounded."""
+    rate_limit_filter = RateLimitFilter(rate=0.001, burst=1, max_keys=10)
+    logger, handler = get_logger('rate-limit-lru', rate_limit_filter)
+
+    for i in range(100):
+        logger.error(f'unique {i}')
+
+    assert len(rate_limit_filter._buckets) == 10  # pylint: disable=protected-access
+    assert len(handler.records) == 100
+
+
+def test_rate_limit_threads() -> None:
+    """Test that the filter allows exactly the burst across threads."""
+    rate_limit_filter = RateLimitFilter(rate=0.001, burst=50)
+    logger, handler = get_logger('rate-limit-threads', rate_limit_filter)
+
+    def worker() -> None:
+        for _ in range(500):
+            logger.error('threaded')
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    rate_limit_filter.flush_summaries()
+    assert [r.getMessage() for r in handler.records].count('threaded') == 50
+    assert handler.records[-1].getMessage() == 'suppressed 3950 similar messages: threaded'
+
+
+def test_rate_limit_invalid() -> None:
+    """Test an invalid rate limit."""
+    with pytest.raises(RuntimeError):
+        RateLimitFilter(rate=0)
+
+
+def test_rate_limit_rotating_handler() -> None:
+    """Test the rotating_handler rate limit argument."""
+    lh = rotating_handler(filename='rate_limit.log', rate_limit=1.0, rate_limit_burst=2)
+    rate_limit_filter = lh.filters[0]
+    lh.close()
+
+    assert isinstance(rate_limit_filter, RateLimitFilter)
+    assert rate_limit_filter.handler is lh
+    assert rate_limit_filter.burst == 2
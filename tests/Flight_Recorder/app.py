@@ -0,0 +1,35 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.utils import flight_recorder_handler, rotating_handler
+
+
+class LoggerFlightRecorderResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        self.log.debug(f'DEBUG {key}')
+        self.log.info(f'INFO {key}')
+        if req.get_param_as_bool('fail'):
+            raise ValueError(f'failed {key}')
+        resp.text = f'Logged - {key}'
+
+
+rh: object = rotating_handler(
+    filename='flight_recorder.log',
+    formatter='%(request_id)s - %(levelname)s - %(message)s',
+    level='info',
+    name='flight-recorder-rfh',
+)
+frh: object = flight_recorder_handler([rh], capacity=10, per_request=True)
+app_flight_recorder_logger = falcon.App(
+    middleware=[LoggerMiddleware([frh], name='SERVER-FLIGHT-RECORDER', request_context=True)]
+)
+app_flight_recorder_logger.add_route('/middleware', LoggerFlightRecorderResource())
@@ -0,0 +1,164 @@
+"""Test the flight recorder handler."""
+# standard library
+import logging
+import os
+from uuid import uuid4
+
+# third-party
+import falcon
+import pytest
+from falcon import testing
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.utils import flight_recorder_handler
+
+
+class ListHandler(logging.Handler):
+    """Handler that stores the records in a list."""
+
+    def __init__(self, level: int | None = logging.NOTSET):
+        """Initialize class properties."""
+        logging.Handler.__init__(self, level)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store the record."""
+        self.records.append(record)
+
+
+def get_logger(name: str, **kwargs) -> tuple[logging.Logger, ListHandler, object]:
+    """Return a logger with a flight recorder writing to a list handler.
+
+    Args:
+        name: The logger name.
+        **kwargs: Any argument supported by flight_recorder_handler().
+    """
+    handler = ListHandler(logging.INFO)
+    frh = flight_recorder_handler([handler], **kwargs)
+    logger = logging.getLogger(name)
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(frh)
+    return logger, handler, frh
+
+
+def read_lines(logfile: str, text: str) -> list[str]:
+    """Return the lines in the log file that contain the unique text.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        return [line for line in fh.read().strip().split('\n') if text in line]
+
+
+def test_flight_recorder_global() -> None:
+    """Test that the buffered records are only written when an error is logged."""
+    logger, handler, _ = get_logger('flight-recorder-global', capacity=3)
+
+    for i in range(5):
+        logger.debug('debug %s', i)
+    logger.info('info')
+    assert [r.getMessage() for r in handler.records] == ['info']
+
+    logger.error('error')
+    assert [r.getMessage() for r in handler.records] == [
+        'info',
+        'debug 2',
+        'debug 3',
+        'debug 4',
+        'error',
+    ]
+
+    # the buffer is empty after the dump
+    logger.error('error')
+    assert len(handler.records) == 6
+
+
+def test_flight_recorder_max_bytes() -> None:
+    """Test that the buffer is bounded by the estimated record size."""
+    logger, handler, frh = get_logger('flight-recorder-bytes', capacity=1_000, max_bytes=4_000)
+
+    for i in range(100):
+        logger.debug('x' * 500 + ' %s', i)
+    assert frh._bytes <= 4_000  # pylint: disable=protected-access
+
+    logger.critical('critical')
+    messages = [r.getMessage() for r in handler.records]
+    assert len(messages) == 4
+    assert messages[-2].endswith(' 99')
+
+
+def test_flight_recorder_request(client_flight_recorder: object, log_directory: str) -> None:
+    """Test that only the debug records of the failed request are written.
+
+    Args:
+        client_flight_recorder (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'flight_recorder.log')
+    ok_key = f'{uuid4()}'
+    fail_key = f'{uuid4()}'
+
+    response: Result = client_flight_recorder.simulate_get('/middleware', params={'key': ok_key})
+    assert response.status_code == 200
+    response = client_flight_recorder.simulate_get(
+        '/middleware', params={'key': fail_key, 'fail': 'true'}
+    )
+    assert response.status_code == 500
+
+    assert [line.split(' - ', 1)[1] for line in read_lines(logfile, ok_key)] == [
+        f'INFO - INFO {ok_key}'
+    ]
+    lines = read_lines(logfile, fail_key)
+    assert [line.split(' - ', 1)[1] for line in lines] == [
+        f'INFO - INFO {fail_key}',
+        f'DEBUG - DEBUG {fail_key}',
+    ]
+    request_id = lines[0].split(' - ', 1)[0]
+    assert read_lines(logfile, f'{request_id} - ERROR - Request failed: GET /middleware 500')
+
+
+@pytest.mark.parametrize('use_queue', [False, True])
+def test_flight_recorder_request_succeeded(use_queue: bool) -> None:
+    """Test that the buffered records of a succeeded request are discarded.
+
+    Args:
+        use_queue: If True, route the handlers through the middleware queue.
+    """
+
+    class FlightRecorderResource:
+        """Logger middleware testing resource."""
+
+        log = None
+
+        def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+            """Support GET method."""
+            self.log.debug('DEBUG %s', req.get_param('key'))
+            if req.get_param_as_bool('fail'):
+                raise ValueError('failed')
+
+    handler = ListHandler(logging.INFO)
+    frh = flight_recorder_handler([handler], per_request=True)
+    middleware = LoggerMiddleware(
+        [frh],
+        name=f'SERVER-FLIGHT-RECORDER-SUCCEEDED-{use_queue}',
+        level='DEBUG',
+        request_context=True,
+        use_queue=use_queue,
+    )
+    app = falcon.App(middleware=[middleware])
+    app.add_route('/middleware', FlightRecorderResource())
+    client = testing.TestClient(app)
+
+    for i in range(10):
+        assert client.simulate_get('/middleware', params={'key': i}).status_code == 200
+    assert client.simulate_get('/middleware', params={'fail': 'true'}).status_code == 500
+    middleware.shutdown()
+
+    # only the failed request is logged and none of the request rings are left
+    assert [r.levelname for r in handler.records] == ['DEBUG', 'ERROR']
+    assert not frh._rings  # pylint: disable=protected-access
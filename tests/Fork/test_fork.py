@@ -0,0 +1,248 @@
+"""Test the handler reinitialization in forked child processes."""
+# standard library
+import logging
+import os
+import socket
+import traceback
+from collections.abc import Callable
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.rotating import fcntl
+from falcon_provider_logger.syslog_handlers import (
+    SysLogHandlerCustom,
+    SysLogHandlerTcp,
+    SysLogHandlerUdp,
+)
+from falcon_provider_logger.utils import mmap_handler, rotating_handler
+
+pytestmark = pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+
+
+def fork_children(target: Callable[[int], None], count: int | None = 3) -> list[int]:
+    """Run the target in forked child processes and return the child pids.
+
+    Args:
+        target: The function called with the child number in each child.
+        count: The number of child processes.
+    """
+    pids = []
+    for i in range(count):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            # the child never returns to pytest
+            code = 1
+            try:
+                target(i)
+                code = 0
+            except BaseException:  # pylint: disable=broad-except
+                traceback.print_exc()
+            finally:
+                os._exit(code)  # pylint: disable=protected-access
+        pids.append(pid)
+
+    for pid in pids:
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+    return pids
+
+
+def get_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    """Return a logger that only writes to the handler.
+
+    Args:
+        name: The logger name.
+        handler: The logging handler.
+    """
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    return logger
+
+
+def receive_datagrams(sock: socket.socket) -> list[bytes]:
+    """Return the datagrams received on the socket until it times out.
+
+    Args:
+        sock: The bound UDP socket.
+    """
+    datagrams = []
+    try:
+        while True:
+            datagrams.append(sock.recv(65_535))
+    except socket.timeout:
+        return datagrams
+
+
+@pytest.fixture
+def udp_receiver() -> socket.socket:
+    """Return a bound UDP socket."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.settimeout(1.0)
+    yield sock
+    sock.close()
+
+
+def test_fork_rotating_queue(tmp_path: object) -> None:
+    """Test that children write their own records through the queue without parent records.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    lh = rotating_handler(
+        directory=str(tmp_path),
+        filename='fork.log',
+        formatter='%(process)d - %(message)s',
+        buffer_records=100,
+        flush_interval=60,
+    )
+    middleware = LoggerMiddleware([lh], name='SERVER-FORK', level='INFO', use_queue=True)
+    middleware.log.info('parent buffered')
+    # the queued record is buffered by the handler before the fork
+    middleware.queue_handler.queue.join()
+
+    def child(i: int) -> None:
+        middleware.log.info('child %s', i)
+        middleware.shutdown()
+
+    pids = fork_children(child)
+    middleware.shutdown()
+    lh.close()
+
+    with open(tmp_path / 'fork.log', encoding='utf-8') as fh:
+        lines = fh.read().splitlines()
+    assert sorted(lines) == sorted(
+        [f'{os.getpid()} - parent buffered'] + [f'{pid} - child {i}' for i, pid in enumerate(pids)]
+    )
+
+
+def test_fork_multiprocess_lock(tmp_path: object) -> None:
+    """Test that the child doesn't share the lock file description of the parent.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    lh = rotating_handler(directory=str(tmp_path), filename='lock.log', multiprocess=True)
+    fcntl.flock(lh._lock_fd, fcntl.LOCK_EX)  # pylint: disable=protected-access
+    try:
+
+        def child(_: int) -> None:
+            with pytest.raises(BlockingIOError):
+                # the lock held by the parent blocks the child
+                fcntl.flock(lh._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)  # pylint: disable=W0212
+
+        fork_children(child, count=1)
+    finally:
+        fcntl.flock(lh._lock_fd, fcntl.LOCK_UN)  # pylint: disable=protected-access
+        lh.close()
+
+
+def test_fork_syslog_rfc5424_procid(udp_receiver: socket.socket) -> None:
+    """Test that the RFC 5424 procid is the pid of the child that sent the record.
+
+    Args:
+        udp_receiver (fixture): A bound UDP socket.
+    """
+    lh = SysLogHandlerCustom(
+        address=udp_receiver.getsockname(), socktype=socket.SOCK_DGRAM, rfc5424=True
+    )
+    logger = get_logger('SERVER-FORK-SYSLOG', lh)
+    logger.info('parent')
+
+    pids = fork_children(lambda i: logger.info('child %s', i))
+    lh.close()
+
+    procids = {}
+    for datagram in receive_datagrams(udp_receiver):
+        fields = datagram.decode().split(' ')
+        procids[fields[-1]] = int(fields[4])
+    assert procids == {
+        'parent': os.getpid(),
+        **{str(i): pid for i, pid in enumerate(pids)},
+    }
+
+
+def test_fork_syslog_udp_sender(udp_receiver: socket.socket) -> None:
+    """Test that the batch UDP sender thread is restarted in the child.
+
+    Args:
+        udp_receiver (fixture): A bound UDP socket.
+    """
+    lh = SysLogHandlerUdp(address=udp_receiver.getsockname(), flush_interval=60)
+    lh.setFormatter(logging.Formatter('%(message)s'))
+    logger = get_logger('SERVER-FORK-UDP', lh)
+
+    def child(i: int) -> None:
+        # the error record wakes the sender thread
+        logger.error('child %s', i)
+        lh.close()
+
+    fork_children(child)
+    lh.close()
+
+    datagrams = sorted(receive_datagrams(udp_receiver))
+    assert datagrams == [f'<11>child {i}\x00'.encode() for i in range(3)]
+
+
+def test_fork_syslog_spool_slot(tmp_path: object) -> None:
+    """Test that the child spools to its own slot instead of the spool of the parent.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    sh = SysLogHandlerTcp(
+        address=('127.0.0.1', port), backoff_max=0.1, spool_directory=str(tmp_path)
+    )
+    try:
+
+        def child(_: int) -> None:
+            assert sh.spool.filename != parent_filename
+
+        parent_filename = sh.spool.filename
+        fork_children(child, count=1)
+    finally:
+        sh.close()
+
+
+def test_fork_closed_handlers(tmp_path: object, udp_receiver: socket.socket) -> None:
+    """Test that closed handlers don't open sockets or start threads in the child.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+        udp_receiver (fixture): A bound UDP socket.
+    """
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    handlers = [
+        rotating_handler(directory=str(tmp_path), filename='closed.log', buffer_records=10),
+        mmap_handler(directory=str(tmp_path), filename='closed.mmap', segment_size=65_536),
+        SysLogHandlerUdp(address=udp_receiver.getsockname()),
+        SysLogHandlerTcp(address=('127.0.0.1', port), backoff_max=0.1),
+    ]
+    for h in handlers:
+        h.close()
+
+    def child(_: int) -> None:
+        for h in handlers:
+            # the sockets, files, and mapped segments stay closed (python 3.10 doesn't reset
+            # the closed syslog socket to None)
+            for attr in ('stream', 'mmap'):
+                assert getattr(h, attr, None) is None
+            sock = getattr(h, 'socket', None)
+            assert sock is None or sock.fileno() == -1
+            # the flush, sync, and sender threads are not restarted
+            for attr in ('_flush_thread', '_sync_thread', '_thread'):
+                thread = getattr(h, attr, None)
+                assert thread is None or not thread.is_alive()
+
+    fork_children(child, count=1)
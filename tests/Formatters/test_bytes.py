@@ -0,0 +1,157 @@
+"""Test bytes-native record formatting."""
+# standard library
+import logging
+import os
+import sys
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_logger.formatters import FAST_FORMAT, CachedTimeFormatter, StructuredFormatter
+from falcon_provider_logger.syslog_handlers import SysLogHandlerTcp
+from falcon_provider_logger.utils import DEFAULT_FORMAT, rotating_handler
+
+
+def make_record(msg: str = 'request %s completed é', args: tuple = ('abc',)) -> logging.LogRecord:
+    """Return a log record.
+
+    Args:
+        msg: The record message.
+        args: The record message args.
+
+    Returns:
+        LogRecord: The log record.
+    """
+    return logging.LogRecord('bytes', logging.INFO, __file__, 10, msg, args, None, 'test_bytes')
+
+
+@pytest.mark.parametrize(
+    'fmt,datefmt',
+    [
+        (DEFAULT_FORMAT, None),
+        (FAST_FORMAT, None),
+        (FAST_FORMAT, '%Y-%m-%dT%H:%M:%S %%'),
+        ('%(levelname)-8s %(name)s %(lineno)04d %(message)r 100%%', None),
+        ('%(created)f %(msecs)03d %(relativeCreated).1f %(process)s %(thread)x', None),
+        ('%(message)a %(funcName)s %(module)s', None),
+    ],
+)
+def test_format_bytes_matches_format(fmt: str, datefmt: str | None) -> None:
+    """Test that the bytes-native output matches the encoded str output.
+
+    Args:
+        fmt: The format string.
+        datefmt: The date format.
+    """
+    formatter = CachedTimeFormatter(fmt, datefmt=datefmt)
+    assert formatter.bytes_native is True
+    record = make_record()
+    expected = formatter.format(record).encode('utf-8')
+    assert formatter.format_bytes(record) == expected
+    assert formatter.format_bytes(record, b'<14>', b'\n') == b'<14>' + expected + b'\n'
+
+
+@pytest.mark.parametrize(
+    'fmt',
+    [
+        '%(name)-10s|%(message).5s|%(funcName)12s|%(levelname)-8s|',
+        '%(message)-30s|%(name).3s|%(message)20r|%(threadName)-5.2s|',
+        '%(asctime)-30s|%(message)10a|',
+    ],
+)
+def test_format_bytes_width_non_ascii(fmt: str) -> None:
+    """Test that the width and precision of string fields count characters, not bytes.
+
+    Args:
+        fmt: The format string.
+    """
+    formatter = CachedTimeFormatter(fmt, datefmt='%d %b é')
+    record = make_record('ééé %s ü', ('ñ',))
+    record.name = 'név'
+    record.funcName = 'función'
+    # twice to include the cached values
+    for _ in range(2):
+        assert formatter.format_bytes(record) == formatter.format(record).encode('utf-8')
+
+
+def test_format_bytes_exception() -> None:
+    """Test that records with exception info use the str path."""
+    formatter = CachedTimeFormatter(FAST_FORMAT)
+    try:
+        raise ValueError('bytes')
+    except ValueError:
+        record = make_record()
+        record.exc_info = sys.exc_info()
+    data = formatter.format_bytes(record, suffix=b'\n')
+    assert data == formatter.format(record).encode('utf-8') + b'\n'
+    assert b'ValueError: bytes' in data
+
+
+def test_format_bytes_styles() -> None:
+    """Test that only %-style formats are bytes-native."""
+    assert CachedTimeFormatter('{message}', style='{').bytes_native is False
+    assert CachedTimeFormatter('$message', style='$').bytes_native is False
+
+
+@pytest.mark.parametrize(
+    'output,json_backend', [('json', 'auto'), ('json', 'stdlib'), ('logfmt', 'auto')]
+)
+def test_structured_format_bytes(output: str, json_backend: str) -> None:
+    """Test the structured formatter bytes output.
+
+    Args:
+        output: The structured output format.
+        json_backend: The JSON backend.
+    """
+    formatter = StructuredFormatter(
+        fields=['name', 'levelname', 'message', 'lineno'], output=output, json_backend=json_backend
+    )
+    record = make_record()
+    data = formatter.format_bytes(record, b'>', b'\n')
+    assert data.startswith(b'>') and data.endswith(b'\n')
+    assert data[1:-1].decode('utf-8') == formatter.format(record)
+
+
+def test_rotating_handler_bytes(tmp_path: str) -> None:
+    """Test that the rotating handler writes the same output for both paths.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+    """
+    lines = []
+    for bytes_native in [True, False]:
+        formatter = CachedTimeFormatter('%(levelname)s %(message)s')
+        formatter.bytes_native = bytes_native
+        handler = rotating_handler(
+            directory=str(tmp_path), filename=f'{bytes_native}.log', formatter=formatter
+        )
+        handler.handle(make_record())
+        handler.close()
+        with open(os.path.join(tmp_path, f'{bytes_native}.log'), 'rb') as fh:
+            lines.append(fh.read())
+    assert lines[0] == lines[1] == 'INFO request abc completed é\n'.encode('utf-8')
+
+
+@pytest.mark.parametrize(
+    'framing,expected',
+    [
+        ('octet-counting', b'16 <14>INFO message'),
+        ('non-transparent', b'<14>INFO message\n'),
+        ('null', b'<14>INFO message\x00'),
+    ],
+)
+def test_syslog_tcp_framing_bytes(framing: str, expected: bytes) -> None:
+    """Test the TCP syslog framing of the bytes-native path.
+
+    Args:
+        framing: The framing method.
+        expected: The framed message.
+    """
+    handler = SysLogHandlerTcp(('127.0.0.1', 1), framing=framing)
+    try:
+        handler.setFormatter(CachedTimeFormatter('%(levelname)s %(message)s'))
+        record = make_record('message', None)
+        assert handler.encode_record(record) == expected
+    finally:
+        handler.close()
@@ -0,0 +1,121 @@
+"""Test cached time formatter and caller lookup."""
+# standard library
+import logging
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_logger.formatters import (
+    CachedTimeFormatter,
+    StructuredFormatter,
+    formatter_uses_caller,
+)
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.utils import get_formatter
+
+
+class ListHandler(logging.Handler):
+    """Handler that stores the records."""
+
+    def __init__(self) -> None:
+        """Initialize class properties."""
+        super().__init__()
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store the record."""
+        self.records.append(record)
+
+
+def make_record(created: float) -> logging.LogRecord:
+    """Return a log record with the provided creation time.
+
+    Args:
+        created: The record creation time.
+
+    Returns:
+        LogRecord: The log record.
+    """
+    record = logging.makeLogRecord({'msg': 'cached', 'levelname': 'INFO'})
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+    return record
+
+
+@pytest.mark.parametrize('datefmt', [None, '%Y-%m-%dT%H:%M:%S'])
+def test_cached_time_matches_stdlib(datefmt: str | None) -> None:
+    """Test that the cached asctime matches the stdlib formatter output.
+
+    Args:
+        datefmt: The date format.
+    """
+    fmt = '%(asctime)s %(message)s'
+    cached = CachedTimeFormatter(fmt, datefmt=datefmt)
+    stdlib = logging.Formatter(fmt, datefmt=datefmt)
+    for created in [1_700_000_000.123, 1_700_000_000.456, 1_700_000_001.789]:
+        record = make_record(created)
+        assert cached.format(record) == stdlib.format(record)
+
+
+def test_formatter_uses_caller() -> None:
+    """Test the detection of formatters that use the caller info."""
+    assert formatter_uses_caller(None) is False
+    assert formatter_uses_caller(get_formatter()) is True
+    assert formatter_uses_caller(get_formatter('fast')) is False
+    assert formatter_uses_caller(logging.Formatter('%(message)s')) is False
+    assert formatter_uses_caller(logging.Formatter('%(lineno)d %(message)s')) is True
+    assert formatter_uses_caller(StructuredFormatter(fields=['message'])) is False
+    assert formatter_uses_caller(StructuredFormatter()) is True
+
+
+@pytest.mark.parametrize(
+    'caller_lookup,formatter,expected',
+    [
+        (True, 'fast', 'test_caller_lookup'),
+        (False, None, '(unknown function)'),
+        ('auto', 'fast', '(unknown function)'),
+        ('auto', None, 'test_caller_lookup'),
+    ],
+)
+def test_caller_lookup(caller_lookup: bool | str, formatter: str | None, expected: str) -> None:
+    """Test disabling the caller lookup on the middleware logger.
+
+    Args:
+        caller_lookup: The middleware caller_lookup setting.
+        formatter: The formatter profile for the handler.
+        expected: The expected record funcName.
+    """
+    handler = ListHandler()
+    handler.setFormatter(get_formatter(formatter))
+    logger = logging.getLogger(f'caller-lookup-{caller_lookup}-{formatter}')
+    logger.propagate = False
+    middleware = LoggerMiddleware([handler], logger=logger, caller_lookup=caller_lookup)
+
+    middleware.log.warning('caller')
+    assert handler.records[0].funcName == expected
+
+
+@pytest.mark.parametrize('caller_lookup', [False, 'auto'])
+def test_caller_lookup_stack_info(caller_lookup: bool | str) -> None:
+    """Test that the stack info is kept when the caller lookup is disabled.
+
+    Args:
+        caller_lookup: The middleware caller_lookup setting.
+    """
+    handler = ListHandler()
+    handler.setFormatter(get_formatter('fast'))
+    logger = logging.getLogger(f'caller-lookup-stack-info-{caller_lookup}')
+    logger.propagate = False
+    middleware = LoggerMiddleware([handler], logger=logger, caller_lookup=caller_lookup)
+
+    middleware.log.warning('stack', stack_info=True)
+    middleware.log.warning('no stack')
+    logger.warning('logger stack', stack_info=True)
+    assert handler.records[0].stack_info.startswith('Stack (most recent call last):')
+    assert 'test_caller_lookup_stack_info' in handler.records[0].stack_info
+    assert handler.records[0].funcName == 'test_caller_lookup_stack_info'
+    assert handler.records[1].stack_info is None
+    assert handler.records[1].funcName == '(unknown function)'
+    assert 'test_caller_lookup_stack_info' in handler.format(handler.records[0])
+    assert handler.records[2].funcName == 'test_caller_lookup_stack_info'
@@ -0,0 +1,104 @@
+"""Test structured formatter."""
+# standard library
+import json
+import logging
+import sys
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_logger.formatters import StructuredFormatter
+from falcon_provider_logger.utils import get_formatter
+
+
+def make_record(msg: str, *args, **kwargs) -> logging.LogRecord:
+    """Return a log record.
+
+    Args:
+        msg: The log message.
+        *args: The message args.
+        **kwargs: Additional record attributes.
+
+    Returns:
+        LogRecord: The log record.
+    """
+    record = logging.LogRecord('structured', logging.INFO, __file__, 10, msg, args, None, 'func')
+    record.__dict__.update(kwargs)
+    return record
+
+
+@pytest.mark.parametrize('json_backend', ['auto', 'stdlib'])
+def test_structured_json(json_backend: str) -> None:
+    """Test JSON output with a field plan.
+
+    Args:
+        json_backend: The JSON backend.
+    """
+    formatter = StructuredFormatter(
+        fields={'level': 'levelname', 'msg': 'message', 'line': 'lineno', 'rid': 'request_id'},
+        json_backend=json_backend,
+        static_fields={'app': 'test'},
+    )
+    data = json.loads(formatter.format(make_record('hello %s', 'world', request_id='abc')))
+    assert data == {'level': 'INFO', 'msg': 'hello world', 'line': 10, 'rid': 'abc', 'app': 'test'}
+
+
+def test_structured_skip_asctime() -> None:
+    """Test that asctime is only computed when requested."""
+
+    class CountingFormatter(StructuredFormatter):
+        """Count the formatTime calls."""
+
+        count = 0
+
+        def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+            """Count and format the time."""
+            self.count += 1
+            return super().formatTime(record, datefmt)
+
+    formatter = CountingFormatter(fields=['message'])
+    formatter.format(make_record('no time'))
+    assert formatter.count == 0
+
+    formatter = CountingFormatter(fields=['asctime', 'message'])
+    formatter.format(make_record('time'))
+    assert formatter.count == 1
+
+
+def test_structured_logfmt() -> None:
+    """Test logfmt output and value quoting."""
+    formatter = StructuredFormatter(fields=['levelname', 'message', 'empty'], output='logfmt')
+    assert formatter.format(make_record('plain')) == 'levelname=INFO message=plain empty='
+    assert (
+        formatter.format(make_record('say "hi" a=b'))
+        == 'levelname=INFO message="say \\"hi\\" a=b" empty='
+    )
+
+
+def test_structured_exception() -> None:
+    """Test that exception info is included."""
+    formatter = StructuredFormatter(fields=['message'])
+    try:
+        raise ValueError('bad value')
+    except ValueError:
+        record = make_record('failed', exc_info=sys.exc_info())
+    data = json.loads(formatter.format(record))
+    assert data['message'] == 'failed'
+    assert 'ValueError: bad value' in data['exc_info']
+
+
+def test_structured_invalid() -> None:
+    """Test invalid formatter arguments."""
+    with pytest.raises(RuntimeError):
+        StructuredFormatter(output='xml')
+    with pytest.raises(RuntimeError):
+        StructuredFormatter(json_backend='invalid')
+
+
+def test_get_formatter() -> None:
+    """Test the formatter shortcuts accepted by the handler factory methods."""
+    assert isinstance(get_formatter('json'), StructuredFormatter)
+    assert get_formatter('logfmt').output == 'logfmt'
+    assert get_formatter('%(message)s').format(make_record('custom')) == 'custom'
+    assert 'structured - INFO - default' in get_formatter().format(make_record('default'))
@@ -0,0 +1,31 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.resources import LogLevelResource
+from falcon_provider_logger.utils import rotating_handler
+
+
+class LoggerLevelsResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        self.log.debug(f'DEBUG {key}')
+        self.log.info(f'INFO {key}')
+        resp.text = f'Logged - {key}'
+
+
+rh: object = rotating_handler(
+    filename='levels.log', formatter='fast', level='info', name='levels-rfh'
+)
+app_levels_logger = falcon.App(
+    middleware=[LoggerMiddleware([rh], name='SERVER-LEVELS', level='INFO', use_queue=True)]
+)
+app_levels_logger.add_route('/middleware', LoggerLevelsResource())
+app_levels_logger.add_route('/admin/levels', LogLevelResource(max_duration=60))
@@ -0,0 +1,131 @@
+"""Test the runtime log level resource."""
+# standard library
+import logging
+import os
+import time
+from uuid import uuid4
+
+# third-party
+from falcon.testing import Result
+
+
+def count_text(logfile: str, text: str) -> int:
+    """Count the lines in the log file that contain the unique text.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        int: The number of lines that contain the text.
+    """
+    time.sleep(0.10)  # allow time for the queue to flush
+    with open(logfile, encoding='utf-8') as fh:
+        return sum(1 for line in fh.read().strip().split('\n') if text in line)
+
+
+def test_levels_get(client_levels: object) -> None:
+    """Test the levels of the registered loggers.
+
+    Args:
+        client_levels (fixture): The test client.
+    """
+    response: Result = client_levels.simulate_get('/admin/levels', params={'name': 'SERVER-LEVELS'})
+
+    assert response.json == {
+        'name': 'SERVER-LEVELS',
+        'level': 'INFO',
+        'effective_level': 'INFO',
+        'handlers': {'levels-rfh': 'INFO'},
+        'expires_in': None,
+    }
+    response = client_levels.simulate_get('/admin/levels')
+    assert 'SERVER-LEVELS' in [logger['name'] for logger in response.json['loggers']]
+
+
+def test_levels_debug_window(client_levels: object, log_directory: str) -> None:
+    """Test a time-boxed debug level change that is reverted automatically.
+
+    Args:
+        client_levels (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'levels.log')
+
+    response: Result = client_levels.simulate_put(
+        '/admin/levels', json={'name': 'SERVER-LEVELS', 'level': 'debug', 'duration': 0.3}
+    )
+    assert response.json['level'] == 'DEBUG'
+    assert response.json['handlers'] == {'levels-rfh': 'DEBUG'}
+    assert 0 < response.json['expires_in'] <= 0.3
+
+    key = f'{uuid4()}'
+    client_levels.simulate_get('/middleware', params={'key': key})
+    assert count_text(logfile, f'DEBUG {key}') == 1
+
+    time.sleep(0.3)
+    key = f'{uuid4()}'
+    client_levels.simulate_get('/middleware', params={'key': key})
+    assert count_text(logfile, f'DEBUG {key}') == 0
+    assert count_text(logfile, f'INFO {key}') == 1
+
+    response = client_levels.simulate_get('/admin/levels', params={'name': 'SERVER-LEVELS'})
+    assert response.json['level'] == 'INFO'
+    assert response.json['handlers'] == {'levels-rfh': 'INFO'}
+
+
+def test_levels_restore(client_levels: object) -> None:
+    """Test restoring the levels before the time-boxed change expires.
+
+    Args:
+        client_levels (fixture): The test client.
+    """
+    client_levels.simulate_put(
+        '/admin/levels', json={'name': 'SERVER-LEVELS', 'level': 'DEBUG', 'duration': 30}
+    )
+    # a second change keeps the levels saved before the first change
+    client_levels.simulate_put(
+        '/admin/levels', json={'name': 'SERVER-LEVELS', 'level': 'WARNING', 'duration': 30}
+    )
+    response: Result = client_levels.simulate_delete(
+        '/admin/levels', params={'name': 'SERVER-LEVELS'}
+    )
+
+    assert response.json['level'] == 'INFO'
+    assert response.json['expires_in'] is None
+
+
+def test_levels_invalid(client_levels: object) -> None:
+    """Test invalid level changes.
+
+    Args:
+        client_levels (fixture): The test client.
+    """
+    for body in [
+        {'level': 'DEBUG'},
+        {'name': 'SERVER-LEVELS', 'level': 'NOT-A-LEVEL'},
+        {'name': 'SERVER-LEVELS', 'level': 'DEBUG', 'duration': 600},
+    ]:
+        response: Result = client_levels.simulate_put('/admin/levels', json=body)
+        assert response.status_code == 400
+
+
+def test_levels_unknown_logger(client_levels: object) -> None:
+    """Test that an unknown logger name returns a 404 without creating the logger.
+
+    Args:
+        client_levels (fixture): The test client.
+    """
+    name = f'SERVER-LEVELS-{uuid4()}'
+    responses: list[Result] = [
+        client_levels.simulate_get('/admin/levels', params={'name': name}),
+        client_levels.simulate_delete('/admin/levels', params={'name': name}),
+        client_levels.simulate_put('/admin/levels', json={'name': name, 'level': 'DEBUG'}),
+    ]
+    assert [r.status_code for r in responses] == [404, 404, 404]
+    assert name not in logging.root.manager.loggerDict
+
+    # an existing logger that isn't registered by the middleware can be viewed
+    logging.getLogger('levels-existing').setLevel(logging.WARNING)
+    response = client_levels.simulate_get('/admin/levels', params={'name': 'levels-existing'})
+    assert response.json['level'] == 'WARNING'
@@ -0,0 +1,30 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.resources import MetricsResource
+from falcon_provider_logger.utils import rotating_handler
+
+
+class LoggerMetricsResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        self.log.debug(f'DEBUG {key}')
+        self.log.info(f'INFO {key}')
+        self.log.error(f'ERROR {key}')
+        resp.text = f'Logged - {key}'
+
+
+rh: object = rotating_handler(filename='metrics.log', level='info', name='metrics-rfh')
+app_metrics_logger = falcon.App(
+    middleware=[LoggerMiddleware([rh], name='SERVER-METRICS', level='INFO', metrics=True)]
+)
+app_metrics_logger.add_route('/middleware', LoggerMetricsResource())
+app_metrics_logger.add_route('/admin/metrics', MetricsResource())
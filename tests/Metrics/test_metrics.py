@@ -0,0 +1,198 @@
+"""Test the logging pipeline metrics."""
+# standard library
+import logging
+import threading
+from uuid import uuid4
+
+# third-party
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_logger.metrics import Metrics, MetricsRegistry, instrument_handler
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.utils import rotating_handler
+
+
+class CountingHandler(logging.Handler):
+    """Handler without metrics support that tracks its own dropped records."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        logging.Handler.__init__(self)
+        self.dropped = 3
+        self.records = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store the record."""
+        self.records.append(record)
+
+
+def record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    """Return a log record for the message.
+
+    Args:
+        msg: The record message.
+        level: The record level.
+    """
+    return logging.makeLogRecord(
+        {'msg': msg, 'levelno': level, 'levelname': logging.getLevelName(level)}
+    )
+
+
+def test_metrics_middleware(client_metrics: object) -> None:
+    """Test the logger and handler metrics recorded by the middleware.
+
+    Args:
+        client_metrics (fixture): The test client.
+    """
+    before: dict = client_metrics.simulate_get('/admin/metrics', params={'format': 'json'}).json
+    for _ in range(3):
+        response: Result = client_metrics.simulate_get('/middleware', params={'key': str(uuid4())})
+        assert response.status_code == 200
+    after: dict = client_metrics.simulate_get('/admin/metrics', params={'format': 'json'}).json
+
+    def delta(source: str, name: str, level: str) -> int:
+        return after[source]['counters'][name][level] - before.get(source, {}).get(
+            'counters', {}
+        ).get(name, {}).get(level, 0)
+
+    # the debug records are not enabled for the logger
+    assert delta('SERVER-METRICS', 'records_logged_total', 'INFO') == 3
+    assert delta('SERVER-METRICS', 'records_logged_total', 'ERROR') == 3
+    assert 'DEBUG' not in after['SERVER-METRICS']['counters']['records_logged_total']
+    assert delta('metrics-rfh', 'records_emitted_total', 'INFO') == 3
+    assert delta('metrics-rfh', 'records_emitted_total', 'ERROR') == 3
+
+    handler = after['metrics-rfh']
+    assert handler['counters']['bytes_total'] > 0
+    assert handler['histograms']['format_seconds']['count'] >= 6
+    assert handler['histograms']['emit_seconds']['buckets']['+Inf'] >= 6
+
+
+def test_metrics_prometheus(client_metrics: object) -> None:
+    """Test the metrics in the Prometheus text format.
+
+    Args:
+        client_metrics (fixture): The test client.
+    """
+    client_metrics.simulate_get('/middleware', params={'key': str(uuid4())})
+    response: Result = client_metrics.simulate_get('/admin/metrics')
+
+    assert response.headers['content-type'].startswith('text/plain; version=0.0.4')
+    lines = response.text.splitlines()
+    assert lines.count('# TYPE falcon_logger_records_emitted_total counter') == 1
+    assert '# TYPE falcon_logger_emit_seconds histogram' in lines
+    assert any(
+        line.startswith('falcon_logger_records_emitted_total{source="metrics-rfh",level="INFO"} ')
+        for line in lines
+    )
+    assert any(
+        line.startswith('falcon_logger_emit_seconds_bucket{source="metrics-rfh",le="+Inf"} ')
+        for line in lines
+    )
+
+
+def test_metrics_threads() -> None:
+    """Test that the per thread counters are exact and retired when the threads exit."""
+    metrics = Metrics('threads', registry=MetricsRegistry())
+
+    def worker() -> None:
+        for _ in range(10_000):
+            metrics.inc('records_total', 'INFO')
+            metrics.observe('emit_seconds', 0.000_02)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    snapshot = metrics.snapshot()
+    assert snapshot['counters']['records_total'] == {'INFO': 80_000}
+    assert snapshot['histograms']['emit_seconds']['buckets'][0.000_01] == 0
+    assert snapshot['histograms']['emit_seconds']['buckets'][0.000_025] == 80_000
+    assert snapshot['histograms']['emit_seconds']['count'] == 80_000
+    # the shards of the exited threads are merged
+    assert not metrics._shards  # pylint: disable=protected-access
+    assert metrics.snapshot()['counters'] == snapshot['counters']
+
+
+def test_metrics_rotation_and_dropped(tmp_path: object) -> None:
+    """Test the rotation and dropped (rate limited) record metrics.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    lh = rotating_handler(
+        directory=str(tmp_path),
+        filename='rotation.log',
+        formatter='%(message)s',
+        max_bytes=1_000,
+        backup_count=2,
+        name='metrics-rotation',
+        rate_limit=1,
+        rate_limit_burst=50,
+        metrics=True,
+    )
+    for _ in range(100):
+        lh.handle(record('record ' + 'x' * 50))
+    lh.close()
+
+    snapshot = lh.metrics.snapshot()
+    # the suppressed records summary is emitted when the handler is closed
+    assert snapshot['counters']['records_emitted_total'] == {'INFO': 51}
+    assert snapshot['counters']['records_dropped_total'] == {'INFO': 50}
+    assert snapshot['counters']['rotations_total'] >= 2
+    assert snapshot['histograms']['rotation_seconds']['count'] >= 2
+
+
+def test_metrics_other_handler() -> None:
+    """Test the metrics of a handler that doesn't format outside of the lock."""
+    registry = MetricsRegistry()
+    handler = CountingHandler()
+    handler.addFilter(lambda r: r.levelno >= logging.WARNING)
+    metrics = instrument_handler(handler, 'metrics-counting', registry=registry)
+    assert instrument_handler(handler) is metrics
+
+    handler.handle(record('info'))
+    handler.handle(record('warning', logging.WARNING))
+
+    snapshot = registry.snapshot()['metrics-counting']
+    assert len(handler.records) == 1
+    assert snapshot['counters']['records_emitted_total'] == {'WARNING': 1}
+    assert snapshot['counters']['records_dropped_total'] == {'INFO': 1}
+    assert snapshot['counters']['send_dropped_total'] == 3
+    assert snapshot['histograms']['emit_seconds']['count'] == 1
+
+
+def test_metrics_duplicate_name() -> None:
+    """Test that handlers with the same name don't replace each other's metrics."""
+    registry = MetricsRegistry()
+    handlers = [CountingHandler() for _ in range(3)]
+    for h in handlers:
+        h.set_name('sh')
+        instrument_handler(h, registry=registry)
+    handlers[1].handle(record('second'))
+
+    snapshot = registry.snapshot()
+    assert sorted(snapshot) == ['sh', 'sh-2', 'sh-3']
+    assert [h.metrics.name for h in handlers] == ['sh', 'sh-2', 'sh-3']
+    assert snapshot['sh-2']['counters']['records_emitted_total'] == {'INFO': 1}
+    assert 'records_emitted_total' not in snapshot['sh']['counters']
+
+
+def test_metrics_queue() -> None:
+    """Test the queue metrics recorded by the middleware."""
+    handler = CountingHandler()
+    handler.set_name('metrics-queue-handler')
+    middleware = LoggerMiddleware(
+        [handler], name='SERVER-METRICS-QUEUE', level='INFO', use_queue=True, metrics=True
+    )
+    middleware.log.info('queued')
+    middleware.shutdown()
+
+    snapshot = middleware.metrics.snapshot()
+    assert snapshot['gauges']['queue_depth'] == 0
+    assert snapshot['counters']['queue_dropped_total'] == 0
+    assert snapshot['counters']['records_logged_total'] == {'INFO': 1}
+    assert handler.metrics.snapshot()['counters']['records_emitted_total'] == {'INFO': 1}
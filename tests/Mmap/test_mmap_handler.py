@@ -0,0 +1,199 @@
+"""Test the memory mapped segment handler."""
+# standard library
+import logging
+import os
+import re
+import signal
+import subprocess  # nosec
+import sys
+import time
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_logger.segments import (
+    MmapSegmentHandler,
+    read_mmap_segment,
+    segment_filename,
+    segment_indexes,
+)
+from falcon_provider_logger.utils import mmap_handler
+
+# a script that logs records until it is killed
+CRASH_SCRIPT = '''
+import logging, sys
+from falcon_provider_logger.utils import mmap_handler
+
+lh = mmap_handler(
+    directory=sys.argv[1], filename='crash.log', formatter='%(message)s',
+    segment_size=65_536, segment_count=1_000, sync_interval=0,
+)
+logger = logging.getLogger('crash')
+logger.setLevel(logging.INFO)
+logger.addHandler(lh)
+i = 0
+while True:
+    logger.info('record %s %s', i, 'x' * (i % 300))
+    i += 1
+'''
+
+
+def record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    """Return a log record for the message.
+
+    Args:
+        msg: The record message.
+        level: The record level.
+    """
+    return logging.makeLogRecord(
+        {'msg': msg, 'levelno': level, 'levelname': logging.getLevelName(level)}
+    )
+
+
+def read_all(filename: str) -> list[str]:
+    """Return the records from all segment files.
+
+    Args:
+        filename: The base name of the segment files.
+    """
+    data = b''.join(
+        read_mmap_segment(segment_filename(filename, i)) for i in segment_indexes(filename)
+    )
+    return data.decode().splitlines()
+
+
+def test_mmap_write_and_rotate(tmp_path: object) -> None:
+    """Test that records are written across segments and old segments are removed.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    lh = mmap_handler(
+        directory=str(tmp_path),
+        filename='mmap.log',
+        formatter='%(message)s',
+        segment_size=4_096,
+        segment_count=3,
+        sync_interval=0,
+    )
+    for i in range(200):
+        lh.handle(record(f'record {i:04d} ' + 'x' * 50))
+
+    # the current segment is preallocated
+    filename = str(tmp_path / 'mmap.log')
+    assert os.path.getsize(segment_filename(filename, lh.index)) == 4_096
+    lh.close()
+
+    assert len(segment_indexes(filename)) == 3
+    lines = read_all(filename)
+    assert lines[-1] == 'record 0199 ' + 'x' * 50
+    assert lines == [f'record {i:04d} ' + 'x' * 50 for i in range(200 - len(lines), 200)]
+    # the closed segment is truncated to the written size
+    assert os.path.getsize(segment_filename(filename, lh.index)) < 4_096
+
+
+def test_mmap_nul_and_restart(tmp_path: object) -> None:
+    """Test that NUL bytes are escaped and a new handler continues at the next segment.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    filename = str(tmp_path / 'restart.log')
+    lh = MmapSegmentHandler(filename, segment_size=4_096, sync_interval=0)
+    lh.setFormatter(logging.Formatter('%(message)s'))
+    lh.handle(record('nul \0 byte'))
+    lh.close()
+
+    lh = MmapSegmentHandler(filename, segment_size=4_096, sync_interval=0)
+    lh.setFormatter(logging.Formatter('%(message)s'))
+    lh.handle(record('restarted', logging.ERROR))
+    assert lh.index == 2
+    lh.close()
+
+    assert read_all(filename) == ['nul \\x00 byte', 'restarted']
+
+
+def test_mmap_partial_record(tmp_path: object) -> None:
+    """Test that a record interrupted before the first byte is copied is not visible.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    lh = MmapSegmentHandler(str(tmp_path / 'partial.log'), segment_size=4_096, sync_interval=0)
+    lh.setFormatter(logging.Formatter('%(message)s'))
+    lh.handle(record('whole'))
+
+    # the body of the next record is copied, but not the first byte
+    data = b'partial record\n'
+    lh.mmap[lh.offset + 1 : lh.offset + len(data)] = data[1:]
+    lh.mmap.flush()
+
+    assert read_mmap_segment(segment_filename(lh.baseFilename, lh.index)) == b'whole\n'
+    lh.close()
+
+
+def test_mmap_invalid_segment_size(tmp_path: object) -> None:
+    """Test an invalid segment size.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    with pytest.raises(RuntimeError):
+        MmapSegmentHandler(str(tmp_path / 'invalid.log'), segment_size=100)
+
+
+def test_mmap_multiple_writers(tmp_path: object) -> None:
+    """Test that a writer never removes the active segment of another writer.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    filename = str(tmp_path / 'shared.log')
+    handlers = [
+        MmapSegmentHandler(filename, segment_size=4_096, segment_count=2, sync_interval=0)
+        for _ in range(3)
+    ]
+    for lh in handlers:
+        lh.setFormatter(logging.Formatter('%(message)s'))
+    # the third writer rolls over several times while the first two are idle
+    for i in range(500):
+        handlers[2].handle(record(f'third {i:04d}'))
+    assert handlers[2].index > handlers[0].index + 2
+
+    for lh in handlers[:2]:
+        assert os.path.isfile(segment_filename(filename, lh.index))
+        lh.handle(record(f'writer {lh.index}'))
+    for lh in handlers:
+        lh.close()
+
+    lines = read_all(filename)
+    assert f'writer {handlers[0].index}' in lines
+    assert f'writer {handlers[1].index}' in lines
+    # the inactive segments beyond the segment count are removed
+    assert len(segment_indexes(filename)) <= 4
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGKILL'), reason='requires SIGKILL')
+def test_mmap_crash(tmp_path: object) -> None:
+    """Test that readers only see whole records after the writer is killed.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    filename = str(tmp_path / 'crash.log')
+    pattern = re.compile(r'record (\d+) x*')
+    for delay in [0.3, 0.45, 0.6]:
+        proc = subprocess.Popen(  # nosec
+            [sys.executable, '-c', CRASH_SCRIPT, str(tmp_path)], cwd=os.getcwd()
+        )
+        time.sleep(delay)
+        proc.send_signal(signal.SIGKILL)
+        proc.wait()
+
+        lines = read_all(filename)
+        assert lines
+        for line in lines:
+            match = pattern.fullmatch(line)
+            assert match is not None, line
+            assert len(line) == len(f'record {match.group(1)} ') + int(match.group(1)) % 300
@@ -0,0 +1,29 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.utils import rotating_handler
+
+
+class LoggerQueueLoggerResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        self.log.debug(f'DEBUG {key}')
+        self.log.info(f'INFO {key}')
+        self.log.warning(f'WARNING {key}')
+        self.log.error(f'ERROR {key}')
+        self.log.critical(f'CRITICAL {key}')
+        resp.text = f'Logged - {key}'
+
+
+rh: object = rotating_handler(filename='queue.log', level='debug', name='queue-rfh')
+queue_middleware = LoggerMiddleware([rh], name='SERVER-QUEUE', use_queue=True)
+app_queue_logger = falcon.App(middleware=[queue_middleware])
+app_queue_logger.add_route('/middleware', LoggerQueueLoggerResource())
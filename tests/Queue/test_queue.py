@@ -0,0 +1,158 @@
+"""Test logger middleware."""
+# standard library
+import logging
+import os
+import queue
+from uuid import uuid4
+
+# third-party
+import pytest
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_logger.middleware import LoggerMiddleware
+from falcon_provider_logger.utils import QueueHandlerCustom
+
+
+def has_text(logfile: str, text: str) -> bool:
+    """Search for unique text in log file.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        bool: True if text is found, else False.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        for line in fh.read().strip().split('\n'):
+            if text in line:
+                break
+        else:
+            return False
+    return True
+
+
+def make_record(msg: str) -> logging.LogRecord:
+    """Return a simple log record.
+
+    Args:
+        msg: The log message.
+
+    Returns:
+        LogRecord: The log record.
+    """
+    return logging.makeLogRecord({'name': 'queue-test', 'levelno': logging.INFO, 'msg': msg})
+
+
+def test_queue_get(client_queue: object, log_directory: str, middleware_queue: object) -> None:
+    """Testing GET resource
+
+    Args:
+        client_queue (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+        middleware_queue (fixture): The queue enabled middleware instance.
+    """
+    logfile: str = os.path.join(log_directory, 'queue.log')
+    key = f'{uuid4()}'
+    params = {'key': key}
+    response: Result = client_queue.simulate_get('/middleware', params=params)
+
+    assert response.status_code == 200
+    assert response.text == f'Logged - {key}'
+
+    # wait for the listener thread to write all queued records
+    middleware_queue.queue_handler.queue.join()
+    for level in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
+        text = f'SERVER-QUEUE - {level} - {level} {key}'
+        assert has_text(logfile, text) is True, f'Failed to find text {text}'
+
+
+@pytest.mark.parametrize(
+    'overflow,expected',
+    [
+        ('count-and-drop', ['0', '1']),
+        ('drop-newest', ['0', '1']),
+        ('drop-oldest', ['2', '3']),
+    ],
+)
+def test_queue_overflow(overflow: str, expected: list) -> None:
+    """Test the overflow policies of the queue handler.
+
+    Args:
+        overflow: The overflow policy.
+        expected: The messages expected in the queue.
+    """
+    qh = QueueHandlerCustom(queue.Queue(maxsize=2), overflow=overflow)
+    for i in range(4):
+        qh.handle(make_record(str(i)))
+
+    assert qh.dropped == 2
+    assert [qh.queue.get_nowait().msg for _ in range(2)] == expected
+
+
+def test_queue_overflow_count_summary() -> None:
+    """Test that count-and-drop enqueues a summary once space is available."""
+    qh = QueueHandlerCustom(queue.Queue(maxsize=2), overflow='count-and-drop')
+    for i in range(3):
+        qh.handle(make_record(str(i)))
+    qh.queue.get_nowait()
+    qh.queue.get_nowait()
+    qh.handle(make_record('3'))
+
+    summary: logging.LogRecord = qh.queue.get_nowait()
+    assert summary.levelno == logging.WARNING
+    assert 'dropped 1 record(s)' in summary.msg
+    assert qh.queue.get_nowait().msg == '3'
+
+
+def test_queue_invalid_overflow() -> None:
+    """Test an invalid overflow policy."""
+    with pytest.raises(RuntimeError):
+        QueueHandlerCustom(queue.Queue(), overflow='invalid')
+
+
+def test_queue_shutdown_flush(log_directory: str) -> None:
+    """Test that shutdown flushes all queued records to the handlers.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'queue-shutdown.log')
+    os.makedirs(log_directory, exist_ok=True)
+    fh = logging.FileHandler(logfile)
+    fh.setFormatter(logging.Formatter('%(message)s'))
+    middleware = LoggerMiddleware([fh], name='SERVER-QUEUE-SHUTDOWN', use_queue=True, queue_size=5)
+    for i in range(100):
+        middleware.log.info(f'record {i}')
+    middleware.shutdown()
+    middleware.shutdown()  # a second call is a noop
+    fh.close()
+
+    with open(logfile, encoding='utf-8') as f:
+        assert f.read().split() == [t for i in range(100) for t in ('record', str(i))]
+
+
+def test_queue_log_after_shutdown(log_directory: str) -> None:
+    """Test that records logged after shutdown are written and never block on the queue.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'queue-after-shutdown.log')
+    os.makedirs(log_directory, exist_ok=True)
+    fh = logging.FileHandler(logfile)
+    fh.setFormatter(logging.Formatter('%(message)s'))
+    middleware = LoggerMiddleware(
+        [fh], name='SERVER-QUEUE-AFTER-SHUTDOWN', use_queue=True, queue_size=5
+    )
+    middleware.log.info('before')
+    middleware.shutdown()
+    # more records than the queue size, which blocked forever with the default overflow
+    for i in range(20):
+        middleware.log.info(f'after {i}')
+    fh.close()
+
+    assert middleware.log.handlers == [fh]
+    with open(logfile, encoding='utf-8') as f:
+        assert f.read().split() == ['before'] + [t for i in range(20) for t in ('after', str(i))]
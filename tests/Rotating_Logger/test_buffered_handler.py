@@ -0,0 +1,134 @@
+"""Test buffered rotating file handler."""
+# standard library
+import logging
+import os
+import time
+from collections.abc import Callable
+
+# first-party
+from falcon_provider_logger.utils import rotating_handler
+
+
+def read_lines(logfile: str) -> list[str]:
+    """Return the lines of the logfile.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+
+    Returns:
+        list: The lines in the logfile.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        return fh.read().splitlines()
+
+
+def test_buffered_record_threshold(log_directory: str, get_logger: Callable) -> None:
+    """Test that records are written once the record threshold is hit.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+        get_logger (fixture): Returns a logger with only the provided handler.
+    """
+    formatter = logging.Formatter('%(message)s')
+    rh = rotating_handler(
+        buffer_records=5,
+        filename='buffered-records.log',
+        flush_interval=0,
+        formatter=formatter,
+        level='DEBUG',
+    )
+    logger = get_logger('buffered-records', rh)
+    logfile: str = os.path.join(log_directory, 'buffered-records.log')
+
+    for i in range(4):
+        logger.info(f'record {i}')
+    assert read_lines(logfile) == []
+
+    logger.info('record 4')
+    assert read_lines(logfile) == [f'record {i}' for i in range(5)]
+    rh.close()
+
+
+def test_buffered_error_flush(log_directory: str, get_logger: Callable) -> None:
+    """Test that ERROR records flush the buffer immediately.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+        get_logger (fixture): Returns a logger with only the provided handler.
+    """
+    formatter = logging.Formatter('%(message)s')
+    rh = rotating_handler(
+        buffer_size=65_536,
+        filename='buffered-error.log',
+        flush_interval=0,
+        formatter=formatter,
+        level='DEBUG',
+    )
+    logger = get_logger('buffered-error', rh)
+    logfile: str = os.path.join(log_directory, 'buffered-error.log')
+
+    logger.info('info record')
+    assert read_lines(logfile) == []
+    logger.error('error record')
+    assert read_lines(logfile) == ['info record', 'error record']
+
+    logger.debug('close record')
+    rh.close()
+    assert read_lines(logfile)[-1] == 'close record'
+
+
+def test_buffered_flush_interval(log_directory: str, get_logger: Callable) -> None:
+    """Test that the flush thread writes records after the interval.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+        get_logger (fixture): Returns a logger with only the provided handler.
+    """
+    formatter = logging.Formatter('%(message)s')
+    rh = rotating_handler(
+        buffer_size=65_536,
+        filename='buffered-interval.log',
+        flush_interval=0.05,
+        formatter=formatter,
+        level='DEBUG',
+    )
+    logger = get_logger('buffered-interval', rh)
+    logfile: str = os.path.join(log_directory, 'buffered-interval.log')
+
+    logger.info('interval record')
+    time.sleep(0.25)
+    assert read_lines(logfile) == ['interval record']
+    rh.close()
+
+
+def test_buffered_rotation(log_directory: str, get_logger: Callable) -> None:
+    """Test that buffered records rotate at max_bytes.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+        get_logger (fixture): Returns a logger with only the provided handler.
+    """
+    formatter = logging.Formatter('%(message)s')
+    rh = rotating_handler(
+        backup_count=5,
+        buffer_records=100,
+        filename='buffered-rotate.log',
+        flush_interval=0,
+        formatter=formatter,
+        level='DEBUG',
+        max_bytes=100,
+        mode='w',
+    )
+    logger = get_logger('buffered-rotate', rh)
+    logfile: str = os.path.join(log_directory, 'buffered-rotate.log')
+
+    # each record is 10 bytes, so 9 records fit in each file
+    for i in range(20):
+        logger.info(f'record {i:03}')
+    rh.close()
+
+    assert len(read_lines(f'{logfile}.2')) == 9
+    assert len(read_lines(f'{logfile}.1')) == 9
+    assert read_lines(logfile) == ['record 018', 'record 019']
+    for f in [logfile, f'{logfile}.1', f'{logfile}.2']:
+        assert os.stat(f).st_size < 100
@@ -0,0 +1,50 @@
+"""Test rotating file handler backup compression."""
+# standard library
+import gzip
+import logging
+import os
+from collections.abc import Callable
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_logger.utils import rotating_handler
+
+
+def test_compressed_backups(log_directory: str, get_logger: Callable) -> None:
+    """Test that rotated files are compressed and the backup chain is shifted.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+        get_logger (fixture): Returns a logger with only the provided handler.
+    """
+    rh = rotating_handler(
+        backup_count=2,
+        compress='gzip',
+        filename='compressed.log',
+        formatter=logging.Formatter('%(message)s'),
+        level='DEBUG',
+        max_bytes=100,
+        mode='w',
+    )
+    logger = get_logger('compressed', rh)
+    logfile: str = os.path.join(log_directory, 'compressed.log')
+
+    # each record is 10 bytes, so 9 records fit in each file (4 rotations)
+    for i in range(40):
+        logger.info(f'record {i:03}')
+    rh.close()
+
+    with gzip.open(f'{logfile}.1.gz', 'rt', encoding='utf-8') as fh:
+        assert fh.read().splitlines() == [f'record {i:03}' for i in range(27, 36)]
+    with gzip.open(f'{logfile}.2.gz', 'rt', encoding='utf-8') as fh:
+        assert fh.read().splitlines() == [f'record {i:03}' for i in range(18, 27)]
+    assert not os.path.isfile(f'{logfile}.3.gz')
+    assert not [f for f in os.listdir(log_directory) if f.endswith(('.pending', '.tmp'))]
+
+
+def test_compressed_invalid_method() -> None:
+    """Test an invalid compression method."""
+    with pytest.raises(RuntimeError):
+        rotating_handler(compress='invalid', filename='compressed-invalid.log')
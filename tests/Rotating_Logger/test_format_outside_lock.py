@@ -0,0 +1,68 @@
+"""Test that the handlers format records outside of the handler lock."""
+# standard library
+import logging
+import os
+import threading
+
+# first-party
+from falcon_provider_logger.utils import rotating_handler, syslog_handler
+
+
+class LockCheckFormatter(logging.Formatter):
+    """Formatter that records if the handler lock is held while formatting."""
+
+    def __init__(self):
+        """Initialize class properties."""
+        logging.Formatter.__init__(self, '%(message)s')
+        self.handler: logging.Handler | None = None
+        self.locked: list[bool] = []
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record."""
+        self.locked.append(self.handler.lock._is_owned())  # pylint: disable=protected-access
+        return logging.Formatter.format(self, record)
+
+
+def test_rotating_format_outside_lock(log_directory: str) -> None:
+    """Test that the rotating handler formats outside the lock and writes complete lines.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    formatter = LockCheckFormatter()
+    lh = rotating_handler(filename='format_outside_lock.log', formatter=formatter, mode='w')
+    formatter.handler = lh
+    logger = logging.getLogger('format-outside-lock')
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(lh)
+
+    def worker(n: int) -> None:
+        for i in range(200):
+            logger.info('thread %s record %s', n, i)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    lh.close()
+
+    assert formatter.locked and not any(formatter.locked)
+    with open(os.path.join(log_directory, 'format_outside_lock.log'), encoding='utf-8') as fh:
+        lines = fh.read().splitlines()
+    assert sorted(lines) == sorted(f'thread {n} record {i}' for n in range(8) for i in range(200))
+
+
+def test_syslog_udp_format_outside_lock() -> None:
+    """Test that the syslog handler formats outside the lock."""
+    formatter = LockCheckFormatter()
+    lh = syslog_handler(formatter=formatter, port=5140)
+    formatter.handler = lh
+
+    record = logging.makeLogRecord({'msg': 'udp', 'levelno': logging.INFO, 'levelname': 'INFO'})
+    lh.handle(record)
+    lh.close()
+
+    assert formatter.locked == [False]
+    assert lh.encode_record(record) == b'<14>udp\x00'
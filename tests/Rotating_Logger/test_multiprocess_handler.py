@@ -0,0 +1,87 @@
+"""Test multiprocess rotating file handler."""
+# standard library
+import glob
+import os
+import subprocess  # nosec
+import sys
+
+# third-party
+import pytest
+
+# the script run by each worker process
+WORKER_SCRIPT = """
+import logging
+import sys
+
+from falcon_provider_logger.utils import rotating_handler
+
+directory, worker, count = sys.argv[1], sys.argv[2], int(sys.argv[3])
+rh = rotating_handler(
+    backup_count=1_000,
+    buffer_records=int(sys.argv[4]),
+    directory=directory,
+    filename='multiprocess.log',
+    flush_interval=0,
+    formatter=logging.Formatter('%(message)s'),
+    max_bytes=4_096,
+    multiprocess=True,
+)
+logger = logging.getLogger(f'multiprocess-{worker}')
+logger.setLevel(logging.INFO)
+logger.addHandler(rh)
+for i in range(count):
+    logger.info(f'worker={worker} record={i:06} ' + 'x' * (i % 50) + ' end')
+rh.close()
+"""
+
+
+@pytest.mark.parametrize('buffer_records', [0, 25])
+def test_multiprocess_stress(buffer_records: int, log_directory: str, tmp_path: object) -> None:
+    """Test that no lines are lost or torn when many processes write and rotate one file.
+
+    Args:
+        buffer_records: The number of records to buffer per write.
+        log_directory (fixture): The fully qualified path for the log directory.
+        tmp_path (fixture): A unique temporary directory.
+    """
+    os.makedirs(log_directory, exist_ok=True)
+    directory = str(tmp_path)
+    workers, count = 8, 1_000
+
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    processes = [
+        subprocess.Popen(  # nosec
+            [
+                sys.executable,
+                '-c',
+                WORKER_SCRIPT,
+                directory,
+                str(w),
+                str(count),
+                str(buffer_records),
+            ],
+            env=env,
+        )
+        for w in range(workers)
+    ]
+    for p in processes:
+        assert p.wait(timeout=120) == 0
+
+    logfiles = glob.glob(os.path.join(directory, 'multiprocess.log*'))
+    lines: list[str] = []
+    for logfile in logfiles:
+        if logfile.endswith('.lock'):
+            continue
+        assert os.stat(logfile).st_size <= 4_096
+        with open(logfile, encoding='utf-8') as fh:
+            lines.extend(fh.read().splitlines())
+
+    # every line is whole and every record was written exactly once
+    expected = {(str(w), f'{i:06}') for w in range(workers) for i in range(count)}
+    found = []
+    for line in lines:
+        worker, record, padding, end = line.split(' ')
+        assert end == 'end' and set(padding) <= {'x'}, f'torn line: {line}'
+        found.append((worker.split('=')[1], record.split('=')[1]))
+    assert len(found) == len(expected)
+    assert set(found) == expected
@@ -0,0 +1,120 @@
+"""Test rotating file handler size tracking."""
+# standard library
+import logging
+import os
+from collections.abc import Callable
+
+# first-party
+from falcon_provider_logger.utils import rotating_handler
+
+
+class CountingFormatter(logging.Formatter):
+    """Formatter that counts the number of format calls."""
+
+    count = 0
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Count and format the record."""
+        self.count += 1
+        return super().format(record)
+
+
+def read_lines(logfile: str) -> list[str]:
+    """Return the lines of the logfile.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+
+    Returns:
+        list: The lines in the logfile.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        return fh.read().splitlines()
+
+
+def test_size_format_once(log_directory: str, get_logger: Callable) -> None:
+    """Test that each record is formatted once and rotates at max_bytes.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+        get_logger (fixture): Returns a logger with only the provided handler.
+    """
+    formatter = CountingFormatter('%(message)s')
+    rh = rotating_handler(
+        backup_count=2,
+        filename='size-format.log',
+        formatter=formatter,
+        level='DEBUG',
+        max_bytes=100,
+        mode='w',
+    )
+    logger = get_logger('size-format', rh)
+    logfile: str = os.path.join(log_directory, 'size-format.log')
+
+    # each record is 10 bytes, so 9 records fit in each file
+    for i in range(12):
+        logger.info(f'record {i:03}')
+    rh.close()
+
+    assert formatter.count == 12
+    assert len(read_lines(f'{logfile}.1')) == 9
+    assert read_lines(logfile) == ['record 009', 'record 010', 'record 011']
+
+
+def test_size_external_truncate(log_directory: str, get_logger: Callable) -> None:
+    """Test that the size counter is corrected when the file is truncated externally.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+        get_logger (fixture): Returns a logger with only the provided handler.
+    """
+    formatter = logging.Formatter('%(message)s')
+    rh = rotating_handler(
+        backup_count=2,
+        filename='size-truncate.log',
+        formatter=formatter,
+        level='DEBUG',
+        max_bytes=100,
+        mode='w',
+        stat_interval=0,
+    )
+    logger = get_logger('size-truncate', rh)
+    logfile: str = os.path.join(log_directory, 'size-truncate.log')
+
+    for i in range(8):
+        logger.info(f'record {i:03}')
+    os.truncate(logfile, 0)
+    for i in range(8, 16):
+        logger.info(f'record {i:03}')
+    rh.close()
+
+    assert not os.path.isfile(f'{logfile}.1')
+    assert len(read_lines(logfile)) == 8
+
+
+def test_size_external_rotate(log_directory: str, get_logger: Callable) -> None:
+    """Test that the log file is reopened when it is rotated externally.
+
+    Args:
+        log_directory (fixture): The fully qualified path for the log directory.
+        get_logger (fixture): Returns a logger with only the provided handler.
+    """
+    formatter = logging.Formatter('%(message)s')
+    rh = rotating_handler(
+        filename='size-rotate.log',
+        formatter=formatter,
+        level='DEBUG',
+        max_bytes=1_000,
+        mode='w',
+        stat_interval=0,
+    )
+    logger = get_logger('size-rotate', rh)
+    logfile: str = os.path.join(log_directory, 'size-rotate.log')
+
+    logger.info('before rotate')
+    os.rename(logfile, f'{logfile}.external')
+    logger.info('after rotate')
+    rh.close()
+
+    assert read_lines(f'{logfile}.external') == ['before rotate']
+    assert read_lines(logfile) == ['after rotate']
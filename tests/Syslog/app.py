@@ -68,3 +68,34 @@ class LoggerSyslogUdpResource:
 sh: object = syslog_handler(level='debug', host='0.0.0.0', name='udp', port=5140)
 app_sh_udp_logger = falcon.App(middleware=[LoggerMiddleware([sh], name='SERVER-UDP')])
 app_sh_udp_logger.add_route('/middleware', LoggerSyslogUdpResource())
+
+
+class LoggerSyslogTcpPersistentResource:
+    """Logger middleware testing resource."""
+
+    log = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        self.log.debug(f'DEBUG {key}')
+        self.log.info(f'INFO {key}')
+        self.log.warning(f'WARNING {key}')
+        self.log.error(f'ERROR {key}')
+        self.log.critical(f'CRITICAL {key}')
+        resp.text = f'Logged - {key}'
+
+
+sh: object = syslog_handler(
+    framing='null',
+    level='debug',
+    host='0.0.0.0',
+    name='tcp-persistent',
+    persistent=True,
+    port=5141,
+    socktype='TCP',
+)
+app_sh_tcp_persistent_logger = falcon.App(
+    middleware=[LoggerMiddleware([sh], name='SERVER-TCP-PERSISTENT')]
+)
+app_sh_tcp_persistent_logger.add_route('/middleware', LoggerSyslogTcpPersistentResource())
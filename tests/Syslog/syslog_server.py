@@ -53,7 +53,11 @@ class TestSyslogServers:
 
             def handle(self):
                 while True:
-                    data = self.request.recv(1024).strip()
+                    data = self.request.recv(1024)
+                    if not data:
+                        # connection closed by client
+                        break
+                    data = data.strip()
                     for d in data.split(b'\0'):
                         if not d:
                             continue
@@ -61,7 +65,9 @@ class TestSyslogServers:
 
         try:
             self.logger.info(f'starting TCP server - server: {self.address}, port: {port}')
-            tcp_server = socketserver.TCPServer((self.address, port), TCPHandler)
+            # threaded server so multiple persistent client connections can be handled
+            tcp_server = socketserver.ThreadingTCPServer((self.address, port), TCPHandler)
+            tcp_server.daemon_threads = True
         except Exception:
             print('Failed to start tcp syslog servers.')
             raise
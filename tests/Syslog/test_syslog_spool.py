@@ -0,0 +1,294 @@
+"""Test the disk spool of the persistent TCP syslog handler."""
+# standard library
+import logging
+import os
+import socket
+import struct
+import threading
+import time
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_logger.segments import segment_filename
+from falcon_provider_logger.spool import DiskSpool
+from falcon_provider_logger.syslog_handlers import SysLogHandlerTcp
+from falcon_provider_logger.utils import syslog_handler
+
+
+def free_port() -> int:
+    """Return a local TCP port that isn't listening."""
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def get_handler(port: int, spool_directory: str, **kwargs) -> SysLogHandlerTcp:
+    """Return a persistent TCP syslog handler with a spool.
+
+    Args:
+        port: The syslog server port.
+        spool_directory: The spool directory.
+        kwargs: Additional handler kwargs.
+    """
+    sh = SysLogHandlerTcp(
+        address=('127.0.0.1', port),
+        backoff_max=0.1,
+        framing='non-transparent',
+        spool_directory=spool_directory,
+        **kwargs,
+    )
+    sh.setFormatter(logging.Formatter('%(message)s'))
+    return sh
+
+
+def log(sh: SysLogHandlerTcp, start: int, count: int) -> None:
+    """Log numbered records to the handler.
+
+    Args:
+        sh: The syslog handler.
+        start: The first record number.
+        count: The number of records.
+    """
+    for i in range(start, start + count):
+        sh.handle(logging.makeLogRecord({'msg': f'record {i}', 'levelname': 'INFO'}))
+
+
+def receive(port: int, count: int) -> list[bytes]:
+    """Return the messages received by a syslog server started on the port.
+
+    Args:
+        port: The syslog server port.
+        count: The number of messages to receive.
+    """
+    with socket.create_server(('127.0.0.1', port)) as server:
+        server.settimeout(5)
+        conn, _ = server.accept()
+        with conn:
+            conn.settimeout(5)
+            data = b''
+            while data.count(b'\n') < count:
+                data += conn.recv(65536)
+    return data.splitlines()
+
+
+def wait_for(condition: callable, timeout: float | None = 5.0) -> None:
+    """Wait for the condition to be true.
+
+    Args:
+        condition: A callable that returns True when the condition is met.
+        timeout: The max number of seconds to wait.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_spool_outage(tmp_path: str) -> None:
+    """Test that the records are spooled during an outage and replayed in order.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+    """
+    port = free_port()
+    sh = get_handler(port, str(tmp_path), max_buffer=10)
+    for start in range(0, 100, 10):
+        log(sh, start, 10)
+        wait_for(lambda s=start: sh.spooled == s + 10)
+    # the in-memory buffer holds 10 records, without the spool 90 records would be dropped
+    assert sh.spooled == 100
+    assert sh.dropped == 0
+
+    messages = receive(port, 100)
+    wait_for(lambda: sh.spool.empty)
+    sh.close()
+
+    assert messages == [f'<14>record {i}'.encode() for i in range(100)]
+    assert sh.replayed == 100
+    assert sh.spool.empty is True
+    # the replayed segments are deleted
+    assert len([f for f in os.listdir(tmp_path) if f[-1].isdigit()]) <= 1
+
+
+def test_spool_restart(tmp_path: str) -> None:
+    """Test that the records spooled by a closed handler are replayed by a new handler.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+    """
+    port = free_port()
+    sh = get_handler(port, str(tmp_path))
+    log(sh, 0, 5)
+    sh.close()
+    assert sh.spooled == 5
+
+    sh = get_handler(port, str(tmp_path))
+    log(sh, 5, 5)
+    messages = receive(port, 10)
+    sh.close()
+    assert messages == [f'<14>record {i}'.encode() for i in range(10)]
+
+
+def test_spool_replay_rate(tmp_path: str) -> None:
+    """Test that the spool is replayed at the replay rate.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+    """
+    port = free_port()
+    sh = get_handler(port, str(tmp_path), batch_size=10, spool_replay_rate=100)
+    log(sh, 0, 40)
+    wait_for(lambda: sh.spooled == 40)
+
+    start = time.monotonic()
+    messages = receive(port, 40)
+    elapsed = time.monotonic() - start
+    sh.close()
+    assert len(messages) == 40
+    # 4 batches of 10 records at 100 records/sec (the server starts after the backoff)
+    assert elapsed >= 0.3
+
+
+def test_spool_replay_live_traffic(tmp_path: str) -> None:
+    """Test that the spool drains while new records are logged faster than the replay rate.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+    """
+    port = free_port()
+    sh = get_handler(port, str(tmp_path), batch_size=10, spool_replay_rate=100)
+    log(sh, 0, 40)
+    wait_for(lambda: sh.spooled == 40)
+
+    data = []
+
+    def serve(server: socket.socket) -> None:
+        conn, _ = server.accept()
+        with conn:
+            while chunk := conn.recv(65536):
+                data.append(chunk)
+
+    with socket.create_server(('127.0.0.1', port)) as server:
+        server.settimeout(5)
+        thread = threading.Thread(target=serve, args=(server,))
+        thread.start()
+        # the replay starts once the handler reconnects
+        wait_for(lambda: sh.replayed > 0)
+        # ~1,000 records/sec until the backlog (40 records at 100 records/sec) is replayed
+        count = 40
+        deadline = time.monotonic() + 5
+        while not sh.spool.empty and time.monotonic() < deadline:
+            log(sh, count, 1)
+            count += 1
+            time.sleep(0.001)
+        assert sh.spool.empty is True
+        sh.close()
+        thread.join(5)
+
+    messages = b''.join(data).splitlines()
+    # the new records are sent as they are logged instead of being spooled behind the backlog
+    assert sh.spooled == 40
+    assert sh.replayed == 40
+    assert sorted(messages, key=lambda m: int(m.split()[-1])) == [
+        f'<14>record {i}'.encode() for i in range(count)
+    ]
+    # each stream is sent in order
+    spooled = [m for m in messages if int(m.split()[-1]) < 40]
+    assert spooled == [f'<14>record {i}'.encode() for i in range(40)]
+
+
+def test_spool_max_bytes(tmp_path: str) -> None:
+    """Test that the oldest records are dropped when the spool is full.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+    """
+    spool = DiskSpool(str(tmp_path), max_bytes=1_000, segment_size=250)
+    for i in range(100):
+        spool.append([f'record {i:03d}\n'.encode()])
+    assert spool.size <= 1_000
+    assert spool.dropped > 0
+
+    frames = spool.read(1_000)
+    assert len(frames) == 100 - spool.dropped
+    # the newest records are kept in order
+    assert frames[-1] == b'record 099\n'
+    assert frames == sorted(frames)
+    spool.close()
+
+
+def test_spool_at_least_once(tmp_path: str) -> None:
+    """Test that records read but not committed are read again after a restart.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+    """
+    spool = DiskSpool(str(tmp_path))
+    spool.append([b'a', b'b', b'c'])
+    assert spool.read(2) == [b'a', b'b']
+    spool.commit()
+    assert spool.read(2) == [b'c']
+    # the process exits before the batch is sent
+    spool.close()
+
+    spool = DiskSpool(str(tmp_path))
+    assert spool.empty is False
+    assert spool.read(10) == [b'c']
+    spool.commit()
+    assert spool.empty is True
+    spool.close()
+
+
+def test_spool_torn_record(tmp_path: str) -> None:
+    """Test that a record torn by a crash is skipped.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+    """
+    spool = DiskSpool(str(tmp_path))
+    spool.append([b'whole'])
+    spool.close()
+    # a partial record at the end of the segment
+    with open(segment_filename(spool.filename, 0), 'ab') as fh:
+        fh.write(struct.pack('>I', 100) + b'torn')
+
+    spool = DiskSpool(str(tmp_path))
+    spool.append([b'after'])
+    assert spool.read(10) == [b'whole', b'after']
+    spool.close()
+
+
+def test_spool_slots(tmp_path: str) -> None:
+    """Test that each spool owns a separate slot.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+    """
+    first = DiskSpool(str(tmp_path))
+    second = DiskSpool(str(tmp_path))
+    assert first.filename != second.filename
+    first.close()
+    second.close()
+
+
+def test_spool_invalid_segment_size(tmp_path: str) -> None:
+    """Test an invalid segment size.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+    """
+    with pytest.raises(RuntimeError):
+        DiskSpool(str(tmp_path), max_bytes=100, segment_size=1_000)
+
+
+@pytest.mark.parametrize('kwargs', [{'socktype': 'UDP'}, {'unix_socket': '/dev/log'}])
+def test_spool_invalid_socktype(tmp_path: str, kwargs: dict) -> None:
+    """Test that the spool is rejected for the UDP and unix socket handlers.
+
+    Args:
+        tmp_path: The pytest temporary directory.
+        kwargs: The syslog handler kwargs.
+    """
+    with pytest.raises(RuntimeError):
+        syslog_handler(spool_directory=str(tmp_path), **kwargs)
@@ -0,0 +1,178 @@
+"""Test persistent TCP syslog handler."""
+# standard library
+import logging
+import os
+import socket
+import time
+from uuid import uuid4
+
+# third-party
+import pytest
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_logger.syslog_handlers import SysLogHandlerTcp
+from falcon_provider_logger.utils import syslog_handler
+
+
+def has_text(logfile: str, text: str) -> bool:
+    """Search for unique text in log file.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        bool: True if text is found, else False.
+    """
+    time.sleep(0.10)  # allow time for log to flush
+    with open(logfile, encoding='utf-8') as fh:
+        for line in fh.read().strip().split('\n'):
+            if text in line:
+                break
+        else:
+            return False
+    return True
+
+
+def parse_octet_counted(data: bytes) -> list[bytes]:
+    """Return the messages from octet-counting framed data.
+
+    Args:
+        data: The received data.
+
+    Returns:
+        list: The syslog messages.
+    """
+    messages = []
+    while data:
+        length, data = data.split(b' ', 1)
+        messages.append(data[: int(length)])
+        data = data[int(length) :]
+    return messages
+
+
+def test_tcp_persistent_syslog_get(client_sh_tcp_persistent: object, log_directory: str) -> None:
+    """Testing GET resource
+
+    Args:
+        client_sh_tcp_persistent (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'syslog_server.log')
+    key = f'{uuid4()}'
+    params = {'key': key}
+    response: Result = client_sh_tcp_persistent.simulate_get('/middleware', params=params)
+
+    assert response.status_code == 200
+    assert response.text == f'Logged - {key}'
+    for level in ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']:
+        text = f'SERVER-TCP-PERSISTENT - {level} - {level} {key}'
+        assert has_text(logfile, text) is True, f'Failed to find text {text}'
+
+
+def test_tcp_persistent_outage() -> None:
+    """Test that records are buffered while the server is down and sent on reconnect."""
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+
+    sh = SysLogHandlerTcp(address=('127.0.0.1', port), backoff_max=0.1, max_buffer=3)
+    sh.setFormatter(logging.Formatter('%(message)s'))
+    for i in range(5):
+        sh.handle(logging.makeLogRecord({'msg': f'record {i}', 'levelname': 'INFO'}))
+    assert sh.dropped == 2
+
+    with socket.create_server(('127.0.0.1', port)) as server:
+        server.settimeout(5)
+        conn, _ = server.accept()
+        with conn:
+            conn.settimeout(5)
+            data = b''
+            while data.count(b'record') < 3:
+                data += conn.recv(1024)
+            sh.close()
+
+    assert parse_octet_counted(data) == [b'<14>record 2', b'<14>record 3', b'<14>record 4']
+    assert sh.reconnects == 1
+
+
+@pytest.mark.parametrize('spool', [False, True])
+def test_tcp_persistent_requeue_overflow(tmp_path: object, spool: bool) -> None:
+    """Test that the records pushed out by a requeued batch are spooled or counted as dropped.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+        spool: If True, the handler has a spool.
+    """
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+
+    sh = SysLogHandlerTcp(
+        address=('127.0.0.1', port),
+        backoff_max=0.1,
+        max_buffer=3,
+        spool_directory=str(tmp_path) if spool else None,
+    )
+    # stop the sender thread so the buffer is only changed by the test
+    sh._stop.set()  # pylint: disable=protected-access
+    sh._wakeup.set()  # pylint: disable=protected-access
+    sh._thread.join()  # pylint: disable=protected-access
+    for frame in [b'new 0', b'new 1', b'new 2']:
+        sh.write_encoded(frame)
+
+    sh._requeue([b'batch 0', b'batch 1'])  # pylint: disable=protected-access
+
+    assert list(sh._pending) == [b'batch 0', b'batch 1', b'new 0']  # pylint: disable=W0212
+    if spool:
+        assert (sh.dropped, sh.spooled) == (0, 2)
+        assert sh.spool.read(10) == [b'new 1', b'new 2']
+    else:
+        assert sh.dropped == 2
+    sh.close()
+
+
+def test_tcp_persistent_invalid_framing() -> None:
+    """Test an invalid framing method."""
+    with pytest.raises(RuntimeError):
+        SysLogHandlerTcp(address=('127.0.0.1', 5141), framing='invalid')
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'rfc5424': True},
+        {'app_name': 'app'},
+        {'hostname': 'host'},
+        {'rfc5424': True, 'persistent': False, 'spool_directory': 'spool'},
+    ],
+)
+def test_tcp_persistent_rfc5424(kwargs: dict) -> None:
+    """Test that RFC 5424 options are rejected for the persistent handler.
+
+    Args:
+        kwargs: The syslog handler kwargs.
+    """
+    kwargs = {'persistent': True, **kwargs}
+    with pytest.raises(RuntimeError):
+        syslog_handler(host='127.0.0.1', port=5141, socktype='TCP', **kwargs)
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'batch': True, 'socktype': 'TCP'},
+        {'persistent': True, 'socktype': 'UDP'},
+        {'batch': True, 'unix_socket': '/dev/log'},
+        {'persistent': True, 'unix_socket': '/dev/log'},
+    ],
+)
+def test_syslog_unsupported_options(kwargs: dict) -> None:
+    """Test that the batch and persistent options are rejected for the other socket types.
+
+    Args:
+        kwargs: The syslog handler kwargs.
+    """
+    with pytest.raises(RuntimeError):
+        syslog_handler(host='127.0.0.1', port=5141, **kwargs)
@@ -0,0 +1,113 @@
+"""Test batched UDP syslog handler."""
+# standard library
+import logging
+import re
+import socket
+
+# first-party
+from falcon_provider_logger.syslog_handlers import SysLogHandlerUdp, split_utf8
+from falcon_provider_logger.utils import syslog_handler
+
+
+def receive(sock: socket.socket) -> list[bytes]:
+    """Return the datagrams received by the socket.
+
+    Args:
+        sock: The bound UDP socket.
+    """
+    datagrams = []
+    sock.settimeout(0.5)
+    while True:
+        try:
+            datagrams.append(sock.recv(65_535))
+        except socket.timeout:
+            return datagrams
+
+
+def udp_receiver() -> socket.socket:
+    """Return a UDP socket bound to an ephemeral port."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(('127.0.0.1', 0))
+    return sock
+
+
+def test_udp_batch_mtu() -> None:
+    """Test that messages larger than the MTU are split into multiple datagrams."""
+    sock = udp_receiver()
+    lh = syslog_handler(
+        host='127.0.0.1', port=sock.getsockname()[1], formatter='%(message)s', batch=True, mtu=100
+    )
+    assert isinstance(lh, SysLogHandlerUdp)
+
+    message = 'é' * 150  # 300 bytes
+    lh.handle(logging.makeLogRecord({'msg': message, 'levelno': 20, 'levelname': 'INFO'}))
+    lh.handle(logging.makeLogRecord({'msg': 'short', 'levelno': 20, 'levelname': 'INFO'}))
+    lh.close()
+
+    datagrams = receive(sock)
+    sock.close()
+    assert all(len(d) <= 100 for d in datagrams)
+    assert all(d.startswith(b'<14>') and d.endswith(b'\0') for d in datagrams)
+    assert b''.join(d[4:-1] for d in datagrams[:-1]).decode() == message
+    assert datagrams[-1] == b'<14>short\0'
+
+
+def test_udp_batch_flush_level() -> None:
+    """Test that an error record wakes the sender thread."""
+    sock = udp_receiver()
+    lh = SysLogHandlerUdp(address=('127.0.0.1', sock.getsockname()[1]), flush_interval=60)
+    lh.setFormatter(logging.Formatter('%(message)s'))
+
+    lh.handle(logging.makeLogRecord({'msg': 'info', 'levelno': 20, 'levelname': 'INFO'}))
+    lh.handle(logging.makeLogRecord({'msg': 'error', 'levelno': 40, 'levelname': 'ERROR'}))
+
+    assert receive(sock) == [b'<14>info\0', b'<11>error\0']
+    lh.close()
+    sock.close()
+
+
+def test_udp_ident() -> None:
+    """Test that the cached header uses the current ident."""
+    sock = udp_receiver()
+    lh = SysLogHandlerUdp(address=('127.0.0.1', sock.getsockname()[1]))
+    lh.setFormatter(logging.Formatter('%(message)s'))
+
+    lh.handle(logging.makeLogRecord({'msg': 'no ident', 'levelno': 20, 'levelname': 'INFO'}))
+    lh.ident = 'app: '
+    lh.handle(logging.makeLogRecord({'msg': 'ident', 'levelno': 20, 'levelname': 'INFO'}))
+    lh.close()
+
+    assert receive(sock) == [b'<14>no ident\0', b'<14>app: ident\0']
+    sock.close()
+
+
+def test_udp_rfc5424() -> None:
+    """Test the RFC 5424 message format."""
+    sock = udp_receiver()
+    lh = syslog_handler(
+        host='127.0.0.1',
+        port=sock.getsockname()[1],
+        formatter='%(message)s',
+        rfc5424=True,
+        app_name='my app',
+        hostname='web-1',
+    )
+    lh.handle(logging.makeLogRecord({'msg': 'rfc5424', 'levelno': 30, 'levelname': 'WARNING'}))
+    lh.close()
+
+    datagrams = receive(sock)
+    sock.close()
+    assert len(datagrams) == 1
+    assert re.fullmatch(
+        rb'<12>1 \d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}Z web-1 myapp \d+ - - rfc5424',
+        datagrams[0],
+    )
+
+
+def test_split_utf8() -> None:
+    """Test that multi-byte characters are not split."""
+    data = 'aé€😀'.encode()
+    for size in range(4, 12):
+        chunks = split_utf8(data, size)
+        assert all(len(c) <= size for c in chunks)
+        assert ''.join(c.decode() for c in chunks) == 'aé€😀'
@@ -0,0 +1,123 @@
+"""Test unix socket syslog handler."""
+# standard library
+import logging
+import os
+import socket
+import time
+
+# first-party
+from falcon_provider_logger.syslog_handlers import SysLogHandlerUnix
+from falcon_provider_logger.utils import syslog_handler
+
+
+def record(msg: str) -> logging.LogRecord:
+    """Return a log record for the message.
+
+    Args:
+        msg: The record message.
+    """
+    return logging.makeLogRecord({'msg': msg, 'levelno': logging.INFO, 'levelname': 'INFO'})
+
+
+def unix_server(path: str, socktype: int = socket.SOCK_DGRAM) -> socket.socket:
+    """Return a unix socket bound to the path.
+
+    Args:
+        path: The unix socket path.
+        socktype: The socket type.
+    """
+    if os.path.exists(path):
+        os.unlink(path)
+    sock = socket.socket(socket.AF_UNIX, socktype)
+    sock.bind(path)
+    sock.settimeout(0.5)
+    return sock
+
+
+def test_unix_dgram_reconnect(tmp_path: object) -> None:
+    """Test that the handler reconnects when the syslog daemon is restarted.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    path = str(tmp_path / 'log.sock')
+    server = unix_server(path)
+    lh = syslog_handler(unix_socket=path, formatter='%(message)s')
+    assert isinstance(lh, SysLogHandlerUnix)
+
+    lh.handle(record('first'))
+    assert server.recv(1024) == b'<14>first\0'
+
+    # restart the daemon (a new socket at the same path)
+    server.close()
+    server = unix_server(path)
+    lh.handle(record('second'))
+    assert server.recv(1024) == b'<14>second\0'
+    assert lh.reconnects == 1
+
+    lh.close()
+    server.close()
+
+
+def test_unix_dgram_daemon_down(tmp_path: object) -> None:
+    """Test that records are dropped until the daemon is started.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    path = str(tmp_path / 'log.sock')
+    lh = SysLogHandlerUnix(address=path, socktype=socket.SOCK_DGRAM)
+    lh.setFormatter(logging.Formatter('%(message)s'))
+
+    lh.handle(record('dropped'))
+    assert lh.dropped == 1
+
+    server = unix_server(path)
+    time.sleep(0.2)  # the reconnect backoff
+    lh.handle(record('connected'))
+    assert server.recv(1024) == b'<14>connected\0'
+
+    lh.close()
+    server.close()
+
+
+def test_unix_dgram_buffer_full(tmp_path: object) -> None:
+    """Test that a full socket buffer drops records instead of blocking.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    path = str(tmp_path / 'log.sock')
+    server = unix_server(path)
+    lh = SysLogHandlerUnix(address=path)
+    lh.setFormatter(logging.Formatter('%(message)s'))
+
+    start = time.monotonic()
+    for i in range(5_000):
+        lh.handle(record(f'record {i} ' + 'x' * 200))
+    assert time.monotonic() - start < 5
+    assert lh.dropped > 0
+    assert server.recv(1024).startswith(b'<14>record 0 ')
+
+    lh.close()
+    server.close()
+
+
+def test_unix_stream(tmp_path: object) -> None:
+    """Test a unix stream socket.
+
+    Args:
+        tmp_path (fixture): A temporary directory.
+    """
+    path = str(tmp_path / 'log.sock')
+    server = unix_server(path, socket.SOCK_STREAM)
+    server.listen()
+    lh = syslog_handler(unix_socket=path, socktype='TCP', formatter='%(message)s')
+    conn, _ = server.accept()
+
+    lh.handle(record('stream'))
+    assert conn.recv(1024) == b'<14>stream\0'
+
+    lh.close()
+    conn.close()
+    server.close()
@@ -1,14 +1,23 @@
 """Testing conf module."""
 # standard library
+import logging
 import os
 import threading
+from collections.abc import Callable
 
 # third-party
 import pytest
 from falcon import testing
 
+from .Access.app import app_access_logger
+from .Config.app import app_config_logger_a, app_config_logger_b
+from .Context.app import app_context_logger
 from .Custom.app import app_custom_logger
+from .Flight_Recorder.app import app_flight_recorder_logger
+from .Levels.app import app_levels_logger
+from .Metrics.app import app_metrics_logger
 from .Null.app import app_null_logger
+from .Queue.app import app_queue_logger, queue_middleware
 from .Rotating_Logger.app import app_rh_logger
 from .Syslog.syslog_server import TestSyslogServers
 
@@ -19,18 +28,81 @@ tcp_server = test_syslog.start_tcp_server(port=5141)
 udp_server = test_syslog.start_udp_server(port=5140)
 
 
+@pytest.fixture
+def client_access() -> testing.TestClient:
+    """Create testing client fixture for logger app"""
+    return testing.TestClient(app_access_logger)
+
+
+@pytest.fixture
+def client_config_a() -> testing.TestClient:
+    """Create testing client fixture for logger app"""
+    return testing.TestClient(app_config_logger_a)
+
+
+@pytest.fixture
+def client_config_b() -> testing.TestClient:
+    """Create testing client fixture for logger app"""
+    return testing.TestClient(app_config_logger_b)
+
+
+@pytest.fixture
+def app_asgi() -> object:
+    """Return the ASGI logger app."""
+    # import here so tcp/udp servers can be started first in pytest_configure
+    from .Asgi.app import app_asgi_logger  # pylint: disable=import-outside-toplevel
+
+    return app_asgi_logger
+
+
+@pytest.fixture
+def client_context() -> testing.TestClient:
+    """Create testing client fixture for logger app"""
+    return testing.TestClient(app_context_logger)
+
+
 @pytest.fixture
 def client_custom() -> testing.TestClient:
     """Create testing client fixture for logger app"""
     return testing.TestClient(app_custom_logger)
 
 
+@pytest.fixture
+def client_metrics() -> testing.TestClient:
+    """Create testing client fixture for logger app"""
+    return testing.TestClient(app_metrics_logger)
+
+
 @pytest.fixture
 def client_null() -> testing.TestClient:
     """Create testing client fixture for logger app"""
     return testing.TestClient(app_null_logger)
 
 
+@pytest.fixture
+def client_flight_recorder() -> testing.TestClient:
+    """Create testing client fixture for logger app"""
+    return testing.TestClient(app_flight_recorder_logger)
+
+
+@pytest.fixture
+def client_levels() -> testing.TestClient:
+    """Create testing client fixture for logger app"""
+    return testing.TestClient(app_levels_logger)
+
+
+@pytest.fixture
+def client_queue() -> testing.TestClient:
+    """Create testing client fixture for logger app"""
+    return testing.TestClient(app_queue_logger)
+
+
+@pytest.fixture
+def middleware_queue() -> object:
+    """Return the queue enabled logger middleware instance."""
+    return queue_middleware
+
+
 @pytest.fixture
 def client_rh() -> testing.TestClient:
     """Create testing client fixture for logger app"""
@@ -46,6 +118,16 @@ def client_sh_tcp() -> testing.TestClient:
     return testing.TestClient(app_sh_tcp_logger)
 
 
+@pytest.fixture
+def client_sh_tcp_persistent() -> testing.TestClient:
+    """Create testing client fixture for logger app"""
+    # import here so tcp server can be started first in pytest_configure
+    # pylint: disable=import-outside-toplevel
+    from .Syslog.app import app_sh_tcp_persistent_logger
+
+    return testing.TestClient(app_sh_tcp_persistent_logger)
+
+
 @pytest.fixture
 def client_sh_udp() -> testing.TestClient:
     """Create testing client fixture for logger app"""
@@ -55,6 +137,30 @@ def client_sh_udp() -> testing.TestClient:
     return testing.TestClient(app_sh_udp_logger)
 
 
+@pytest.fixture
+def get_logger() -> Callable[[str, logging.Handler], logging.Logger]:
+    """Return a function that returns a logger with only the provided handler."""
+
+    def _get_logger(name: str, handler: logging.Handler) -> logging.Logger:
+        """Return a logger with only the provided handler.
+
+        Args:
+            name: The logger name.
+            handler: The logging handler.
+
+        Returns:
+            Logger: The logger instance.
+        """
+        logger = logging.getLogger(name)
+        logger.handlers.clear()
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        return logger
+
+    return _get_logger
+
+
 @pytest.fixture
 def log_directory() -> str:
     """Return the log directory."""